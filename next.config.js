@@ -35,6 +35,12 @@ const nextConfig = {
   eslint: {
     ignoreDuringBuilds: true,
   },
+  // Справочник БИК читается через fs по пути от process.cwd() — трассировка
+  // его не видит, без явного включения файла в функции его не будет
+  outputFileTracingIncludes: {
+    "/api/banks/**": ["./data/**/*"],
+    "/api/organizations/**": ["./data/**/*"],
+  },
 };
 
 module.exports = nextConfig;
@@ -0,0 +1,70 @@
+-- ============================================
+-- ИНДЕКСЫ ПОЛНОТЕКСТОВОГО ПОИСКА
+-- ============================================
+--
+-- Что делает этот скрипт:
+-- 1. Подключает расширение pg_trgm (триграммы)
+-- 2. Делает "Document"."searchVector" генерируемой колонкой (STORED):
+--    tsvector считается один раз при записи, а не при каждом поиске
+-- 3. Создает GIN-индекс по "searchVector" (русская морфология)
+-- 4. Создает триграммные GIN-индексы по наименованиям и ИНН организаций
+--
+-- Расширение и индексы объявлены и в prisma/schema.prisma, поэтому
+-- `prisma db push` их не удаляет. Генерируемое выражение колонки Prisma
+-- описать не умеет: после db push на чистой БД колонка создается обычной —
+-- скрипт пересоздает ее генерируемой.
+--
+-- Скрипт идемпотентный: его можно запускать повторно. Это шаг деплоя:
+-- ADD COLUMN ... STORED переписывает таблицу "Document" под ACCESS EXCLUSIVE,
+-- поэтому колонку создает только этот скрипт. Индексы (без колонки) также
+-- создает POST /api/admin/search/maintenance
+-- (см. src/lib/services/search.ts → SEARCH_INDEX_STATEMENTS); он же
+-- пересоздает индексы, оставшиеся невалидными после прерванного CONCURRENTLY.
+--
+-- ВАЖНО: CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции,
+-- поэтому скрипт НЕ обернут в BEGIN/COMMIT.
+-- ============================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Обычная (не генерируемая) колонка, созданная db push, удаляется
+DO $$
+BEGIN
+  IF EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = current_schema()
+      AND table_name = 'Document'
+      AND column_name = 'searchVector'
+      AND is_generated = 'NEVER'
+  ) THEN
+    ALTER TABLE "Document" DROP COLUMN "searchVector";
+  END IF;
+END $$;
+
+-- Вектор пересчитывается PostgreSQL только при INSERT/UPDATE строки
+ALTER TABLE "Document"
+ADD COLUMN IF NOT EXISTS "searchVector" tsvector
+GENERATED ALWAYS AS (to_tsvector('russian'::regconfig, coalesce("title", '') || ' ' || coalesce("bodyText", ''))) STORED;
+
+-- Прежний индекс по выражению больше не нужен
+DROP INDEX CONCURRENTLY IF EXISTS "Document_search_fts_idx";
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "Document_searchVector_idx"
+ON "Document"
+USING GIN ("searchVector");
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "Organization_name_full_trgm_idx"
+ON "Organization"
+USING GIN ("name_full" gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "Organization_name_short_trgm_idx"
+ON "Organization"
+USING GIN ("name_short" gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "Organization_inn_trgm_idx"
+ON "Organization"
+USING GIN ("inn" gin_trgm_ops);
+
+-- Обновляем статистику планировщика
+ANALYZE "Document";
+ANALYZE "Organization";
@@ -0,0 +1,54 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { getCurrentUser } from '@/lib/auth-utils';
+import { maintainSearchIndexes } from '@/lib/services/search';
+
+/**
+ * POST /api/admin/search/maintenance
+ * Пересоздать невалидные и создать недостающие индексы поиска, очистить pending list GIN
+ * и обновить статистику. Запускать после деплоя и периодически (cron) для больших аккаунтов
+ *
+ * Генерируемую колонку "searchVector" создает только prisma/sql/search_indexes.sql (шаг деплоя).
+ * Если она не готова или индекс остался невалидным — success: false и статус 500
+ */
+export async function POST(request: NextRequest) {
+  try {
+    const admin = await getCurrentUser(request);
+
+    if (!admin) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    if (admin.role !== 'admin') {
+      return NextResponse.json(
+        { error: 'Admin access required' },
+        { status: 403 }
+      );
+    }
+
+    const { healthy, ...result } = await maintainSearchIndexes();
+
+    if (!healthy) {
+      console.error('Search index maintenance incomplete:', {
+        searchVectorReady: result.searchVectorReady,
+        invalid: result.invalid,
+      });
+    }
+
+    return NextResponse.json(
+      {
+        success: healthy,
+        ...result,
+      },
+      { status: healthy ? 200 : 500 }
+    );
+  } catch (error) {
+    console.error('POST /api/admin/search/maintenance error:', error);
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    );
+  }
+}
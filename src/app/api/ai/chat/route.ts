@@ -58,8 +58,10 @@ export async function POST(request: NextRequest) {
     }
 
     // Вызов OpenAI API
+    // OPENAI_BASE_URL позволяет направить запросы на совместимый сервер (например, локальный стенд)
     const openai = new OpenAI({
-      apiKey: apiKey
+      apiKey: apiKey,
+      baseURL: process.env.OPENAI_BASE_URL || undefined,
     });
 
     const model = process.env.OPENAI_MODEL || 'gpt-4o-mini';
@@ -1,14 +1,66 @@
 import { NextRequest, NextResponse } from 'next/server';
+import crypto from 'crypto';
 import { getRefreshTokenFromRequest, verifyRefreshToken, createToken, createRefreshToken, setTokenCookie, setRefreshTokenCookie } from '@/lib/jwt';
-import { validateRefreshToken, revokeRefreshToken, createRefreshTokenRecord } from '@/lib/auth-utils';
+import type { RefreshTokenPayload } from '@/lib/jwt';
+import { rotateRefreshToken, getRefreshTokenRejectionReason, revokeRefreshToken, revokeRefreshTokenFamily } from '@/lib/auth-utils';
+import type { RefreshTokenRejectionReason } from '@/lib/auth-utils';
 import { generateCsrfToken, setCsrfTokenCookie } from '@/lib/csrf';
-import { logSecurityEventFromRequest } from '@/lib/security-log';
+import { logSecurityEventFromRequest, queueSecurityEventFromRequest } from '@/lib/security-log';
 
 export const runtime = 'nodejs';
 
+const REJECTION_MESSAGES: Record<RefreshTokenRejectionReason, string> = {
+  token_not_found: 'Refresh token not found or revoked',
+  token_expired: 'Refresh token not found or revoked',
+  token_already_rotated: 'Refresh token not found or revoked',
+  token_reused: 'Refresh token not found or revoked',
+  user_data_changed: 'User data changed, please login again',
+};
+
+/**
+ * Отказ в обновлении токена с учетом причины
+ * При повторном использовании токена отзывается все семейство ротации
+ */
+async function rejectRefresh(
+  request: NextRequest,
+  refreshTokenValue: string,
+  payload: RefreshTokenPayload,
+  reason: RefreshTokenRejectionReason
+) {
+  if (reason === 'token_reused' && payload.fam) {
+    await revokeRefreshTokenFamily(payload.fam);
+  } else if (reason === 'user_data_changed') {
+    // Отзываем токен, если данные пользователя изменились
+    await revokeRefreshToken(refreshTokenValue);
+  }
+
+  // БЕЗОПАСНОСТЬ: Логируем failed refresh attempt
+  // Повторное использование токена пишем сразу и дожидаемся записи — это событие нельзя потерять
+  const logEntry = {
+    userId: payload.userId,
+    email: payload.email,
+    metadata: { reason, familyId: payload.fam },
+  };
+  if (reason === 'token_reused') {
+    await logSecurityEventFromRequest(request, 'suspicious_activity', logEntry);
+  } else {
+    queueSecurityEventFromRequest(request, 'token_refresh_failed', logEntry);
+  }
+
+  return NextResponse.json(
+    { error: 'Unauthorized', message: REJECTION_MESSAGES[reason] },
+    { status: 401 }
+  );
+}
+
 /**
  * POST /api/auth/refresh
  * Обновление access токена с помощью refresh токена
+ *
+ * Быстрый путь: подпись refresh токена проверяется в памяти, а отзыв старого
+ * токена, проверка его действительности и сохранение нового выполняются одним
+ * SQL-запросом (rotateRefreshToken). Security события пишутся пакетно после ответа.
+ * Чтение из БД — только при отказе ротации, чтобы определить причину.
  */
 export async function POST(request: NextRequest) {
   try {
@@ -17,7 +69,7 @@ export async function POST(request: NextRequest) {
 
     if (!refreshTokenValue) {
       // БЕЗОПАСНОСТЬ: Логируем failed refresh attempt
-      await logSecurityEventFromRequest(request, 'token_refresh_failed', {
+      queueSecurityEventFromRequest(request, 'token_refresh_failed', {
         metadata: { reason: 'no_refresh_token' },
       });
       
@@ -31,7 +83,7 @@ export async function POST(request: NextRequest) {
     const payload = verifyRefreshToken(refreshTokenValue);
     if (!payload) {
       // БЕЗОПАСНОСТЬ: Логируем failed refresh attempt
-      await logSecurityEventFromRequest(request, 'token_refresh_failed', {
+      queueSecurityEventFromRequest(request, 'token_refresh_failed', {
         metadata: { reason: 'invalid_jwt_signature' },
       });
       
@@ -41,41 +93,23 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // Проверяем refresh токен в БД
-    const refreshTokenRecord = await validateRefreshToken(refreshTokenValue);
-    if (!refreshTokenRecord) {
-      // БЕЗОПАСНОСТЬ: Логируем failed refresh attempt
-      await logSecurityEventFromRequest(request, 'token_refresh_failed', {
+    // БЕЗОПАСНОСТЬ: Refresh token rotation ВСЕГДА включена для защиты от replay attacks
+    // Новый токен остается в том же семействе ротации (у токенов без "fam" — новое)
+    const familyId = payload.fam ?? crypto.randomUUID();
+    const newRefreshTokenValue = createRefreshToken(
+      {
         userId: payload.userId,
         email: payload.email,
-        metadata: { reason: 'token_not_found_or_revoked' },
-      });
-      
-      return NextResponse.json(
-        { error: 'Unauthorized', message: 'Refresh token not found or revoked' },
-        { status: 401 }
-      );
-    }
+        role: payload.role,
+      },
+      familyId
+    );
 
-    // Получаем актуальные данные пользователя
-    const user = refreshTokenRecord.user;
-    
-    // Проверяем, не изменилась ли роль или email
-    if (user.email !== payload.email || user.role !== payload.role) {
-      // Отзываем все токены пользователя, если данные изменились
-      await revokeRefreshToken(refreshTokenValue);
-      
-      // БЕЗОПАСНОСТЬ: Логируем failed refresh из-за изменения данных
-      await logSecurityEventFromRequest(request, 'token_refresh_failed', {
-        userId: user.id,
-        email: user.email,
-        metadata: { reason: 'user_data_changed' },
-      });
-      
-      return NextResponse.json(
-        { error: 'Unauthorized', message: 'User data changed, please login again' },
-        { status: 401 }
-      );
+    // Атомарно отзываем старый токен и сохраняем новый (одна запись в БД)
+    const user = await rotateRefreshToken(refreshTokenValue, newRefreshTokenValue, familyId, payload);
+    if (!user) {
+      const reason = (await getRefreshTokenRejectionReason(refreshTokenValue, payload)) ?? 'token_not_found';
+      return rejectRefresh(request, refreshTokenValue, payload, reason);
     }
 
     // Создаём новый access токен
@@ -84,22 +118,9 @@ export async function POST(request: NextRequest) {
       email: user.email,
       role: user.role,
     });
-
-    // БЕЗОПАСНОСТЬ: Refresh token rotation ВСЕГДА включена для защиты от replay attacks
-    // Отзываем старый refresh токен
-    await revokeRefreshToken(refreshTokenValue);
-
-    // Создаём новый refresh токен
-    const newRefreshTokenValue = createRefreshToken({
-      userId: user.id,
-      email: user.email,
-      role: user.role,
-    });
-
-    await createRefreshTokenRecord(user.id, newRefreshTokenValue);
     
     // БЕЗОПАСНОСТЬ: Логируем successful token refresh
-    await logSecurityEventFromRequest(request, 'token_refresh', {
+    queueSecurityEventFromRequest(request, 'token_refresh', {
       userId: user.id,
       email: user.email,
     });
@@ -132,5 +153,3 @@ export async function POST(request: NextRequest) {
     );
   }
 }
-
-
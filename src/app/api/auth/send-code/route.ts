@@ -103,13 +103,27 @@ export async function POST(request: NextRequest) {
     if (emailUser && emailPassword) {
       try {
         // Создаем SMTP transporter
-        const transporter = nodemailer.createTransport({
-          service: 'gmail',
-          auth: {
-            user: emailUser,
-            pass: emailPassword,
-          },
-        });
+        // SMTP_HOST/SMTP_PORT — произвольный SMTP-сервер (например, локальный стенд), иначе Gmail
+        const smtpHost = process.env.SMTP_HOST;
+        const transporter = nodemailer.createTransport(
+          smtpHost
+            ? {
+                host: smtpHost,
+                port: parseInt(process.env.SMTP_PORT || '587', 10),
+                secure: process.env.SMTP_SECURE === 'true',
+                auth: {
+                  user: emailUser,
+                  pass: emailPassword,
+                },
+              }
+            : {
+                service: 'gmail',
+                auth: {
+                  user: emailUser,
+                  pass: emailPassword,
+                },
+              }
+        );
 
         // Отправляем email (даже если пользователь не существует - для безопасности)
         // Это предотвращает user enumeration через поведение SMTP
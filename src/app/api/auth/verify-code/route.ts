@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { prisma } from '@/lib/prisma';
+import crypto from 'crypto';
 import { upsertUser, createRefreshTokenRecord } from '@/lib/auth-utils';
 import { createToken, createRefreshToken, setTokenCookie, setRefreshTokenCookie } from '@/lib/jwt';
 import { checkAuthRateLimit, getIP } from '@/lib/rate-limit';
@@ -139,15 +140,16 @@ export async function POST(request: NextRequest) {
       role: user.role,
     });
 
-    // Create refresh token (long-lived)
+    // Create refresh token (long-lived); новый вход начинает новое семейство ротации
+    const familyId = crypto.randomUUID();
     const refreshTokenValue = createRefreshToken({
       userId: user.id,
       email: user.email,
       role: user.role,
-    });
+    }, familyId);
 
     // Store refresh token in database
-    await createRefreshTokenRecord(user.id, refreshTokenValue);
+    await createRefreshTokenRecord(user.id, refreshTokenValue, familyId);
 
     if (process.env.NODE_ENV !== 'production') {
       console.log('🔑 JWT tokens created for user');
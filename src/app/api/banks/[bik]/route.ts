@@ -0,0 +1,42 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { getBankByBik } from '@/lib/services/bankDirectory';
+
+/**
+ * GET /api/banks/[bik]
+ * Получить банк по БИК из локального справочника (наименование и корсчет)
+ * JWT проверяется в middleware, обращения к БД нет
+ */
+export async function GET(
+  request: NextRequest,
+  { params }: { params: Promise<{ bik: string }> }
+) {
+  try {
+    const { bik } = await params;
+
+    if (!/^\d{9}$/.test(bik)) {
+      return NextResponse.json(
+        { error: 'БИК должен содержать 9 цифр' },
+        { status: 400 }
+      );
+    }
+
+    const bank = await getBankByBik(bik);
+
+    if (!bank) {
+      return NextResponse.json(
+        { error: 'Bank not found' },
+        { status: 404 }
+      );
+    }
+
+    return NextResponse.json(bank, {
+      headers: { 'Cache-Control': 'private, max-age=300' },
+    });
+  } catch (error) {
+    console.error('GET /api/banks/[bik] error:', error);
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    );
+  }
+}
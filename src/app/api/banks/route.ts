@@ -0,0 +1,33 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { searchBanks } from '@/lib/services/bankDirectory';
+
+/**
+ * GET /api/banks?q=0445&limit=10
+ * Автодополнение банков по префиксу БИК или части названия (локальный справочник)
+ *
+ * Справочные данные не зависят от пользователя: JWT уже проверен в middleware,
+ * поэтому getCurrentUser() (запрос к БД) на каждое нажатие клавиши не вызываем
+ */
+export async function GET(request: NextRequest) {
+  try {
+    const q = request.nextUrl.searchParams.get('q') ?? '';
+    const limitParam = Number.parseInt(request.nextUrl.searchParams.get('limit') ?? '10', 10);
+    const limit = Number.isNaN(limitParam) ? 10 : Math.min(Math.max(limitParam, 1), 50);
+
+    if (q.trim().length < 2) {
+      return NextResponse.json([]);
+    }
+
+    const banks = await searchBanks(q, limit);
+
+    return NextResponse.json(banks, {
+      headers: { 'Cache-Control': 'private, max-age=300' },
+    });
+  } catch (error) {
+    console.error('GET /api/banks error:', error);
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    );
+  }
+}
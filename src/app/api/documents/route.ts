@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { prisma } from '@/lib/prisma';
-import { getCurrentUser, checkDemoLimit, checkUserAccessPeriod, incrementDocumentUsage } from '@/lib/auth-utils';
+import { getCurrentUser, checkUserAccessPeriod } from '@/lib/auth-utils';
+import { createDocumentWithQuota } from '@/lib/services/documentCreation';
 import { createDocumentSchema } from '@/lib/schemas/document';
 import { z } from 'zod';
 
@@ -57,6 +58,8 @@ export async function GET(request: NextRequest) {
 /**
  * POST /api/documents
  * Создать новый документ
+ * Резерв демо-квоты, подстановка previewText шаблона и вставка выполняются одним запросом
+ * (см. createDocumentWithQuota), в ответе возвращается актуальный demoStatus
  */
 export async function POST(request: NextRequest) {
   try {
@@ -74,30 +77,29 @@ export async function POST(request: NextRequest) {
     if (user.role !== 'admin') {
       // Используем checkUserAccessPeriod() вместо checkAccessPeriod() - избегаем лишнего DB запроса
       const accessCheck = checkUserAccessPeriod(user);
-      
+
       if (!accessCheck.hasAccess) {
-        // Если нет доступа по времени - проверяем демо-лимит
-        if (accessCheck.status === 'not_granted') {
-          isUsingDemo = true; // Запоминаем для увеличения счетчика позже
-          const hasDemoLimit = await checkDemoLimit(user.id);
-          if (!hasDemoLimit) {
-            return NextResponse.json(
-              { error: 'Demo limit exceeded' },
-              { status: 403 }
-            );
-          }
-        } else {
-          // Доступ истек или не начался
-          return NextResponse.json(
-            { 
-              error: 'Access Expired',
-              message: accessCheck.message 
-            },
-            { status: 403 }
-          );
-        }
+        // Доступ истек или не начался
+        return NextResponse.json(
+          {
+            error: 'Access Expired',
+            message: accessCheck.message
+          },
+          { status: 403 }
+        );
+      }
+
+      // Временный доступ не назначен - работает демо-режим с лимитом документов
+      isUsingDemo = !user.accessFrom || !user.accessUntil;
+
+      // Быстрый отказ по уже загруженному demoStatus (окончательная проверка - атомарно в БД)
+      const demo = user.demoStatus;
+      if (isUsingDemo && (!demo || !demo.isActive || demo.documentsUsed >= demo.documentsLimit)) {
+        return NextResponse.json(
+          { error: 'Demo limit exceeded' },
+          { status: 403 }
+        );
       }
-      // Если есть доступ по времени - пропускаем проверку демо-лимита
     }
 
     const body = await request.json();
@@ -105,60 +107,21 @@ export async function POST(request: NextRequest) {
     // Валидация с Zod
     const validated = createDocumentSchema.parse(body);
 
-    let bodyTextPayload = validated.bodyText;
-
-    if (!bodyTextPayload || bodyTextPayload.trim().length === 0) {
-      const templateBody = await prisma.templateBody.findUnique({
-        where: { templateCode: validated.templateCode },
-        select: { previewText: true },
-      });
-
-      const previewText = templateBody?.previewText;
-      if (previewText && previewText.trim().length > 0) {
-        bodyTextPayload = previewText;
-      }
-    }
-
-    const document = await prisma.document.create({
-      data: {
-        userId: user.id,
-        organizationId: validated.organizationId || undefined,
-        title: validated.title || undefined,
-        templateCode: validated.templateCode,
-        templateVersion: validated.templateVersion,
-        bodyText: bodyTextPayload && bodyTextPayload.trim().length > 0 ? bodyTextPayload : undefined,
-        requisites: validated.requisites || undefined,
-        hasBodyChat: validated.hasBodyChat || false,
-      },
-      select: {
-        id: true,
-        title: true,
-        templateCode: true,
-        templateVersion: true,
-        bodyText: true,
-        requisites: true,
-        hasBodyChat: true,
-        createdAt: true,
-        updatedAt: true,
-        organizationId: true,
-        organization: {
-          select: {
-            id: true,
-            name_full: true,
-            name_short: true,
-            inn: true,
-          }
-        },
-      },
+    const result = await createDocumentWithQuota(user.id, validated, {
+      reserveDemoQuota: isUsingDemo,
     });
 
-    // Увеличиваем счётчик использованных документов ТОЛЬКО для demo пользователей
-    // (у кого нет временного платного доступа)
-    if (user.role !== 'admin' && isUsingDemo) {
-      await incrementDocumentUsage(user.id);
+    if (result.status === 'demo_limit_exceeded') {
+      return NextResponse.json(
+        { error: 'Demo limit exceeded' },
+        { status: 403 }
+      );
     }
 
-    return NextResponse.json(document, { status: 201 });
+    return NextResponse.json(
+      { ...result.document, demoStatus: result.demoStatus },
+      { status: 201 }
+    );
   } catch (error) {
     if (error instanceof z.ZodError) {
       return NextResponse.json(
@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { prisma } from '@/lib/prisma';
 import { getCurrentUser } from '@/lib/auth-utils';
 import { updateOrganizationSchema } from '@/lib/schemas/organization';
+import { checkBankRequisites, loadBankDirectory } from '@/lib/services/bankDirectory';
 import { z } from 'zod';
 
 /**
@@ -86,6 +87,21 @@ export async function PUT(
     // Валидация с Zod
     const validated = updateOrganizationSchema.parse(body);
 
+    // Сверка БИК и корсчета с локальным справочником банков (если меняется хотя бы одно из полей)
+    if (validated.bank_bik !== undefined || validated.bank_ks !== undefined) {
+      await loadBankDirectory();
+      const bankErrors = checkBankRequisites({
+        bank_bik: validated.bank_bik ?? existing.bank_bik,
+        bank_ks: validated.bank_ks ?? existing.bank_ks,
+      });
+      if (bankErrors.length > 0) {
+        return NextResponse.json(
+          { error: 'Validation error', details: bankErrors },
+          { status: 400 }
+        );
+      }
+    }
+
     const organization = await prisma.organization.update({
       where: { id },
       data: {
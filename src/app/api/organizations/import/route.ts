@@ -0,0 +1,87 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { getCurrentUser } from '@/lib/auth-utils';
+import {
+  importOrganizations,
+  iterateCsvRecords,
+  iterateXlsxRecords,
+  OrganizationImportError,
+} from '@/lib/services/organizationImport';
+
+/**
+ * POST /api/organizations/import
+ * Массовый импорт организаций из CSV/XLSX (multipart/form-data)
+ * Поля формы: file — файл, dryRun=true — только проверка без сохранения
+ * Ответ: отчет с количеством импортированных/дубликатов/ошибок и построчными ошибками
+ */
+export async function POST(request: NextRequest) {
+  try {
+    const user = await getCurrentUser(request);
+
+    if (!user) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    const formData = await request.formData();
+    const file = formData.get('file') as File | null;
+    const dryRun = formData.get('dryRun') === 'true';
+
+    if (!file) {
+      return NextResponse.json(
+        { error: 'Файл не найден' },
+        { status: 400 }
+      );
+    }
+
+    // Проверка размера (15 МБ)
+    if (file.size > 15 * 1024 * 1024) {
+      return NextResponse.json(
+        { error: 'Размер файла не должен превышать 15 МБ' },
+        { status: 400 }
+      );
+    }
+
+    const fileExtension = file.name.toLowerCase().split('.').pop();
+
+    let records: AsyncIterable<string[]> | Iterable<string[]>;
+    if (fileExtension === 'csv') {
+      records = iterateCsvRecords(file.stream());
+    } else if (fileExtension === 'xlsx') {
+      records = iterateXlsxRecords(await file.arrayBuffer());
+    } else {
+      return NextResponse.json(
+        { error: `Неподдерживаемый формат файла: .${fileExtension}. Поддерживаются: .csv, .xlsx` },
+        { status: 400 }
+      );
+    }
+
+    const report = await importOrganizations(user.id, records, { dryRun });
+
+    if (process.env.NODE_ENV !== 'production') {
+      console.log(
+        `📥 Organization import: ${report.imported}/${report.totalRows} rows in ${report.durationMs}ms (${report.rowsPerSecond} rows/s)`
+      );
+    }
+
+    return NextResponse.json({
+      success: true,
+      fileName: file.name,
+      ...report,
+    });
+  } catch (error) {
+    if (error instanceof OrganizationImportError) {
+      return NextResponse.json(
+        { error: error.message },
+        { status: 400 }
+      );
+    }
+
+    console.error('POST /api/organizations/import error:', error);
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    );
+  }
+}
@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { prisma } from '@/lib/prisma';
 import { getCurrentUser } from '@/lib/auth-utils';
 import { createOrganizationSchema } from '@/lib/schemas/organization';
+import { checkBankRequisites, loadBankDirectory } from '@/lib/services/bankDirectory';
 import { z } from 'zod';
 
 /**
@@ -54,6 +55,16 @@ export async function POST(request: NextRequest) {
     // Валидация с Zod
     const validated = createOrganizationSchema.parse(body);
 
+    // Сверка БИК и корсчета с локальным справочником банков
+    await loadBankDirectory();
+    const bankErrors = checkBankRequisites(validated);
+    if (bankErrors.length > 0) {
+      return NextResponse.json(
+        { error: 'Validation error', details: bankErrors },
+        { status: 400 }
+      );
+    }
+
     const organization = await prisma.organization.create({
       data: {
         userId: user.id,
@@ -0,0 +1,66 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { getCurrentUser } from '@/lib/auth-utils';
+import { searchQuerySchema } from '@/lib/schemas/search';
+import { searchDocuments, searchOrganizations } from '@/lib/services/search';
+import { z } from 'zod';
+
+/**
+ * GET /api/search?q=...&type=all|documents|organizations&page=1&pageSize=20
+ * Серверный поиск по документам (полнотекстовый) и организациям (триграммы)
+ * Дополнительные фильтры для документов: organizationId, templateCode, createdFrom, createdTo
+ */
+export async function GET(request: NextRequest) {
+  try {
+    const user = await getCurrentUser(request);
+
+    if (!user) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    const params = Object.fromEntries(request.nextUrl.searchParams.entries());
+    const validated = searchQuerySchema.parse(params);
+    const pagination = { page: validated.page, pageSize: validated.pageSize };
+
+    const [documents, organizations] = await Promise.all([
+      validated.type === 'organizations'
+        ? null
+        : searchDocuments(user.id, validated.q, pagination, {
+            organizationId: validated.organizationId,
+            templateCode: validated.templateCode,
+            createdFrom: validated.createdFrom,
+            createdTo: validated.createdTo,
+          }),
+      validated.type === 'documents'
+        ? null
+        : searchOrganizations(user.id, validated.q, pagination),
+    ]);
+
+    return NextResponse.json({
+      query: validated.q,
+      documents,
+      organizations,
+    });
+  } catch (error) {
+    if (error instanceof z.ZodError) {
+      return NextResponse.json(
+        {
+          error: 'Validation error',
+          details: error.issues.map((e) => ({
+            field: e.path.join('.'),
+            message: e.message
+          }))
+        },
+        { status: 400 }
+      );
+    }
+
+    console.error('GET /api/search error:', error);
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    );
+  }
+}
@@ -2,11 +2,13 @@
 
 import { useState, useEffect, use, useRef } from "react";
 import { useRouter, useSearchParams } from "next/navigation";
+import { useQueryClient } from "@tanstack/react-query";
 import { Button } from "@/components/ui/button";
 import { Textarea } from "@/components/ui/textarea";
 import { Card } from "@/components/ui/card";
 import { useUser } from "@/hooks/useUser";
 import { useDocuments } from "@/hooks/useDocuments";
+import { queryKeys, fetchDocument } from "@/lib/queries";
 import { getTemplateByCode } from "@/lib/data/templates";
 import { checkNoRequisites } from "@/lib/utils/requisitesGuard";
 import { toast } from "sonner";
@@ -35,6 +37,7 @@ export default function DocumentBodyChatPage({ params }: { params: Promise<{ id:
 
   const { user, isLoading: userLoading } = useUser();
   const { updateDocument } = useDocuments();
+  const queryClient = useQueryClient();
 
   const BASE_TEMPLATE_MESSAGE_ID = "base_template";
 
@@ -49,21 +52,22 @@ export default function DocumentBodyChatPage({ params }: { params: Promise<{ id:
         setIsDocumentLoading(true);
         setDocumentLoadError(null);
 
-        const response = await fetch(`/api/documents/${docId}`, {
-          credentials: "include",
-        });
-
-        if (response.status === 404) {
-          toast.error("Документ не найден");
-          router.push("/templates");
-          return;
-        }
-
-        if (!response.ok) {
-          throw new Error("Failed to load document");
+        // Через кэш React Query: документ мог быть предзагружен при наведении или создан только что
+        let documentData;
+        try {
+          documentData = await queryClient.fetchQuery({
+            queryKey: queryKeys.document(docId),
+            queryFn: () => fetchDocument(docId),
+          });
+        } catch (error) {
+          if ((error as { status?: number })?.status === 404) {
+            toast.error("Документ не найден");
+            router.push("/templates");
+            return;
+          }
+          throw error;
         }
 
-        const documentData = await response.json();
         const textFromTemplate = typeof documentData.bodyText === "string" ? documentData.bodyText : "";
 
         setBodyText(textFromTemplate);
@@ -103,7 +107,7 @@ export default function DocumentBodyChatPage({ params }: { params: Promise<{ id:
     }
 
     loadDocumentBody();
-  }, [docId, router]);
+  }, [docId, router, queryClient]);
 
   useEffect(() => {
     if (!userLoading && !user) {
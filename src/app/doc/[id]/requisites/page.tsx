@@ -2,6 +2,7 @@
 
 import { useState, useEffect, use } from "react";
 import { useRouter, useSearchParams } from "next/navigation";
+import { useQueryClient } from "@tanstack/react-query";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 import { Label } from "@/components/ui/label";
@@ -11,6 +12,7 @@ import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { useUser } from "@/hooks/useUser";
 import { useOrganizations } from "@/hooks/useOrganizations";
 import { useDocuments } from "@/hooks/useDocuments";
+import { queryKeys, fetchDocument } from "@/lib/queries";
 // TODO: Реализовать API для получения конфигурации реквизитов шаблонов
 // import { mockTemplateRequisites } from "@/lib/store/mockData";
 import { getTemplateByCode } from "@/lib/data/templates";
@@ -28,6 +30,7 @@ export default function DocumentRequisitesPage({ params }: { params: Promise<{ i
   const { user, isLoading: userLoading } = useUser();
   const { organizations, isLoading: orgsLoading } = useOrganizations();
   const { createDocument, getById } = useDocuments();
+  const queryClient = useQueryClient();
 
   const [selectedOrgId, setSelectedOrgId] = useState<string>("");
   const [requisites, setRequisites] = useState<Record<string, string>>({});
@@ -167,13 +170,11 @@ export default function DocumentRequisitesPage({ params }: { params: Promise<{ i
       if (existingDoc?.bodyText) {
         setBodyText(existingDoc.bodyText);
       } else {
-        // Если документ не найден в кеше, загружаем из API
-        fetch(`/api/documents/${docId}`)
-          .then(res => {
-            if (res.ok) {
-              return res.json();
-            }
-            return null;
+        // Если документа нет в кеше списка, берем из кеша документа или загружаем из API
+        queryClient
+          .fetchQuery({
+            queryKey: queryKeys.document(docId),
+            queryFn: () => fetchDocument(docId),
           })
           .then(data => {
             if (data?.bodyText) {
@@ -185,7 +186,7 @@ export default function DocumentRequisitesPage({ params }: { params: Promise<{ i
           });
       }
     }
-  }, [userLoading, user, router, templateCode, hasBody, docId, getById]);
+  }, [userLoading, user, router, templateCode, hasBody, docId, getById, queryClient]);
 
   const template = templateCode ? getTemplateByCode(templateCode) : null;
   const [dbTemplate, setDbTemplate] = useState<any | null>(null);
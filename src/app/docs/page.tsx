@@ -8,11 +8,14 @@ import { Card } from "@/components/ui/card";
 import { useDocuments } from "@/hooks/useDocuments";
 import { useOrganizations } from "@/hooks/useOrganizations";
 import { useUser } from "@/hooks/useUser";
+import { useSearch } from "@/hooks/useSearch";
+import { usePrefetch } from "@/hooks/usePrefetch";
 import { getTemplateByCode } from "@/lib/data/templates";
 import { toast } from "sonner";
 import { FileText, Download, Eye, Search } from "lucide-react";
 import { ThemeToggle } from "@/components/ThemeToggle";
 import { DocumentPreview } from "@/components/DocumentPreview";
+import { SearchHighlight } from "@/components/SearchHighlight";
 import { Input } from "@/components/ui/input";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 // Подтягиваем список шаблонов из БД для фильтров и отображения
@@ -20,6 +23,7 @@ import { DocumentListSkeleton, DocumentTableRowSkeleton } from "@/components/ske
 
 export default function DocumentsArchivePage() {
   const router = useRouter();
+  const { prefetchOn } = usePrefetch();
   const { user, isLoading: userLoading, logout, isLoggingOut } = useUser();
   const { documents: allDocuments, isLoading: docsLoading, error: docsError } = useDocuments();
   const { organizations: userOrganizations, isLoading: orgsLoading } = useOrganizations();
@@ -30,7 +34,17 @@ export default function DocumentsArchivePage() {
   const [searchQuery, setSearchQuery] = useState("");
   const [filterTemplate, setFilterTemplate] = useState<string>("all");
   const [filterOrg, setFilterOrg] = useState<string>("all");
-  const [sortBy, setSortBy] = useState<"date" | "name">("date");
+  const [sortBy, setSortBy] = useState<"date" | "name" | "relevance">("date");
+
+  // Серверный полнотекстовый поиск (по названию и тексту документа)
+  const {
+    documents: searchResults,
+    isSearching,
+    hasMore: hasMoreSearchResults,
+    isLoadingMore: isLoadingMoreSearchResults,
+    loadMore: loadMoreSearchResults,
+  } = useSearch(searchQuery, "documents");
+  const searchHits = new Map((searchResults?.items ?? []).map((hit) => [hit.id, hit]));
 
   const handleLogout = async () => {
     try {
@@ -131,13 +145,14 @@ export default function DocumentsArchivePage() {
   // Фильтрация и сортировка
   const documents = allDocuments
     .filter((doc) => {
-      // Поиск по названию
+      // Поиск: серверный полнотекстовый + локально по названию шаблона
       if (searchQuery) {
         const template = getTemplateByCode(doc.templateCode) || dbTemplates.find(t => t.code === doc.templateCode);
         const searchLower = searchQuery.toLowerCase();
+        const serverMatch = searchHits.has(doc.id);
         const titleMatch = doc.title?.toLowerCase().includes(searchLower);
         const templateMatch = template?.nameRu.toLowerCase().includes(searchLower);
-        if (!titleMatch && !templateMatch) return false;
+        if (!serverMatch && !titleMatch && !templateMatch) return false;
       }
 
       // Фильтр по шаблону
@@ -153,7 +168,12 @@ export default function DocumentsArchivePage() {
       return true;
     })
     .sort((a, b) => {
-      if (sortBy === "date") {
+      if (sortBy === "relevance" && searchResults) {
+        const rankDiff = (searchHits.get(b.id)?.rank ?? -1) - (searchHits.get(a.id)?.rank ?? -1);
+        if (rankDiff !== 0) return rankDiff;
+        return new Date(b.createdAt || 0).getTime() - new Date(a.createdAt || 0).getTime();
+      }
+      if (sortBy === "date" || sortBy === "relevance") {
         return new Date(b.createdAt || 0).getTime() - new Date(a.createdAt || 0).getTime();
       } else {
         const aTitle = a.title || (getTemplateByCode(a.templateCode)?.nameRu || dbTemplates.find(t => t.code === a.templateCode)?.nameRu || "");
@@ -228,11 +248,11 @@ export default function DocumentsArchivePage() {
             <h1 className="text-xl md:text-2xl font-bold">Мой архив документов</h1>
             <div className="flex gap-2">
               <ThemeToggle />
-              <Button onClick={() => router.push("/templates")} size="sm" className="md:size-default">
+              <Button {...prefetchOn("/templates")} onClick={() => router.push("/templates")} size="sm" className="md:size-default">
                 <span className="hidden sm:inline">К шаблонам</span>
                 <span className="sm:hidden">Шаблоны</span>
               </Button>
-              <Button variant="outline" onClick={() => router.push("/profile")} size="sm" className="hidden sm:inline-flex md:size-default">
+              <Button variant="outline" {...prefetchOn("/profile")} onClick={() => router.push("/profile")} size="sm" className="hidden sm:inline-flex md:size-default">
                 Профиль
               </Button>
               <Button
@@ -258,7 +278,7 @@ export default function DocumentsArchivePage() {
               <div className="flex-1 relative">
                 <Search className="absolute left-3 top-1/2 transform -translate-y-1/2 w-4 h-4 text-muted-foreground" />
                 <Input
-                  placeholder="Поиск по названию..."
+                  placeholder="Поиск по названию и тексту..."
                   value={searchQuery}
                   onChange={(e) => setSearchQuery(e.target.value)}
                   className="pl-10"
@@ -296,13 +316,14 @@ export default function DocumentsArchivePage() {
               </Select>
 
               {/* Сортировка */}
-              <Select value={sortBy} onValueChange={(val) => setSortBy(val as "date" | "name")}>
+              <Select value={sortBy} onValueChange={(val) => setSortBy(val as "date" | "name" | "relevance")}>
                 <SelectTrigger className="w-full md:w-[150px]">
                   <SelectValue />
                 </SelectTrigger>
                 <SelectContent>
                   <SelectItem value="date">По дате ↓</SelectItem>
                   <SelectItem value="name">По названию ↑</SelectItem>
+                  <SelectItem value="relevance">По релевантности</SelectItem>
                 </SelectContent>
               </Select>
             </div>
@@ -311,6 +332,7 @@ export default function DocumentsArchivePage() {
             {(searchQuery || filterTemplate !== "all" || filterOrg !== "all") && (
               <div className="mt-3 text-sm text-muted-foreground">
                 Найдено документов: {documents.length} из {allDocuments.length}
+                {isSearching && " (поиск...)"}
                 {(searchQuery || filterTemplate !== "all" || filterOrg !== "all") && (
                   <Button
                     variant="link"
@@ -325,6 +347,21 @@ export default function DocumentsArchivePage() {
                     Сбросить фильтры
                   </Button>
                 )}
+                {/* Сервер отдает совпадения по тексту страницами — показываем, что загружены не все */}
+                {searchResults && hasMoreSearchResults && (
+                  <div className="mt-1">
+                    Совпадений по тексту загружено: {searchResults.items.length} из {searchResults.total}
+                    <Button
+                      variant="link"
+                      size="sm"
+                      className="ml-2 h-auto p-0"
+                      disabled={isLoadingMoreSearchResults}
+                      onClick={loadMoreSearchResults}
+                    >
+                      {isLoadingMoreSearchResults ? "Загрузка..." : "Загрузить ещё"}
+                    </Button>
+                  </div>
+                )}
               </div>
             )}
           </Card>
@@ -337,7 +374,7 @@ export default function DocumentsArchivePage() {
             <p className="text-muted-foreground mb-6">
               Создайте свой первый документ из каталога шаблонов
             </p>
-            <Button onClick={() => router.push("/templates")}>
+            <Button {...prefetchOn("/templates")} onClick={() => router.push("/templates")}>
               Вернуться к выбору шаблона
             </Button>
           </Card>
@@ -373,7 +410,17 @@ export default function DocumentsArchivePage() {
                   <Card key={doc.id} className="p-4">
                     <div className="space-y-3">
                       <div>
-                        <h3 className="font-semibold">{doc.title || `${template?.nameRu || doc.templateCode}`}</h3>
+                        <h3 className="font-semibold">
+                          {searchHits.get(doc.id)?.titleHighlight
+                            ? <SearchHighlight text={searchHits.get(doc.id)!.titleHighlight!} />
+                            : doc.title || `${template?.nameRu || doc.templateCode}`}
+                        </h3>
+                        {searchHits.get(doc.id)?.snippet && (
+                          <SearchHighlight
+                            text={searchHits.get(doc.id)!.snippet!}
+                            className="block text-xs text-muted-foreground mt-1"
+                          />
+                        )}
                         <p className="text-sm text-muted-foreground mt-1">
                           {template?.nameRu || doc.templateCode}
                         </p>
@@ -461,7 +508,15 @@ export default function DocumentsArchivePage() {
                   return (
                     <TableRow key={doc.id}>
                       <TableCell className="font-medium">
-                        {doc.title || `${template?.nameRu || doc.templateCode}`}
+                        {searchHits.get(doc.id)?.titleHighlight
+                          ? <SearchHighlight text={searchHits.get(doc.id)!.titleHighlight!} />
+                          : doc.title || `${template?.nameRu || doc.templateCode}`}
+                        {searchHits.get(doc.id)?.snippet && (
+                          <SearchHighlight
+                            text={searchHits.get(doc.id)!.snippet!}
+                            className="block text-xs font-normal text-muted-foreground mt-1"
+                          />
+                        )}
                       </TableCell>
                       <TableCell>
                         {template?.nameRu || doc.templateCode}
@@ -11,6 +11,7 @@ import { Textarea } from "@/components/ui/textarea";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { useUser } from "@/hooks/useUser";
 import { useOrganizations } from "@/hooks/useOrganizations";
+import { useBankDirectory } from "@/hooks/useBankDirectory";
 import type { SubjectType, AuthorityBase, OrganizationFormData } from "@/lib/types/organization";
 import { toast } from "sonner";
 import { validateINN10, validateINN12, validateOGRN, validateOGRNIP, validateBankKS, validateBankRS, validateEmail, normalizePhone } from "@/lib/utils/validators";
@@ -50,6 +51,20 @@ export default function CreateOrganizationPage() {
 
   const { user, isLoading: userLoading } = useUser();
 
+  // Справочник БИК: подсказки и автозаполнение наименования банка и корсчета
+  const [bankAutofill, setBankAutofill] = useState(false);
+  const { bank, notFound: bankNotFound, suggestions: bankSuggestions } = useBankDirectory(formData.bank_bik);
+
+  useEffect(() => {
+    if (!bank || !bankAutofill) return;
+    setFormData((prev) => ({
+      ...prev,
+      bank_name: bank.name,
+      bank_ks: bank.ks || prev.bank_ks,
+    }));
+    setBankAutofill(false);
+  }, [bank, bankAutofill]);
+
   useEffect(() => {
     if (!userLoading && !user) {
       router.push("/auth/login");
@@ -464,10 +479,30 @@ export default function CreateOrganizationPage() {
                 <Input
                   id="bank_bik"
                   value={formData.bank_bik}
-                  onChange={(e) => setFormData({ ...formData, bank_bik: e.target.value })}
+                  onChange={(e) => {
+                    setFormData({ ...formData, bank_bik: e.target.value });
+                    setBankAutofill(true);
+                  }}
                   required
                   placeholder="9 цифр"
+                  list="bank-bik-suggestions"
+                  autoComplete="off"
                 />
+                <datalist id="bank-bik-suggestions">
+                  {bankSuggestions.map((b) => (
+                    <option key={b.bik} value={b.bik}>{b.name}</option>
+                  ))}
+                </datalist>
+                {bank && (
+                  <p className="text-xs text-muted-foreground mt-1">
+                    {bank.name}{bank.city ? `, ${bank.city}` : ""}
+                  </p>
+                )}
+                {bankNotFound && (
+                  <p className="text-xs text-muted-foreground mt-1">
+                    БИК не найден в справочнике — заполните данные банка вручную
+                  </p>
+                )}
               </div>
 
               <div>
@@ -489,6 +524,11 @@ export default function CreateOrganizationPage() {
                   required
                   placeholder="20 цифр"
                 />
+                {bank?.ks && formData.bank_ks && bank.ks !== formData.bank_ks && (
+                  <p className="text-xs text-destructive mt-1">
+                    Не совпадает с корсчётом по справочнику: {bank.ks}
+                  </p>
+                )}
               </div>
 
               <div>
@@ -5,18 +5,33 @@ import { useRouter } from "next/navigation";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
+import { Input } from "@/components/ui/input";
 import { useOrganizations } from "@/hooks/useOrganizations";
 import { useUser } from "@/hooks/useUser";
+import { useSearch } from "@/hooks/useSearch";
+import { usePrefetch } from "@/hooks/usePrefetch";
 import { OrganizationListSkeleton } from "@/components/skeletons/OrganizationSkeleton";
 import { ConfirmDialog } from "@/components/ConfirmDialog";
-import { Trash2 } from "lucide-react";
+import { SearchHighlight } from "@/components/SearchHighlight";
+import { Search, Trash2 } from "lucide-react";
 
 export default function OrganizationsPage() {
   const router = useRouter();
+  const { prefetchOn } = usePrefetch();
   const { user, isLoading: userLoading } = useUser();
   const { organizations, isLoading, error, deleteOrganization } = useOrganizations();
   const [deleteOrgId, setDeleteOrgId] = useState<string | null>(null);
   const [deleting, setDeleting] = useState(false);
+  const [searchQuery, setSearchQuery] = useState("");
+
+  // Серверный поиск по наименованию и ИНН (триграммы)
+  const {
+    organizations: searchResults,
+    isSearching,
+    hasMore: hasMoreSearchResults,
+    isLoadingMore: isLoadingMoreSearchResults,
+    loadMore: loadMoreSearchResults,
+  } = useSearch(searchQuery, "organizations");
 
   useEffect(() => {
     if (!userLoading && !user) {
@@ -50,6 +65,14 @@ export default function OrganizationsPage() {
 
   const deleteOrg = organizations.find(org => org.id === deleteOrgId);
 
+  // При активном поиске показываем только найденные организации в порядке релевантности
+  const searchHits = new Map((searchResults?.items ?? []).map((hit) => [hit.id, hit]));
+  const visibleOrganizations = searchResults
+    ? organizations
+        .filter((org) => searchHits.has(org.id!))
+        .sort((a, b) => searchHits.get(b.id!)!.rank - searchHits.get(a.id!)!.rank)
+    : organizations;
+
   // Loading state
   if (isLoading) {
     return (
@@ -95,10 +118,10 @@ export default function OrganizationsPage() {
           <div className="flex items-center justify-between">
             <h1 className="text-2xl font-bold">Мои организации</h1>
             <div className="flex gap-2">
-              <Button onClick={() => router.push("/org/create")}>
+              <Button {...prefetchOn("/org/create")} onClick={() => router.push("/org/create")}>
                 Создать организацию
               </Button>
-              <Button variant="outline" onClick={() => router.push("/templates")}>
+              <Button variant="outline" {...prefetchOn("/templates")} onClick={() => router.push("/templates")}>
                 К шаблонам
               </Button>
             </div>
@@ -112,40 +135,64 @@ export default function OrganizationsPage() {
             <p className="text-lg text-muted-foreground mb-4">
               У вас пока нет организаций
             </p>
-            <Button onClick={() => router.push("/org/create")}>
+            <Button {...prefetchOn("/org/create")} onClick={() => router.push("/org/create")}>
               Создать организацию
             </Button>
           </div>
         ) : (
           <div className="space-y-4">
-            {organizations.map((org) => (
+            <div className="relative">
+              <Search className="absolute left-3 top-1/2 transform -translate-y-1/2 w-4 h-4 text-muted-foreground" />
+              <Input
+                placeholder="Поиск по наименованию или ИНН..."
+                value={searchQuery}
+                onChange={(e) => setSearchQuery(e.target.value)}
+                className="pl-10"
+              />
+            </div>
+
+            {searchResults && (
+              <p className="text-sm text-muted-foreground">
+                Найдено организаций: {searchResults.total}
+                {searchResults.items.length < searchResults.total && `, показано: ${searchResults.items.length}`}
+                {isSearching && " (поиск...)"}
+              </p>
+            )}
+
+            {visibleOrganizations.map((org) => (
               <Card key={org.id}>
                 <CardContent className="p-6">
                   <div className="flex items-start justify-between">
                     <div className="flex-1">
                       <div className="flex items-center gap-2 mb-2">
-                        <h3 className="text-xl font-semibold">{org.name_full}</h3>
+                        <h3 className="text-xl font-semibold">
+                          <SearchHighlight text={searchHits.get(org.id!)?.highlight.name_full ?? org.name_full} />
+                        </h3>
                         {org.is_default && (
                           <Badge variant="default">По умолчанию</Badge>
                         )}
                       </div>
                       {org.name_short && (
-                        <p className="text-muted-foreground text-sm mb-2">{org.name_short}</p>
+                        <p className="text-muted-foreground text-sm mb-2">
+                          <SearchHighlight text={searchHits.get(org.id!)?.highlight.name_short ?? org.name_short} />
+                        </p>
                       )}
                       <div className="text-sm text-muted-foreground">
-                        <p>ИНН: {org.inn}</p>
+                        <p>ИНН: <SearchHighlight text={searchHits.get(org.id!)?.highlight.inn ?? org.inn} /></p>
                         <p>{org.email}</p>
                       </div>
                     </div>
                     <div className="flex gap-2">
                       <Button
                         variant="outline"
+                        {...prefetchOn(`/org/${org.id}/view`)}
                         onClick={() => router.push(`/org/${org.id}/view`)}
                       >
                         Открыть
                       </Button>
                       <Button
                         variant="outline"
+                        {...prefetchOn(`/org/${org.id}/edit`)}
                         onClick={() => router.push(`/org/${org.id}/edit`)}
                       >
                         Редактировать
@@ -163,6 +210,18 @@ export default function OrganizationsPage() {
                 </CardContent>
               </Card>
             ))}
+
+            {searchResults && hasMoreSearchResults && (
+              <div className="text-center">
+                <Button
+                  variant="outline"
+                  disabled={isLoadingMoreSearchResults}
+                  onClick={loadMoreSearchResults}
+                >
+                  {isLoadingMoreSearchResults ? "Загрузка..." : "Показать ещё"}
+                </Button>
+              </div>
+            )}
           </div>
         )}
       </main>
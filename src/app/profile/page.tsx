@@ -10,6 +10,7 @@ import { Label } from "@/components/ui/label";
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { useUser } from "@/hooks/useUser";
+import { usePrefetch } from "@/hooks/usePrefetch";
 import { toast } from "sonner";
 import { User, Mail, Briefcase, Building2, Phone } from "lucide-react";
 import { ThemeToggle } from "@/components/ThemeToggle";
@@ -18,6 +19,7 @@ import { profileFormSchema, type ProfileFormData } from "@/lib/schemas/profileFo
 
 export default function ProfilePage() {
   const router = useRouter();
+  const { prefetchOn } = usePrefetch();
   const { user, isLoading, updateProfile, logout, isLoggingOut } = useUser();
 
   const [editing, setEditing] = useState(false);
@@ -124,13 +126,13 @@ export default function ProfilePage() {
             <h1 className="text-2xl font-bold">Личный кабинет</h1>
             <div className="flex gap-2">
               <ThemeToggle />
-              <Button onClick={() => router.push("/templates")} variant="outline">
+              <Button {...prefetchOn("/templates")} onClick={() => router.push("/templates")} variant="outline">
                 К шаблонам
               </Button>
-              <Button onClick={() => router.push("/org")} variant="outline">
+              <Button {...prefetchOn("/org")} onClick={() => router.push("/org")} variant="outline">
                 Организации
               </Button>
-              <Button onClick={() => router.push("/docs")} variant="outline">
+              <Button {...prefetchOn("/docs")} onClick={() => router.push("/docs")} variant="outline">
                 Архив
               </Button>
             </div>
@@ -11,9 +11,11 @@ import { categories, getCategoryByCode } from "@/lib/data/categories";
 import { tags, getTagByCode } from "@/lib/data/tags";
 import { useUser } from "@/hooks/useUser";
 import { useDocuments } from "@/hooks/useDocuments";
+import { usePrefetch } from "@/hooks/usePrefetch";
 
 export default function TemplatesPage() {
   const router = useRouter();
+  const { prefetchOn } = usePrefetch();
   const [searchQuery, setSearchQuery] = useState("");
   const [selectedCategory, setSelectedCategory] = useState<string | null>(null);
   const [selectedTags, setSelectedTags] = useState<string[]>([]);
@@ -167,13 +169,13 @@ export default function TemplatesPage() {
           <div className="flex items-center justify-between mb-4">
             <h1 className="text-2xl font-bold">Шаблоны</h1>
             <div className="flex gap-2">
-              <Button variant="outline" onClick={() => router.push("/docs")}>
+              <Button variant="outline" {...prefetchOn("/docs")} onClick={() => router.push("/docs")}>
                 Мой архив
               </Button>
-              <Button variant="outline" onClick={() => router.push("/org")}>
+              <Button variant="outline" {...prefetchOn("/org")} onClick={() => router.push("/org")}>
                 Организации
               </Button>
-              <Button variant="outline" onClick={() => router.push("/profile")}>
+              <Button variant="outline" {...prefetchOn("/profile")} onClick={() => router.push("/profile")}>
                 Профиль
               </Button>
             </div>
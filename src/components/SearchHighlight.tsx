@@ -0,0 +1,31 @@
+"use client";
+
+const HIGHLIGHT_PATTERN = /<mark>(.*?)<\/mark>/g;
+
+/**
+ * Рендер строки с маркерами подсветки <mark>...</mark> из /api/search
+ * Текст выводится как React-текст (без innerHTML), поэтому безопасен для XSS
+ */
+export function SearchHighlight({ text, className }: { text: string; className?: string }) {
+  const parts: React.ReactNode[] = [];
+  let lastIndex = 0;
+
+  for (const match of text.matchAll(HIGHLIGHT_PATTERN)) {
+    const index = match.index ?? 0;
+    if (index > lastIndex) {
+      parts.push(text.slice(lastIndex, index));
+    }
+    parts.push(
+      <mark key={index} className="bg-yellow-200 dark:bg-yellow-800 rounded px-0.5">
+        {match[1]}
+      </mark>
+    );
+    lastIndex = index + match[0].length;
+  }
+
+  if (lastIndex < text.length) {
+    parts.push(text.slice(lastIndex));
+  }
+
+  return <span className={className}>{parts}</span>;
+}
@@ -0,0 +1,41 @@
+import { useQuery } from '@tanstack/react-query';
+import { api } from '@/lib/api-client';
+
+export interface BankInfo {
+  bik: string;
+  name: string;
+  ks: string;
+  city?: string;
+}
+
+/**
+ * Поиск банка по БИК в локальном справочнике (/api/banks)
+ * - полный БИК (9 цифр) → bank / notFound
+ * - неполный БИК (3-8 цифр) → suggestions для автодополнения
+ */
+export function useBankDirectory(bik: string) {
+  const normalized = bik.trim();
+  const isComplete = /^\d{9}$/.test(normalized);
+  const isPrefix = /^\d{3,8}$/.test(normalized);
+
+  const lookup = useQuery({
+    queryKey: ['bank', normalized],
+    queryFn: () => api.get<BankInfo>(`/api/banks/${normalized}`, { skipAuthRedirect: true }),
+    enabled: isComplete,
+    retry: false,
+    staleTime: Infinity,
+  });
+
+  const suggestions = useQuery({
+    queryKey: ['banks', normalized],
+    queryFn: () => api.get<BankInfo[]>(`/api/banks?q=${encodeURIComponent(normalized)}`, { skipAuthRedirect: true }),
+    enabled: isPrefix,
+    staleTime: 5 * 60 * 1000,
+  });
+
+  return {
+    bank: isComplete ? lookup.data ?? null : null,
+    notFound: isComplete && lookup.isError,
+    suggestions: isPrefix ? suggestions.data ?? [] : [],
+  };
+}
@@ -1,6 +1,7 @@
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { api } from '@/lib/api-client';
-import type { Document } from '@/lib/types';
+import { queryKeys, fetchDocuments, markSearchStale } from '@/lib/queries';
+import type { Document, DemoStatus, User } from '@/lib/types';
 import { toast } from 'sonner';
 
 export function useDocuments() {
@@ -12,8 +13,8 @@ export function useDocuments() {
     isLoading,
     error: queryError,
   } = useQuery({
-    queryKey: ['documents'],
-    queryFn: () => api.get<Document[]>('/api/documents'),
+    queryKey: queryKeys.documents,
+    queryFn: fetchDocuments,
   });
 
   const error = queryError instanceof Error ? queryError.message : null;
@@ -28,17 +29,18 @@ export function useDocuments() {
       bodyText?: string;
       requisites?: Record<string, any>;
       hasBodyChat?: boolean;
-    }) => api.post<Document>('/api/documents', data),
+    }) => api.post<Document & { demoStatus?: DemoStatus | null }>('/api/documents', data),
 
     onMutate: async (newDoc) => {
-      await queryClient.cancelQueries({ queryKey: ['documents'] });
-      const previous = queryClient.getQueryData<Document[]>(['documents']);
+      await queryClient.cancelQueries({ queryKey: queryKeys.documents, exact: true });
+      const previous = queryClient.getQueryData<Document[]>(queryKeys.documents);
 
       // Оптимистично показываем документ
-      queryClient.setQueryData<Document[]>(['documents'], (old = []) => [
+      const tempId = 'temp-' + Date.now();
+      queryClient.setQueryData<Document[]>(queryKeys.documents, (old = []) => [
         {
           ...newDoc,
-          id: 'temp-' + Date.now(),
+          id: tempId,
           createdAt: new Date().toISOString(),
           updatedAt: new Date().toISOString(),
           userId: 'temp'
@@ -46,12 +48,12 @@ export function useDocuments() {
         ...old,
       ]);
 
-      return { previous };
+      return { previous, tempId };
     },
 
     onError: (err, newDoc, context) => {
       if (context?.previous) {
-        queryClient.setQueryData(['documents'], context.previous);
+        queryClient.setQueryData(queryKeys.documents, context.previous);
       }
 
       const message = err instanceof Error ? err.message : 'Failed to create document';
@@ -64,14 +66,20 @@ export function useDocuments() {
       }
     },
 
-    onSuccess: () => {
+    onSuccess: ({ demoStatus, ...document }, newDoc, context) => {
+      // Заменяем временную запись ответом сервера вместо повторной загрузки списка
+      queryClient.setQueryData<Document[]>(queryKeys.documents, (old = []) =>
+        old.map((doc) => (doc.id === context?.tempId ? document : doc))
+      );
+      queryClient.setQueryData(queryKeys.document(document.id), document);
+      markSearchStale(queryClient);
       toast.success('Документ создан');
-      // Обновляем также демо-статус
-      queryClient.invalidateQueries({ queryKey: ['user'] });
-    },
-
-    onSettled: () => {
-      queryClient.invalidateQueries({ queryKey: ['documents'] });
+      // Демо-статус приходит в ответе - обновляем кэш пользователя без повторного запроса профиля
+      if (demoStatus) {
+        queryClient.setQueryData<User | null>(queryKeys.user, (old) =>
+          old ? { ...old, demoStatus: { ...old.demoStatus, ...demoStatus } } : old
+        );
+      }
     },
   });
 
@@ -81,10 +89,10 @@ export function useDocuments() {
       api.put<Document>(`/api/documents/${id}`, data),
 
     onMutate: async ({ id, data }) => {
-      await queryClient.cancelQueries({ queryKey: ['documents'] });
-      const previous = queryClient.getQueryData<Document[]>(['documents']);
+      await queryClient.cancelQueries({ queryKey: queryKeys.documents, exact: true });
+      const previous = queryClient.getQueryData<Document[]>(queryKeys.documents);
 
-      queryClient.setQueryData<Document[]>(['documents'], (old = []) =>
+      queryClient.setQueryData<Document[]>(queryKeys.documents, (old = []) =>
         old.map((doc) => (doc.id === id ? { ...doc, ...data } : doc))
       );
 
@@ -93,19 +101,20 @@ export function useDocuments() {
 
     onError: (err, variables, context) => {
       if (context?.previous) {
-        queryClient.setQueryData(['documents'], context.previous);
+        queryClient.setQueryData(queryKeys.documents, context.previous);
       }
       const message = err instanceof Error ? err.message : 'Failed to update document';
       toast.error(message);
     },
 
-    onSuccess: () => {
+    onSuccess: (updated) => {
+      queryClient.setQueryData<Document[]>(queryKeys.documents, (old = []) =>
+        old.map((doc) => (doc.id === updated.id ? updated : doc))
+      );
+      queryClient.setQueryData(queryKeys.document(updated.id), updated);
+      markSearchStale(queryClient);
       toast.success('Документ обновлен');
     },
-
-    onSettled: () => {
-      queryClient.invalidateQueries({ queryKey: ['documents'] });
-    },
   });
 
   // Mutation для удаления
@@ -113,10 +122,10 @@ export function useDocuments() {
     mutationFn: (id: string) => api.delete(`/api/documents/${id}`),
 
     onMutate: async (id) => {
-      await queryClient.cancelQueries({ queryKey: ['documents'] });
-      const previous = queryClient.getQueryData<Document[]>(['documents']);
+      await queryClient.cancelQueries({ queryKey: queryKeys.documents, exact: true });
+      const previous = queryClient.getQueryData<Document[]>(queryKeys.documents);
 
-      queryClient.setQueryData<Document[]>(['documents'], (old = []) =>
+      queryClient.setQueryData<Document[]>(queryKeys.documents, (old = []) =>
         old.filter((doc) => doc.id !== id)
       );
 
@@ -125,19 +134,17 @@ export function useDocuments() {
 
     onError: (err, id, context) => {
       if (context?.previous) {
-        queryClient.setQueryData(['documents'], context.previous);
+        queryClient.setQueryData(queryKeys.documents, context.previous);
       }
       const message = err instanceof Error ? err.message : 'Failed to delete document';
       toast.error(message);
     },
 
-    onSuccess: () => {
+    onSuccess: (result, id) => {
+      queryClient.removeQueries({ queryKey: queryKeys.document(id) });
+      markSearchStale(queryClient);
       toast.success('Документ удален');
     },
-
-    onSettled: () => {
-      queryClient.invalidateQueries({ queryKey: ['documents'] });
-    },
   });
 
   const getById = (id: string) => {
@@ -153,6 +160,6 @@ export function useDocuments() {
       updateMutation.mutateAsync({ id, data }),
     deleteDocument: deleteMutation.mutateAsync,
     getById,
-    refresh: () => queryClient.invalidateQueries({ queryKey: ['documents'] }),
+    refresh: () => queryClient.invalidateQueries({ queryKey: queryKeys.documents }),
   };
 }
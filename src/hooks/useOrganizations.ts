@@ -1,5 +1,6 @@
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { api } from '@/lib/api-client';
+import { queryKeys, fetchOrganizations, markSearchStale } from '@/lib/queries';
 import type { Organization } from '@/lib/types';
 import { toast } from 'sonner';
 
@@ -12,8 +13,8 @@ export function useOrganizations() {
     isLoading,
     error: queryError,
   } = useQuery({
-    queryKey: ['organizations'],
-    queryFn: () => api.get<Organization[]>('/api/organizations'),
+    queryKey: queryKeys.organizations,
+    queryFn: fetchOrganizations,
   });
 
   const error = queryError instanceof Error ? queryError.message : null;
@@ -25,37 +26,38 @@ export function useOrganizations() {
 
     onMutate: async (newOrg) => {
       // Отменяем текущие запросы
-      await queryClient.cancelQueries({ queryKey: ['organizations'] });
+      await queryClient.cancelQueries({ queryKey: queryKeys.organizations });
 
       // Сохраняем предыдущее состояние
-      const previous = queryClient.getQueryData<Organization[]>(['organizations']);
+      const previous = queryClient.getQueryData<Organization[]>(queryKeys.organizations);
 
       // Оптимистично обновляем UI
-      queryClient.setQueryData<Organization[]>(['organizations'], (old = []) => [
-        { ...newOrg, id: 'temp-' + Date.now(), createdAt: new Date().toISOString(), updatedAt: new Date().toISOString() } as Organization,
+      const tempId = 'temp-' + Date.now();
+      queryClient.setQueryData<Organization[]>(queryKeys.organizations, (old = []) => [
+        { ...newOrg, id: tempId, createdAt: new Date().toISOString(), updatedAt: new Date().toISOString() } as Organization,
         ...old,
       ]);
 
-      return { previous };
+      return { previous, tempId };
     },
 
     onError: (err, newOrg, context) => {
       // Откатываем при ошибке
       if (context?.previous) {
-        queryClient.setQueryData(['organizations'], context.previous);
+        queryClient.setQueryData(queryKeys.organizations, context.previous);
       }
       const message = err instanceof Error ? err.message : 'Failed to create organization';
       toast.error(message);
     },
 
-    onSuccess: () => {
+    onSuccess: (created, newOrg, context) => {
+      // Заменяем временную запись ответом сервера вместо повторной загрузки списка
+      queryClient.setQueryData<Organization[]>(queryKeys.organizations, (old = []) =>
+        old.map((org) => (org.id === context?.tempId ? created : org))
+      );
+      markSearchStale(queryClient);
       toast.success('Организация создана');
     },
-
-    onSettled: () => {
-      // Рефетч для синхронизации с сервером
-      queryClient.invalidateQueries({ queryKey: ['organizations'] });
-    },
   });
 
   // Mutation для обновления
@@ -64,10 +66,10 @@ export function useOrganizations() {
       api.put<Organization>(`/api/organizations/${id}`, data),
 
     onMutate: async ({ id, data }) => {
-      await queryClient.cancelQueries({ queryKey: ['organizations'] });
-      const previous = queryClient.getQueryData<Organization[]>(['organizations']);
+      await queryClient.cancelQueries({ queryKey: queryKeys.organizations });
+      const previous = queryClient.getQueryData<Organization[]>(queryKeys.organizations);
 
-      queryClient.setQueryData<Organization[]>(['organizations'], (old = []) =>
+      queryClient.setQueryData<Organization[]>(queryKeys.organizations, (old = []) =>
         old.map((org) => (org.id === id ? { ...org, ...data } : org))
       );
 
@@ -76,19 +78,22 @@ export function useOrganizations() {
 
     onError: (err, variables, context) => {
       if (context?.previous) {
-        queryClient.setQueryData(['organizations'], context.previous);
+        queryClient.setQueryData(queryKeys.organizations, context.previous);
       }
       const message = err instanceof Error ? err.message : 'Failed to update organization';
       toast.error(message);
     },
 
-    onSuccess: () => {
+    onSuccess: (updated) => {
+      queryClient.setQueryData<Organization[]>(queryKeys.organizations, (old = []) =>
+        old.map((org) => (org.id === updated.id ? updated : org))
+      );
+      // Документы показывают название организации — помечаем устаревшими,
+      // перезагрузятся при следующем открытии списка документов
+      queryClient.invalidateQueries({ queryKey: queryKeys.documents, refetchType: 'none' });
+      markSearchStale(queryClient);
       toast.success('Организация обновлена');
     },
-
-    onSettled: () => {
-      queryClient.invalidateQueries({ queryKey: ['organizations'] });
-    },
   });
 
   // Mutation для удаления
@@ -96,10 +101,10 @@ export function useOrganizations() {
     mutationFn: (id: string) => api.delete(`/api/organizations/${id}`),
 
     onMutate: async (id) => {
-      await queryClient.cancelQueries({ queryKey: ['organizations'] });
-      const previous = queryClient.getQueryData<Organization[]>(['organizations']);
+      await queryClient.cancelQueries({ queryKey: queryKeys.organizations });
+      const previous = queryClient.getQueryData<Organization[]>(queryKeys.organizations);
 
-      queryClient.setQueryData<Organization[]>(['organizations'], (old = []) =>
+      queryClient.setQueryData<Organization[]>(queryKeys.organizations, (old = []) =>
         old.filter((org) => org.id !== id)
       );
 
@@ -108,19 +113,17 @@ export function useOrganizations() {
 
     onError: (err, id, context) => {
       if (context?.previous) {
-        queryClient.setQueryData(['organizations'], context.previous);
+        queryClient.setQueryData(queryKeys.organizations, context.previous);
       }
       const message = err instanceof Error ? err.message : 'Failed to delete organization';
       toast.error(message);
     },
 
     onSuccess: () => {
+      queryClient.invalidateQueries({ queryKey: queryKeys.documents, refetchType: 'none' });
+      markSearchStale(queryClient);
       toast.success('Организация удалена');
     },
-
-    onSettled: () => {
-      queryClient.invalidateQueries({ queryKey: ['organizations'] });
-    },
   });
 
   const getById = (id: string) => {
@@ -136,6 +139,6 @@ export function useOrganizations() {
       updateMutation.mutateAsync({ id, data }),
     deleteOrganization: deleteMutation.mutateAsync,
     getById,
-    refresh: () => queryClient.invalidateQueries({ queryKey: ['organizations'] }),
+    refresh: () => queryClient.invalidateQueries({ queryKey: queryKeys.organizations }),
   };
 }
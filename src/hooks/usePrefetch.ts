@@ -0,0 +1,34 @@
+import { useCallback } from 'react';
+import { useRouter } from 'next/navigation';
+import { useQueryClient } from '@tanstack/react-query';
+import { prefetchRouteData } from '@/lib/queries';
+
+/**
+ * Предзагрузка страницы при наведении на кнопку/ссылку перехода
+ *
+ * Использование: <Button {...prefetchOn('/docs')} onClick={() => router.push('/docs')}>
+ * Загружает код страницы (router.prefetch) и ее данные в кэш React Query.
+ */
+export function usePrefetch() {
+  const router = useRouter();
+  const queryClient = useQueryClient();
+
+  const prefetch = useCallback(
+    (href: string) => {
+      router.prefetch(href);
+      prefetchRouteData(queryClient, href);
+    },
+    [router, queryClient]
+  );
+
+  const prefetchOn = useCallback(
+    (href: string) => ({
+      onMouseEnter: () => prefetch(href),
+      onFocus: () => prefetch(href),
+      onTouchStart: () => prefetch(href),
+    }),
+    [prefetch]
+  );
+
+  return { prefetch, prefetchOn };
+}
@@ -0,0 +1,126 @@
+import { useEffect, useState } from 'react';
+import { useInfiniteQuery } from '@tanstack/react-query';
+import { api } from '@/lib/api-client';
+import { queryKeys } from '@/lib/queries';
+
+export interface DocumentSearchHit {
+  id: string;
+  title: string | null;
+  templateCode: string;
+  templateVersion: string;
+  organizationId: string | null;
+  createdAt: string;
+  updatedAt: string;
+  rank: number;
+  titleHighlight: string | null;
+  snippet: string | null;
+}
+
+export interface OrganizationSearchHit {
+  id: string;
+  name_full: string;
+  name_short: string | null;
+  inn: string;
+  kpp: string | null;
+  subject_type: string;
+  is_default: boolean;
+  rank: number;
+  highlight: {
+    name_full: string;
+    name_short: string | null;
+    inn: string;
+  };
+}
+
+interface SearchPage<T> {
+  items: T[];
+  total: number;
+  page: number;
+  pageSize: number;
+}
+
+interface SearchResponse {
+  query: string;
+  documents: SearchPage<DocumentSearchHit> | null;
+  organizations: SearchPage<OrganizationSearchHit> | null;
+}
+
+const MIN_QUERY_LENGTH = 2;
+const DEBOUNCE_MS = 300;
+
+/**
+ * Склеить загруженные страницы результатов одного типа
+ * total и pageSize берутся из последней страницы
+ */
+function mergePages<T>(pages: Array<SearchPage<T> | null>): SearchPage<T> | null {
+  const loaded = pages.filter((page): page is SearchPage<T> => page !== null);
+  if (loaded.length === 0) return null;
+
+  const last = loaded[loaded.length - 1];
+  return {
+    items: loaded.flatMap((page) => page.items),
+    total: last.total,
+    page: last.page,
+    pageSize: last.pageSize,
+  };
+}
+
+function hasMoreResults(page: SearchPage<unknown> | null): boolean {
+  return page !== null && page.page * page.pageSize < page.total;
+}
+
+/**
+ * Серверный поиск (GET /api/search) с debounce ввода
+ * Пока запрос короче 2 символов — поиск не выполняется (data = undefined)
+ *
+ * Результаты постраничные: documents/organizations содержат все загруженные
+ * страницы, следующая догружается через loadMore(), пока hasMore = true
+ */
+export function useSearch(
+  query: string,
+  type: 'all' | 'documents' | 'organizations' = 'all',
+  pageSize = 50
+) {
+  const [debouncedQuery, setDebouncedQuery] = useState(query.trim());
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedQuery(query.trim()), DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [query]);
+
+  const enabled = debouncedQuery.length >= MIN_QUERY_LENGTH;
+
+  const { data, isFetching, isFetchingNextPage, hasNextPage, fetchNextPage, error } = useInfiniteQuery({
+    queryKey: [...queryKeys.search, type, debouncedQuery, pageSize],
+    queryFn: ({ pageParam }) => {
+      const params = new URLSearchParams({
+        q: debouncedQuery,
+        type,
+        page: String(pageParam),
+        pageSize: String(pageSize),
+      });
+      return api.get<SearchResponse>(`/api/search?${params.toString()}`);
+    },
+    initialPageParam: 1,
+    getNextPageParam: (lastPage, _allPages, lastPageParam) =>
+      hasMoreResults(lastPage.documents) || hasMoreResults(lastPage.organizations)
+        ? lastPageParam + 1
+        : undefined,
+    enabled,
+    staleTime: 30 * 1000,
+  });
+
+  const pages = enabled ? data?.pages ?? [] : [];
+
+  return {
+    documents: mergePages(pages.map((page) => page.documents)),
+    organizations: mergePages(pages.map((page) => page.organizations)),
+    isSearching: enabled && isFetching && !isFetchingNextPage,
+    hasMore: enabled && hasNextPage,
+    isLoadingMore: enabled && isFetchingNextPage,
+    loadMore: () => {
+      if (hasNextPage && !isFetchingNextPage) void fetchNextPage();
+    },
+    error: error instanceof Error ? error.message : null,
+  };
+}
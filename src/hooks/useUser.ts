@@ -1,5 +1,6 @@
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { api, resetAuthState } from '@/lib/api-client';
+import { queryKeys, fetchCurrentUser } from '@/lib/queries';
 import { toast } from 'sonner';
 
 import type { User } from '@/lib/types/user';
@@ -13,17 +14,8 @@ export function useUser() {
     isLoading,
     error: queryError,
   } = useQuery<User | null>({
-    queryKey: ['user'],
-    queryFn: async () => {
-      try {
-        return await api.get<User>('/api/users/me', { skipAuthRedirect: true });
-      } catch (err) {
-        if (err && typeof err === 'object' && 'status' in err && (err as { status?: number }).status === 401) {
-          return null;
-        }
-        throw err;
-      }
-    },
+    queryKey: queryKeys.user,
+    queryFn: fetchCurrentUser,
     retry: false, // Не retry если не авторизован
   });
 
@@ -40,11 +32,11 @@ export function useUser() {
     }) => api.put<User>('/api/users/me', data),
 
     onMutate: async (newData) => {
-      await queryClient.cancelQueries({ queryKey: ['user'] });
-      const previous = queryClient.getQueryData<User>(['user']);
+      await queryClient.cancelQueries({ queryKey: queryKeys.user });
+      const previous = queryClient.getQueryData<User>(queryKeys.user);
 
       if (previous) {
-        queryClient.setQueryData<User>(['user'], {
+        queryClient.setQueryData<User>(queryKeys.user, {
           ...previous,
           ...newData,
         });
@@ -55,19 +47,17 @@ export function useUser() {
 
     onError: (err, newData, context) => {
       if (context?.previous) {
-        queryClient.setQueryData(['user'], context.previous);
+        queryClient.setQueryData(queryKeys.user, context.previous);
       }
       const message = err instanceof Error ? err.message : 'Failed to update profile';
       toast.error(message);
     },
 
-    onSuccess: () => {
+    onSuccess: (updated) => {
+      // Ответ сервера — актуальный профиль, повторный запрос не нужен
+      queryClient.setQueryData<User | null>(queryKeys.user, (old) => (old ? { ...old, ...updated } : updated));
       toast.success('Профиль обновлен');
     },
-
-    onSettled: () => {
-      queryClient.invalidateQueries({ queryKey: ['user'] });
-    },
   });
 
   const logoutMutation = useMutation({
@@ -91,7 +81,7 @@ export function useUser() {
     isLoading,
     error,
     updateProfile: updateMutation.mutateAsync,
-    refresh: () => queryClient.invalidateQueries({ queryKey: ['user'] }),
+    refresh: () => queryClient.invalidateQueries({ queryKey: queryKeys.user }),
     logout: logoutMutation.mutateAsync,
     isLoggingOut: logoutMutation.isPending,
   };
@@ -5,6 +5,10 @@ let refreshPromise: Promise<Response> | null = null;
 // CSRF token для защиты от CSRF атак
 let csrfToken: string | null = null;
 
+// Выполняющиеся GET запросы: одинаковые параллельные GET получают один общий promise
+// (например, несколько компонентов/страниц одновременно запрашивают /api/users/me)
+const inflightGetRequests = new Map<string, Promise<unknown>>();
+
 export type ApiClientOptions = RequestInit & {
   skipAuthRedirect?: boolean;
 };
@@ -75,6 +79,7 @@ export function resetAuthState() {
   csrfToken = null;
   isRefreshing = false;
   refreshPromise = null;
+  inflightGetRequests.clear();
 
   if (typeof sessionStorage !== 'undefined') {
     try {
@@ -254,12 +259,37 @@ export async function apiClient<T = any>(
   return data;
 }
 
+/**
+ * GET с дедупликацией: пока запрос к url выполняется, повторные вызовы
+ * получают тот же promise. Запросы с AbortSignal не объединяются —
+ * отмена одного вызова не должна отменять остальные
+ */
+function dedupedGet<T>(url: string, options: ApiClientOptions = {}): Promise<T> {
+  if (options.signal) {
+    return apiClient<T>(url, { ...options, method: 'GET' });
+  }
+
+  const key = `${options.skipAuthRedirect ? 'silent' : 'default'} ${url}`;
+  const existing = inflightGetRequests.get(key);
+  if (existing) {
+    return existing as Promise<T>;
+  }
+
+  const request: Promise<T> = apiClient<T>(url, { ...options, method: 'GET' }).finally(() => {
+    if (inflightGetRequests.get(key) === request) {
+      inflightGetRequests.delete(key);
+    }
+  });
+  inflightGetRequests.set(key, request);
+  return request;
+}
+
 /**
  * Типизированные методы для удобства
  */
 export const api = {
   get: <T = any>(url: string, options?: ApiClientOptions) =>
-    apiClient<T>(url, { ...(options ?? {}), method: 'GET' }),
+    dedupedGet<T>(url, options ?? {}),
 
   post: <T = any>(url: string, data?: any, options?: ApiClientOptions) =>
     apiClient<T>(url, {
@@ -1,6 +1,7 @@
 import { NextRequest } from 'next/server';
 import { prisma } from './prisma';
 import { getTokenFromRequest, verifyToken, REFRESH_TOKEN_TTL_MS } from './jwt';
+import type { RefreshTokenPayload } from './jwt';
 import crypto from 'crypto';
 
 /**
@@ -137,18 +138,14 @@ export async function checkDemoLimit(userId: string): Promise<boolean> {
 
 /**
  * Увеличить счётчик использованных документов
+ * Атомарный инкремент одним запросом (без read-modify-write)
+ * Для создания документа используйте createDocumentWithQuota() — там резерв квоты и вставка атомарны
  */
 export async function incrementDocumentUsage(userId: string) {
-  const demoStatus = await prisma.demoStatus.findUnique({
-    where: { userId },
-  });
-
-  if (!demoStatus) return;
-
-  await prisma.demoStatus.update({
+  await prisma.demoStatus.updateMany({
     where: { userId },
     data: {
-      documentsUsed: demoStatus.documentsUsed + 1,
+      documentsUsed: { increment: 1 },
     },
   });
 }
@@ -348,14 +345,16 @@ export async function getUsersForAccessManagement() {
 
 /**
  * Создать refresh токен в БД
+ * familyId — семейство ротации, с которым токен подписан (claim "fam")
  */
-export async function createRefreshTokenRecord(userId: string, token: string) {
+export async function createRefreshTokenRecord(userId: string, token: string, familyId: string) {
   const expiresAt = new Date(Date.now() + REFRESH_TOKEN_TTL_MS);
 
   return await prisma.refreshToken.create({
     data: {
       userId,
       token,
+      familyId,
       expiresAt,
     },
   });
@@ -397,6 +396,99 @@ export async function validateRefreshToken(token: string) {
   return refreshToken;
 }
 
+/**
+ * Ротация refresh токена одним SQL-запросом
+ *
+ * В одном statement (атомарно):
+ * 1. старый токен помечается отозванным, только если он не отозван, не истек
+ *    и email/роль пользователя совпадают с payload (параллельные запросы
+ *    с одним токеном не могут оба пройти ротацию);
+ * 2. новый токен вставляется в то же семейство ротации;
+ * 3. возвращаются данные пользователя.
+ *
+ * familyId — семейство, с которым подписан newToken (у вызывающего оно уже есть,
+ * повторно проверять только что подписанный JWT не нужно)
+ *
+ * null — ротация не выполнена; причину определяет getRefreshTokenRejectionReason
+ * (чтение из БД нужно только в этом редком случае)
+ */
+export async function rotateRefreshToken(
+  oldToken: string,
+  newToken: string,
+  familyId: string,
+  payload: RefreshTokenPayload
+): Promise<{ id: string; email: string; role: string } | null> {
+  const id = crypto.randomUUID();
+  const expiresAt = new Date(Date.now() + REFRESH_TOKEN_TTL_MS);
+
+  const rows = await prisma.$queryRaw<Array<{ id: string; email: string; role: string }>>`
+    WITH claimed AS (
+      UPDATE "RefreshToken" rt
+      SET "revoked" = true,
+          "revokedAt" = NOW()
+      FROM "User" u
+      WHERE rt."token" = ${oldToken}
+        AND rt."revoked" = false
+        AND rt."expiresAt" > NOW()
+        AND u."id" = rt."userId"
+        AND u."email" = ${payload.email}
+        AND u."role" = ${payload.role}
+      RETURNING rt."userId", u."email", u."role"
+    ),
+    inserted AS (
+      INSERT INTO "RefreshToken" ("id", "userId", "token", "familyId", "expiresAt", "revoked", "createdAt")
+      SELECT ${id}::text, c."userId", ${newToken}::text, ${familyId}::text, ${expiresAt}, false, NOW()
+      FROM claimed c
+      RETURNING "userId"
+    )
+    SELECT c."userId" AS id, c."email", c."role"
+    FROM claimed c
+    JOIN inserted i ON i."userId" = c."userId"
+  `;
+
+  return rows[0] ?? null;
+}
+
+// Повтор старого токена в течение этого окна считаем гонкой параллельных refresh
+// (например, две вкладки), а не кражей — семейство не отзывается
+const REFRESH_REUSE_GRACE_MS = 10 * 1000;
+
+export type RefreshTokenRejectionReason =
+  | 'token_not_found'
+  | 'token_expired'
+  | 'token_already_rotated'
+  | 'token_reused'
+  | 'user_data_changed';
+
+/**
+ * Проверить refresh токен по БД (медленный путь: только после неуспешной ротации)
+ * Возвращает причину отказа или null, если токен действителен
+ */
+export async function getRefreshTokenRejectionReason(
+  token: string,
+  payload: RefreshTokenPayload
+): Promise<RefreshTokenRejectionReason | null> {
+  const record = await prisma.refreshToken.findUnique({
+    where: { token },
+    select: {
+      revoked: true,
+      revokedAt: true,
+      expiresAt: true,
+      user: { select: { email: true, role: true } },
+    },
+  });
+
+  if (!record) return 'token_not_found';
+  if (record.revoked) {
+    const revokedAgoMs = record.revokedAt ? Date.now() - record.revokedAt.getTime() : Infinity;
+    // Отозванный токен предъявлен повторно — вероятна кража токена
+    return revokedAgoMs <= REFRESH_REUSE_GRACE_MS ? 'token_already_rotated' : 'token_reused';
+  }
+  if (record.expiresAt < new Date()) return 'token_expired';
+  if (record.user.email !== payload.email || record.user.role !== payload.role) return 'user_data_changed';
+  return null;
+}
+
 /**
  * Отозвать refresh токен
  */
@@ -410,6 +502,19 @@ export async function revokeRefreshToken(token: string) {
   });
 }
 
+/**
+ * Отозвать все токены семейства ротации (при повторном использовании токена)
+ */
+export async function revokeRefreshTokenFamily(familyId: string) {
+  await prisma.refreshToken.updateMany({
+    where: { familyId, revoked: false },
+    data: {
+      revoked: true,
+      revokedAt: new Date(),
+    },
+  });
+}
+
 /**
  * Отозвать все refresh токены пользователя
  */
@@ -97,6 +97,16 @@ export interface JWTPayload {
   role: string;
 }
 
+/**
+ * Payload refresh токена
+ * jti — уникальный id токена, fam — id семейства ротации
+ * (все токены, полученные из одного входа последовательной ротацией)
+ */
+export interface RefreshTokenPayload extends JWTPayload {
+  jti?: string;
+  fam?: string;
+}
+
 /**
  * Создать JWT токен
  */
@@ -178,10 +188,17 @@ export function clearTokenCookie(response: NextResponse): NextResponse {
 
 /**
  * Создать refresh токен
+ * familyId передается при ротации; без него начинается новое семейство (новый вход)
  */
-export function createRefreshToken(payload: JWTPayload): string {
+export function createRefreshToken(payload: JWTPayload, familyId?: string): string {
   const token = jwt.sign(
-    payload,
+    {
+      userId: payload.userId,
+      email: payload.email,
+      role: payload.role,
+      jti: crypto.randomUUID(),
+      fam: familyId ?? crypto.randomUUID(),
+    },
     JWT_REFRESH_SECRET,
     {
       expiresIn: JWT_REFRESH_EXPIRES_IN,
@@ -194,9 +211,9 @@ export function createRefreshToken(payload: JWTPayload): string {
 /**
  * Проверить и декодировать refresh токен
  */
-export function verifyRefreshToken(token: string): JWTPayload | null {
+export function verifyRefreshToken(token: string): RefreshTokenPayload | null {
   try {
-    const decoded = jwt.verify(token, JWT_REFRESH_SECRET) as JWTPayload;
+    const decoded = jwt.verify(token, JWT_REFRESH_SECRET) as RefreshTokenPayload;
     return decoded;
   } catch (error) {
     if (process.env.NODE_ENV === 'development') {
@@ -0,0 +1,80 @@
+import type { QueryClient } from '@tanstack/react-query';
+import { api } from '@/lib/api-client';
+import type { Document, Organization, User } from '@/lib/types';
+
+/**
+ * Общие ключи и загрузчики React Query
+ *
+ * Хуки (useUser, useOrganizations, useDocuments) и предзагрузка при наведении
+ * используют одни и те же ключи и queryFn — поэтому предзагруженные данные
+ * подхватываются страницей без повторного запроса.
+ */
+
+export const queryKeys = {
+  user: ['user'] as const,
+  organizations: ['organizations'] as const,
+  documents: ['documents'] as const,
+  document: (id: string) => ['documents', 'detail', id] as const,
+  search: ['search'] as const,
+};
+
+/**
+ * Пометить результаты поиска устаревшими после изменения документов/организаций
+ * Без немедленного запроса: перезагрузятся при следующем поиске
+ */
+export function markSearchStale(queryClient: QueryClient): void {
+  void queryClient.invalidateQueries({ queryKey: queryKeys.search, refetchType: 'none' });
+}
+
+export async function fetchCurrentUser(): Promise<User | null> {
+  try {
+    return await api.get<User>('/api/users/me', { skipAuthRedirect: true });
+  } catch (err) {
+    if (err && typeof err === 'object' && 'status' in err && (err as { status?: number }).status === 401) {
+      return null;
+    }
+    throw err;
+  }
+}
+
+export function fetchOrganizations(): Promise<Organization[]> {
+  return api.get<Organization[]>('/api/organizations');
+}
+
+export function fetchDocuments(): Promise<Document[]> {
+  return api.get<Document[]>('/api/documents');
+}
+
+export function fetchDocument(id: string): Promise<Document> {
+  return api.get<Document>(`/api/documents/${id}`);
+}
+
+/**
+ * Предзагрузить данные страницы перед переходом (наведение/фокус на ссылке)
+ * prefetchQuery не делает запрос, если в кэше уже есть свежие данные
+ */
+export function prefetchRouteData(queryClient: QueryClient, href: string): void {
+  const path = href.split('?')[0];
+
+  if (path === '/docs') {
+    void queryClient.prefetchQuery({ queryKey: queryKeys.documents, queryFn: fetchDocuments });
+    void queryClient.prefetchQuery({ queryKey: queryKeys.organizations, queryFn: fetchOrganizations });
+    return;
+  }
+
+  if (path === '/org' || path.startsWith('/org/')) {
+    void queryClient.prefetchQuery({ queryKey: queryKeys.organizations, queryFn: fetchOrganizations });
+    return;
+  }
+
+  const documentMatch = /^\/doc\/([^/]+)/.exec(path);
+  if (documentMatch) {
+    const id = documentMatch[1];
+    void queryClient.prefetchQuery({ queryKey: queryKeys.document(id), queryFn: () => fetchDocument(id) });
+    return;
+  }
+
+  if (path === '/profile') {
+    void queryClient.prefetchQuery({ queryKey: queryKeys.user, queryFn: fetchCurrentUser });
+  }
+}
@@ -0,0 +1,30 @@
+import { z } from 'zod';
+
+/**
+ * Схема query-параметров поиска (GET /api/search)
+ */
+export const searchQuerySchema = z.object({
+  q: z.string()
+    .trim()
+    .min(2, 'Поисковый запрос должен содержать минимум 2 символа')
+    .max(200, 'Поисковый запрос не может превышать 200 символов'),
+
+  type: z.enum(['all', 'documents', 'organizations']).default('all'),
+
+  page: z.coerce.number().int().min(1).default(1),
+
+  pageSize: z.coerce.number().int().min(1).max(50).default(20),
+
+  organizationId: z.string().uuid().optional(),
+
+  templateCode: z.string().max(50).optional(),
+
+  createdFrom: z.coerce.date().optional(),
+
+  createdTo: z.coerce.date().optional(),
+});
+
+/**
+ * Тип параметров поиска
+ */
+export type SearchQueryInput = z.infer<typeof searchQuerySchema>;
@@ -1,4 +1,4 @@
-import { NextRequest } from 'next/server';
+import { NextRequest, after } from 'next/server';
 import { prisma } from './prisma';
 import { getIP } from './rate-limit';
 
@@ -71,6 +71,92 @@ export async function logSecurityEventFromRequest(
   });
 }
 
+/**
+ * Отложенная пакетная запись security событий
+ *
+ * Для горячих путей (например, /api/auth/refresh): событие кладется в очередь
+ * без ожидания БД, а очередь сбрасывается одним createMany через after() —
+ * уже после отправки ответа, но в рамках жизненного цикла запроса
+ * (на serverless инстанс не замораживается до завершения записи).
+ * События параллельных запросов попадают в один пакет.
+ *
+ * Критичные события (например, suspicious_activity) записывайте через
+ * logSecurityEvent с await — они не должны теряться.
+ */
+
+// Защита памяти, если БД недоступна долгое время
+const SECURITY_LOG_MAX_QUEUE = 10_000;
+
+const globalForSecurityLog = globalThis as unknown as {
+  securityLogQueue: SecurityLogEntry[] | undefined;
+};
+
+function getSecurityLogQueue(): SecurityLogEntry[] {
+  if (!globalForSecurityLog.securityLogQueue) {
+    globalForSecurityLog.securityLogQueue = [];
+  }
+  return globalForSecurityLog.securityLogQueue;
+}
+
+/**
+ * Записать накопленные security события одним запросом
+ */
+export async function flushSecurityEvents(): Promise<void> {
+  const queue = getSecurityLogQueue();
+  const batch = queue.splice(0, queue.length);
+  if (batch.length === 0) {
+    return;
+  }
+
+  try {
+    await prisma.securityLog.createMany({
+      data: batch.map((entry) => ({
+        userId: entry.userId || null,
+        event: entry.event,
+        ip: entry.ip,
+        userAgent: entry.userAgent || null,
+        email: entry.email || null,
+        metadata: entry.metadata ?? undefined,
+      })),
+    });
+  } catch (error) {
+    // Не должно падать приложение если логирование не удалось
+    console.error(`Failed to log ${batch.length} security events:`, error);
+  }
+}
+
+/**
+ * Поставить security событие в очередь и сбросить ее после ответа (after)
+ * Вызывать только внутри обработчика запроса
+ */
+export function queueSecurityEvent(entry: SecurityLogEntry): void {
+  const queue = getSecurityLogQueue();
+  queue.push(entry);
+
+  if (queue.length > SECURITY_LOG_MAX_QUEUE) {
+    queue.splice(0, queue.length - SECURITY_LOG_MAX_QUEUE);
+  }
+
+  // Если очередь уже сбросил другой запрос, этот вызов ничего не запишет
+  after(flushSecurityEvents);
+}
+
+/**
+ * Поставить security событие из NextRequest в очередь на пакетную запись
+ */
+export function queueSecurityEventFromRequest(
+  request: NextRequest,
+  event: SecurityEventType,
+  additionalData?: Partial<SecurityLogEntry>
+): void {
+  queueSecurityEvent({
+    event,
+    ip: getIP(request),
+    userAgent: request.headers.get('user-agent') || undefined,
+    ...additionalData,
+  });
+}
+
 /**
  * Получить security логи пользователя (для админов)
  */
@@ -0,0 +1,277 @@
+import { promises as fs } from 'fs';
+import path from 'path';
+import { validateBankKS } from '@/lib/utils/validators';
+
+/**
+ * Локальный справочник банков по БИК
+ *
+ * Источник — файл BANK_DIRECTORY_PATH (по умолчанию data/bik.csv):
+ * - CSV/TSV: "bik;name;ks[;city]" (строка заголовка необязательна)
+ * - XML: справочник БИК ЦБ РФ в формате ED807 (можно в windows-1251)
+ *
+ * Файл загружается в память один раз на процесс (Map по БИК → O(1) поиск)
+ * и перечитывается, если изменилось время модификации файла.
+ * Если файла нет — справочник пуст и проверки по нему пропускаются
+ * (в логе предупреждение в любом окружении). Файл включается в серверные
+ * функции через outputFileTracingIncludes в next.config.js.
+ */
+
+export interface BankInfo {
+  bik: string;
+  name: string;
+  ks: string;
+  city?: string;
+}
+
+interface BankDirectory {
+  byBik: Map<string, BankInfo>;
+  // Отсортировано по БИК — для автодополнения по префиксу бинарным поиском
+  sorted: BankInfo[];
+  mtimeMs: number;
+  loadedAt: number;
+}
+
+const DIRECTORY_PATH = path.resolve(
+  process.env.BANK_DIRECTORY_PATH ?? path.join(process.cwd(), 'data', 'bik.csv')
+);
+
+// Как часто проверять mtime файла для горячей перезагрузки
+const RELOAD_CHECK_INTERVAL_MS = 30 * 1000;
+
+const EMPTY_DIRECTORY: BankDirectory = {
+  byBik: new Map(),
+  sorted: [],
+  mtimeMs: 0,
+  loadedAt: 0,
+};
+
+const globalForBanks = globalThis as unknown as {
+  bankDirectory: BankDirectory | undefined;
+};
+
+let loadingPromise: Promise<BankDirectory> | null = null;
+let lastCheckAt = 0;
+// Предупреждение об отсутствии файла — один раз, а не на каждой проверке mtime
+let missingFileReported = false;
+
+function decodeDirectoryFile(buffer: Buffer): string {
+  const prolog = buffer.subarray(0, 200).toString('latin1');
+  const encoding = /encoding="([^"]+)"/i.exec(prolog)?.[1]?.toLowerCase();
+  if (encoding && encoding !== 'utf-8' && encoding !== 'utf8') {
+    return new TextDecoder(encoding).decode(buffer);
+  }
+  return buffer.toString('utf-8').replace(/^\uFEFF/, '');
+}
+
+function parseCsvDirectory(text: string): BankInfo[] {
+  const banks: BankInfo[] = [];
+
+  for (const line of text.split(/\r?\n/)) {
+    const cells = line.split(line.includes('\t') ? '\t' : ';').map((cell) => cell.trim().replace(/^"|"$/g, ''));
+    const [bik, name, ks, city] = cells;
+    // Пропускаем заголовок и мусорные строки
+    if (!/^\d{9}$/.test(bik ?? '') || !name) continue;
+    banks.push({ bik, name, ks: ks ?? '', city: city || undefined });
+  }
+
+  return banks;
+}
+
+function parseEd807Directory(xml: string): BankInfo[] {
+  const banks: BankInfo[] = [];
+  const attr = (source: string, name: string) =>
+    new RegExp(`\\b${name}="([^"]*)"`).exec(source)?.[1];
+
+  const entryPattern = /<(?:\w+:)?BICDirectoryEntry\b([^>]*)>([\s\S]*?)<\/(?:\w+:)?BICDirectoryEntry>/g;
+  for (const [, entryAttrs, body] of xml.matchAll(entryPattern)) {
+    const bik = attr(entryAttrs, 'BIC');
+    const participant = /<(?:\w+:)?ParticipantInfo\b([^>]*)/.exec(body)?.[1] ?? '';
+    const name = attr(participant, 'NameP');
+    if (!bik || !name) continue;
+
+    // Корсчет — счет с типом CRSA; у подразделений ЦБ (РКЦ) корсчета нет
+    let ks = '';
+    for (const [, accountAttrs] of body.matchAll(/<(?:\w+:)?Accounts\b([^>]*)/g)) {
+      if (attr(accountAttrs, 'RegulationAccountType') === 'CRSA') {
+        ks = attr(accountAttrs, 'Account') ?? '';
+        break;
+      }
+    }
+
+    banks.push({
+      bik,
+      name: name.replace(/&quot;/g, '"').replace(/&amp;/g, '&'),
+      ks,
+      city: attr(participant, 'Nnp') || undefined,
+    });
+  }
+
+  return banks;
+}
+
+async function readDirectory(): Promise<BankDirectory> {
+  let stat;
+  try {
+    stat = await fs.stat(DIRECTORY_PATH);
+  } catch {
+    if (!missingFileReported) {
+      missingFileReported = true;
+      console.warn(
+        `[Bank Directory] Файл справочника БИК не найден: ${DIRECTORY_PATH}. `
+        + 'Автозаполнение банка недоступно, корсчет проверяется только по контрольной сумме'
+      );
+    }
+    return { ...EMPTY_DIRECTORY, loadedAt: Date.now() };
+  }
+  missingFileReported = false;
+
+  const current = globalForBanks.bankDirectory;
+  if (current && current.mtimeMs === stat.mtimeMs) {
+    return current;
+  }
+
+  const text = decodeDirectoryFile(await fs.readFile(DIRECTORY_PATH));
+  const banks = DIRECTORY_PATH.toLowerCase().endsWith('.xml')
+    ? parseEd807Directory(text)
+    : parseCsvDirectory(text);
+
+  const byBik = new Map<string, BankInfo>();
+  for (const bank of banks) {
+    byBik.set(bank.bik, bank);
+  }
+
+  const directory: BankDirectory = {
+    byBik,
+    sorted: [...byBik.values()].sort((a, b) => a.bik.localeCompare(b.bik)),
+    mtimeMs: stat.mtimeMs,
+    loadedAt: Date.now(),
+  };
+
+  if (process.env.NODE_ENV !== 'production') {
+    console.log(`🏦 Bank directory loaded: ${byBik.size} entries from ${DIRECTORY_PATH}`);
+  }
+
+  return directory;
+}
+
+/**
+ * Загрузить справочник (или перечитать, если файл изменился)
+ * Повторные вызовы в пределах RELOAD_CHECK_INTERVAL_MS не обращаются к диску
+ */
+export async function loadBankDirectory(): Promise<void> {
+  const now = Date.now();
+  if (globalForBanks.bankDirectory && now - lastCheckAt < RELOAD_CHECK_INTERVAL_MS) {
+    return;
+  }
+
+  if (!loadingPromise) {
+    lastCheckAt = now;
+    loadingPromise = readDirectory()
+      .then((directory) => {
+        globalForBanks.bankDirectory = directory;
+        return directory;
+      })
+      .catch((error) => {
+        console.error('[Bank Directory] Ошибка загрузки справочника БИК:', error);
+        return globalForBanks.bankDirectory ?? EMPTY_DIRECTORY;
+      })
+      .finally(() => {
+        loadingPromise = null;
+      });
+  }
+
+  await loadingPromise;
+}
+
+/**
+ * Найти банк по БИК в уже загруженном справочнике (синхронно)
+ * Для горячих путей (массовый импорт) после одного await loadBankDirectory()
+ */
+export function findBankByBikSync(bik: string): BankInfo | null {
+  return globalForBanks.bankDirectory?.byBik.get(bik) ?? null;
+}
+
+/**
+ * Найти банк по БИК
+ */
+export async function getBankByBik(bik: string): Promise<BankInfo | null> {
+  await loadBankDirectory();
+  return findBankByBikSync(bik);
+}
+
+/**
+ * Автодополнение: по префиксу БИК (бинарный поиск) или по подстроке в названии
+ */
+export async function searchBanks(query: string, limit = 10): Promise<BankInfo[]> {
+  await loadBankDirectory();
+  const directory = globalForBanks.bankDirectory ?? EMPTY_DIRECTORY;
+  const trimmed = query.trim();
+  if (!trimmed) return [];
+
+  if (/^\d+$/.test(trimmed)) {
+    const { sorted } = directory;
+    let low = 0;
+    let high = sorted.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (sorted[mid].bik < trimmed) low = mid + 1;
+      else high = mid;
+    }
+
+    const results: BankInfo[] = [];
+    for (let i = low; i < sorted.length && results.length < limit; i++) {
+      if (!sorted[i].bik.startsWith(trimmed)) break;
+      results.push(sorted[i]);
+    }
+    return results;
+  }
+
+  const lower = trimmed.toLowerCase();
+  const results: BankInfo[] = [];
+  for (const bank of directory.sorted) {
+    if (bank.name.toLowerCase().includes(lower)) {
+      results.push(bank);
+      if (results.length >= limit) break;
+    }
+  }
+  return results;
+}
+
+/**
+ * Проверить банковские реквизиты по справочнику (синхронно, справочник должен быть загружен)
+ * Если БИК есть в справочнике — корсчет должен совпадать с ним, иначе проверяется
+ * контрольная сумма корсчета. Возвращает ошибки в формате { field, message }
+ */
+export function checkBankRequisites(data: { bank_bik?: string; bank_ks?: string }): Array<{ field: string; message: string }> {
+  const { bank_bik: bik, bank_ks: ks } = data;
+  if (!bik || !ks) return [];
+
+  const bank = findBankByBikSync(bik);
+  if (bank) {
+    // У подразделений ЦБ (РКЦ) корсчета нет — сверять не с чем
+    if (!bank.ks || bank.ks === ks) return [];
+    return [{ field: 'bank_ks', message: `Корреспондентский счёт не соответствует БИК (по справочнику: ${bank.ks})` }];
+  }
+
+  if (!validateBankKS(bik, ks)) {
+    return [{ field: 'bank_ks', message: 'Неверная контрольная сумма корреспондентского счёта для указанного БИК' }];
+  }
+
+  return [];
+}
+
+/**
+ * Дополнить пустые bank_name / bank_ks данными справочника
+ */
+export function fillBankRequisites<T extends { bank_bik?: unknown; bank_name?: unknown; bank_ks?: unknown }>(data: T): T {
+  if (typeof data.bank_bik !== 'string') return data;
+
+  const bank = findBankByBikSync(data.bank_bik.trim());
+  if (!bank) return data;
+
+  return {
+    ...data,
+    bank_name: data.bank_name || bank.name,
+    bank_ks: data.bank_ks || bank.ks || undefined,
+  };
+}
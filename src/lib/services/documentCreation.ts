@@ -0,0 +1,163 @@
+import crypto from 'crypto';
+import { prisma } from '@/lib/prisma';
+import type { CreateDocumentInput } from '@/lib/schemas/document';
+
+/**
+ * Создание документа одним SQL-запросом
+ *
+ * В одном statement (а значит, атомарно):
+ * 1. резервируется демо-квота условным UPDATE
+ *    ("documentsUsed" < "documentsLimit" проверяется и увеличивается под блокировкой строки,
+ *    поэтому параллельные запросы не могут превысить лимит);
+ * 2. при пустом bodyText подставляется previewText шаблона;
+ * 3. вставляется документ и возвращается вместе с организацией и состоянием квоты.
+ *
+ * Если квота не зарезервирована — документ не вставляется (status: 'demo_limit_exceeded').
+ */
+
+export interface DemoQuotaState {
+  documentsUsed: number;
+  documentsLimit: number;
+  isActive: boolean;
+}
+
+export interface CreatedDocument {
+  id: string;
+  title: string | null;
+  templateCode: string;
+  templateVersion: string;
+  bodyText: string | null;
+  requisites: unknown;
+  hasBodyChat: boolean;
+  createdAt: Date;
+  updatedAt: Date;
+  organizationId: string | null;
+  organization: { id: string; name_full: string; name_short: string | null; inn: string } | null;
+}
+
+export type CreateDocumentResult =
+  | { status: 'created'; document: CreatedDocument; demoStatus: DemoQuotaState | null }
+  | { status: 'demo_limit_exceeded' };
+
+export async function createDocumentWithQuota(
+  userId: string,
+  input: CreateDocumentInput,
+  { reserveDemoQuota }: { reserveDemoQuota: boolean }
+): Promise<CreateDocumentResult> {
+  const id = crypto.randomUUID();
+  const bodyText = input.bodyText && input.bodyText.trim().length > 0 ? input.bodyText : null;
+  const requisites = input.requisites ? JSON.stringify(input.requisites) : null;
+
+  const rows = await prisma.$queryRaw<Array<{
+    id: string;
+    title: string | null;
+    templateCode: string;
+    templateVersion: string;
+    bodyText: string | null;
+    requisites: unknown;
+    hasBodyChat: boolean;
+    createdAt: Date;
+    updatedAt: Date;
+    organizationId: string | null;
+    org_name_full: string | null;
+    org_name_short: string | null;
+    org_inn: string | null;
+    quota_used: number | null;
+    quota_limit: number | null;
+  }>>`
+    WITH quota AS (
+      UPDATE "DemoStatus"
+      SET "documentsUsed" = "documentsUsed" + 1,
+          "updatedAt" = NOW()
+      WHERE "userId" = ${userId}
+        AND ${reserveDemoQuota}::boolean
+        AND "isActive" = true
+        AND "documentsUsed" < "documentsLimit"
+      RETURNING "documentsUsed", "documentsLimit"
+    ),
+    allowed AS (
+      SELECT 1 AS ok
+      WHERE NOT ${reserveDemoQuota}::boolean OR EXISTS (SELECT 1 FROM quota)
+    ),
+    inserted AS (
+      INSERT INTO "Document" (
+        "id", "userId", "organizationId", "title", "templateCode", "templateVersion",
+        "bodyText", "requisites", "hasBodyChat", "createdAt", "updatedAt"
+      )
+      SELECT
+        ${id}::text,
+        ${userId}::text,
+        ${input.organizationId ?? null}::text,
+        ${input.title || null}::text,
+        ${input.templateCode}::text,
+        ${input.templateVersion}::text,
+        COALESCE(
+          ${bodyText}::text,
+          (
+            SELECT tb."previewText"
+            FROM "TemplateBody" tb
+            WHERE tb."templateCode" = ${input.templateCode}
+              AND btrim(tb."previewText", E' \\t\\r\\n') <> ''
+          )
+        ),
+        ${requisites}::jsonb,
+        ${input.hasBodyChat ?? false}::boolean,
+        NOW(),
+        NOW()
+      FROM allowed
+      RETURNING *
+    )
+    SELECT
+      i."id",
+      i."title",
+      i."templateCode",
+      i."templateVersion",
+      i."bodyText",
+      i."requisites",
+      i."hasBodyChat",
+      i."createdAt",
+      i."updatedAt",
+      i."organizationId",
+      o."name_full" AS org_name_full,
+      o."name_short" AS org_name_short,
+      o."inn" AS org_inn,
+      q."documentsUsed" AS quota_used,
+      q."documentsLimit" AS quota_limit
+    FROM inserted i
+    LEFT JOIN "Organization" o ON o."id" = i."organizationId"
+    LEFT JOIN quota q ON true
+  `;
+
+  if (rows.length === 0) {
+    return { status: 'demo_limit_exceeded' };
+  }
+
+  const row = rows[0];
+
+  return {
+    status: 'created',
+    document: {
+      id: row.id,
+      title: row.title,
+      templateCode: row.templateCode,
+      templateVersion: row.templateVersion,
+      bodyText: row.bodyText,
+      requisites: row.requisites,
+      hasBodyChat: row.hasBodyChat,
+      createdAt: row.createdAt,
+      updatedAt: row.updatedAt,
+      organizationId: row.organizationId,
+      organization: row.organizationId && row.org_name_full
+        ? {
+            id: row.organizationId,
+            name_full: row.org_name_full,
+            name_short: row.org_name_short,
+            inn: row.org_inn ?? '',
+          }
+        : null,
+    },
+    demoStatus: row.quota_used !== null && row.quota_limit !== null
+      ? { documentsUsed: row.quota_used, documentsLimit: row.quota_limit, isActive: true }
+      : null,
+  };
+}
@@ -63,7 +63,8 @@ export async function generateDocumentText(
       { role: 'user', content: userPrompt }
     ];
 
-    const response = await fetch('https://api.openai.com/v1/chat/completions', {
+    const baseUrl = (process.env.OPENAI_BASE_URL || 'https://api.openai.com/v1').replace(/\/+$/, '');
+    const response = await fetch(`${baseUrl}/chat/completions`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
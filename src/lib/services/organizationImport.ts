@@ -0,0 +1,493 @@
+import PizZip from 'pizzip';
+import { prisma } from '@/lib/prisma';
+import { createOrganizationSchema, type CreateOrganizationInput } from '@/lib/schemas/organization';
+import { checkBankRequisites, fillBankRequisites, loadBankDirectory } from '@/lib/services/bankDirectory';
+
+/**
+ * Массовый импорт организаций из CSV/XLSX
+ *
+ * Строки читаются потоково (CSV) и обрабатываются пачками по IMPORT_BATCH_SIZE:
+ * автозаполнение банка по БИК → валидация (включая сверку со справочником банков) → дедупликация по ИНН (в файле и среди организаций пользователя,
+ * один findMany на пачку по @@index([inn])) → createMany.
+ */
+
+// Размер пачки: одна проверка дубликатов и один createMany на пачку
+export const IMPORT_BATCH_SIZE = 500;
+
+// Ограничения на файл
+export const MAX_IMPORT_ROWS = 20000;
+const MAX_REPORTED_ERRORS = 1000;
+
+export class OrganizationImportError extends Error {}
+
+export interface ImportRowError {
+  row: number;
+  field: string;
+  message: string;
+}
+
+export interface ImportReport {
+  dryRun: boolean;
+  totalRows: number;
+  imported: number;
+  duplicates: number;
+  invalid: number;
+  truncated: boolean;
+  errors: ImportRowError[];
+  durationMs: number;
+  rowsPerSecond: number;
+}
+
+type ImportField = keyof CreateOrganizationInput;
+
+/**
+ * Заголовки колонок → поля организации
+ * Поддерживаются имена полей API и типовые русские заголовки
+ */
+const HEADER_ALIASES: Record<string, ImportField> = {
+  'тип субъекта': 'subject_type',
+  'тип': 'subject_type',
+  'полное наименование': 'name_full',
+  'наименование': 'name_full',
+  'краткое наименование': 'name_short',
+  'инн': 'inn',
+  'кпп': 'kpp',
+  'огрн': 'ogrn',
+  'огрнип': 'ogrnip',
+  'окпо': 'okpo',
+  'оквэд': 'okved',
+  'юридический адрес': 'address_legal',
+  'почтовый адрес': 'address_postal',
+  'телефон': 'phone',
+  'e-mail': 'email',
+  'эл. почта': 'email',
+  'сайт': 'website',
+  'должность руководителя': 'head_title',
+  'фио руководителя': 'head_fio',
+  'основание полномочий': 'authority_base',
+  'номер доверенности': 'poa_number',
+  'дата доверенности': 'poa_date',
+  'бик': 'bank_bik',
+  'банк': 'bank_name',
+  'наименование банка': 'bank_name',
+  'корр. счет': 'bank_ks',
+  'корреспондентский счет': 'bank_ks',
+  'кс': 'bank_ks',
+  'расчетный счет': 'bank_rs',
+  'рс': 'bank_rs',
+  'примечание о печати': 'seal_note',
+  'заметки': 'notes',
+};
+
+const IMPORT_FIELDS: ImportField[] = [
+  'subject_type', 'name_full', 'name_short', 'inn', 'kpp', 'ogrn', 'ogrnip', 'okpo', 'okved',
+  'address_legal', 'address_postal', 'phone', 'email', 'website',
+  'head_title', 'head_fio', 'authority_base', 'poa_number', 'poa_date',
+  'bank_bik', 'bank_name', 'bank_ks', 'bank_rs', 'seal_note', 'notes',
+];
+
+// Реквизиты из цифр. Excel хранит их в числовых ячейках: ведущие нули
+// теряются, а длинные числа (счета, ИНН) превращаются в экспоненциальную
+// запись (4,07028E+19) с потерей цифр — восстановить такое значение нельзя
+const DIGIT_FIELDS: ImportField[] = ['inn', 'kpp', 'ogrn', 'ogrnip', 'okpo', 'bank_bik', 'bank_ks', 'bank_rs'];
+const EXPONENT_NUMBER = /^\d+(?:[.,]\d+)?e[+-]?\d+$/i;
+
+const SUBJECT_TYPE_ALIASES: Record<string, 'legal_entity' | 'sole_proprietor'> = {
+  'legal_entity': 'legal_entity',
+  'юл': 'legal_entity',
+  'юридическое лицо': 'legal_entity',
+  'sole_proprietor': 'sole_proprietor',
+  'ип': 'sole_proprietor',
+  'индивидуальный предприниматель': 'sole_proprietor',
+};
+
+function normalizeHeader(header: string): string {
+  return header.trim().toLowerCase().replace(/ё/g, 'е').replace(/\s+/g, ' ');
+}
+
+/**
+ * Сопоставить заголовки файла с полями организации
+ */
+export function mapImportHeaders(headers: string[]): Array<ImportField | null> {
+  const mapping = headers.map((header) => {
+    const normalized = normalizeHeader(header);
+    if ((IMPORT_FIELDS as string[]).includes(normalized)) {
+      return normalized as ImportField;
+    }
+    return HEADER_ALIASES[normalized] ?? null;
+  });
+
+  const missing = (['name_full', 'inn'] as ImportField[]).filter((field) => !mapping.includes(field));
+  if (missing.length > 0) {
+    throw new OrganizationImportError(
+      `В файле нет обязательных колонок: ${missing.join(', ')}`
+    );
+  }
+
+  return mapping;
+}
+
+/**
+ * Собрать объект организации из строки файла
+ * Пустой тип субъекта определяется по длине ИНН, пустое основание — «Устава»
+ */
+function buildRowInput(mapping: Array<ImportField | null>, cells: string[]): Record<string, unknown> {
+  const input: Record<string, unknown> = {};
+
+  mapping.forEach((field, index) => {
+    if (!field) return;
+    const value = (cells[index] ?? '').trim();
+    if (value !== '') {
+      input[field] = value;
+    }
+  });
+
+  // БИК всегда 9 цифр и начинается с 0 — из числовой ячейки он приходит без ведущего нуля
+  if (typeof input.bank_bik === 'string' && /^\d{8}$/.test(input.bank_bik)) {
+    input.bank_bik = input.bank_bik.padStart(9, '0');
+  }
+
+  const subjectType = typeof input.subject_type === 'string'
+    ? SUBJECT_TYPE_ALIASES[normalizeHeader(input.subject_type)] ?? input.subject_type
+    : undefined;
+  const innLength = typeof input.inn === 'string' ? input.inn.replace(/\s/g, '').length : 0;
+  input.subject_type = subjectType ?? (innLength === 12 ? 'sole_proprietor' : 'legal_entity');
+
+  if (!input.authority_base) {
+    input.authority_base = 'Устава';
+  }
+
+  // Организацию по умолчанию через импорт не назначаем
+  input.is_default = false;
+
+  // Пустые наименование банка и корсчет берем из справочника БИК
+  return fillBankRequisites(input);
+}
+
+/**
+ * Найти реквизиты, испорченные экспоненциальной записью числовой ячейки
+ */
+function findExponentValues(input: Record<string, unknown>): Array<Omit<ImportRowError, 'row'>> {
+  return DIGIT_FIELDS
+    .filter((field) => typeof input[field] === 'string' && EXPONENT_NUMBER.test(input[field] as string))
+    .map((field) => ({
+      field,
+      message: `Значение ${input[field]} записано в экспоненциальной форме, цифры потеряны. `
+        + 'Задайте колонке текстовый формат и введите значение заново',
+    }));
+}
+
+function isBlankRow(cells: string[]): boolean {
+  return cells.every((cell) => cell.trim() === '');
+}
+
+/**
+ * Потоковый разбор CSV (RFC 4180: кавычки, "" внутри кавычек, переводы строк в полях)
+ * Разделитель (; , или табуляция) определяется по первой строке
+ */
+export async function* iterateCsvRecords(stream: ReadableStream<Uint8Array>): AsyncGenerator<string[]> {
+  const reader = stream.getReader();
+  const decoder = new TextDecoder('utf-8');
+
+  let delimiter: string | null = null;
+  let pending = '';
+  let field = '';
+  let record: string[] = [];
+  let inQuotes = false;
+  let isFirstChunk = true;
+
+  const detectDelimiter = (sample: string) => {
+    const firstLine = sample.split(/\r?\n/, 1)[0];
+    const counts = [';', ',', '\t'].map((d) => [d, firstLine.split(d).length - 1] as const);
+    counts.sort((a, b) => b[1] - a[1]);
+    return counts[0][1] > 0 ? counts[0][0] : ';';
+  };
+
+  while (true) {
+    const { done, value } = await reader.read();
+    pending += done ? decoder.decode() : decoder.decode(value, { stream: true });
+
+    if (isFirstChunk) {
+      if (!done && !/\r?\n/.test(pending)) continue; // ждем целую первую строку
+      pending = pending.replace(/^\uFEFF/, '');
+      isFirstChunk = false;
+    }
+    delimiter ??= detectDelimiter(pending);
+
+    let i = 0;
+    for (; i < pending.length; i++) {
+      const ch = pending[i];
+
+      if (inQuotes) {
+        if (ch === '"') {
+          if (i + 1 >= pending.length && !done) break; // неизвестно, экранированная ли это кавычка
+          if (pending[i + 1] === '"') {
+            field += '"';
+            i++;
+          } else {
+            inQuotes = false;
+          }
+        } else {
+          field += ch;
+        }
+        continue;
+      }
+
+      if (ch === '"') {
+        inQuotes = true;
+      } else if (ch === delimiter) {
+        record.push(field);
+        field = '';
+      } else if (ch === '\n' || ch === '\r') {
+        if (ch === '\r' && i + 1 >= pending.length && !done) break; // \r\n может быть разорван между чанками
+        if (ch === '\r' && pending[i + 1] === '\n') i++;
+        record.push(field);
+        field = '';
+        yield record;
+        record = [];
+      } else {
+        field += ch;
+      }
+    }
+    pending = pending.slice(i);
+
+    if (done) break;
+  }
+
+  if (field !== '' || record.length > 0) {
+    record.push(field);
+    yield record;
+  }
+}
+
+function decodeXmlEntities(value: string): string {
+  return value
+    .replace(/&#x([0-9a-f]+);/gi, (_, hex) => String.fromCodePoint(Number.parseInt(hex, 16)))
+    .replace(/&#(\d+);/g, (_, dec) => String.fromCodePoint(Number.parseInt(dec, 10)))
+    .replace(/&lt;/g, '<')
+    .replace(/&gt;/g, '>')
+    .replace(/&quot;/g, '"')
+    .replace(/&apos;/g, "'")
+    .replace(/&amp;/g, '&');
+}
+
+function extractText(xml: string): string {
+  let text = '';
+  for (const match of xml.matchAll(/<t(?:\s[^>]*)?>([\s\S]*?)<\/t>/g)) {
+    text += match[1];
+  }
+  return decodeXmlEntities(text);
+}
+
+function columnIndex(cellRef: string): number {
+  const letters = cellRef.replace(/\d+$/, '');
+  let index = 0;
+  for (const letter of letters) {
+    index = index * 26 + (letter.charCodeAt(0) - 64);
+  }
+  return index - 1;
+}
+
+/**
+ * Разбор первого листа XLSX (без внешних зависимостей — XLSX это zip с XML)
+ */
+export function* iterateXlsxRecords(buffer: ArrayBuffer): Generator<string[]> {
+  const zip = new PizZip(buffer);
+
+  const sheetFile = zip.file('xl/worksheets/sheet1.xml')
+    ?? zip.file(/^xl\/worksheets\/sheet\d+\.xml$/)[0];
+  if (!sheetFile) {
+    throw new OrganizationImportError('В XLSX файле не найден лист с данными');
+  }
+
+  const sharedStrings: string[] = [];
+  const sharedStringsXml = zip.file('xl/sharedStrings.xml')?.asText();
+  if (sharedStringsXml) {
+    for (const match of sharedStringsXml.matchAll(/<si>([\s\S]*?)<\/si>/g)) {
+      sharedStrings.push(extractText(match[1]));
+    }
+  }
+
+  const sheetXml = sheetFile.asText();
+  for (const rowMatch of sheetXml.matchAll(/<row\b[^>]*?(?:\/>|>([\s\S]*?)<\/row>)/g)) {
+    const cells: string[] = [];
+
+    for (const cellMatch of (rowMatch[1] ?? '').matchAll(/<c\b([^>]*?)(?:\/>|>([\s\S]*?)<\/c>)/g)) {
+      const attrs = cellMatch[1];
+      const content = cellMatch[2] ?? '';
+      const ref = /\br="([A-Z]+\d+)"/.exec(attrs)?.[1];
+      const type = /\bt="(\w+)"/.exec(attrs)?.[1];
+      const rawValue = /<v>([\s\S]*?)<\/v>/.exec(content)?.[1];
+
+      let value = '';
+      if (type === 's' && rawValue !== undefined) {
+        value = sharedStrings[Number.parseInt(rawValue, 10)] ?? '';
+      } else if (type === 'inlineStr') {
+        value = extractText(content);
+      } else if (rawValue !== undefined) {
+        value = decodeXmlEntities(rawValue);
+      }
+
+      const index = ref ? columnIndex(ref) : cells.length;
+      while (cells.length < index) cells.push('');
+      cells[index] = value;
+    }
+
+    yield cells;
+  }
+}
+
+/**
+ * Импортировать организации пользователя из последовательности строк файла
+ * Первая строка — заголовки. При dryRun только валидация и поиск дубликатов,
+ * imported в отчете — сколько строк было бы импортировано
+ */
+export async function importOrganizations(
+  userId: string,
+  records: AsyncIterable<string[]> | Iterable<string[]>,
+  { dryRun = false }: { dryRun?: boolean } = {}
+): Promise<ImportReport> {
+  const startedAt = Date.now();
+
+  const report: ImportReport = {
+    dryRun,
+    totalRows: 0,
+    imported: 0,
+    duplicates: 0,
+    invalid: 0,
+    truncated: false,
+    errors: [],
+    durationMs: 0,
+    rowsPerSecond: 0,
+  };
+
+  const addError = (error: ImportRowError) => {
+    if (report.errors.length < MAX_REPORTED_ERRORS) {
+      report.errors.push(error);
+    }
+  };
+
+  // Справочник БИК загружаем один раз — дальше проверки банка синхронные, в памяти
+  await loadBankDirectory();
+
+  const seenInns = new Set<string>();
+  let mapping: Array<ImportField | null> | null = null;
+  let batch: Array<{ row: number; cells: string[] }> = [];
+  let rowNumber = 0;
+
+  const flushBatch = async () => {
+    if (batch.length === 0 || !mapping) return;
+
+    // 1. Валидация пачки
+    const valid: Array<{ row: number; data: CreateOrganizationInput }> = [];
+    for (const { row, cells } of batch) {
+      const input = buildRowInput(mapping, cells);
+
+      const exponentErrors = findExponentValues(input);
+      if (exponentErrors.length > 0) {
+        report.invalid++;
+        for (const exponentError of exponentErrors) {
+          addError({ row, ...exponentError });
+        }
+        continue;
+      }
+
+      const result = createOrganizationSchema.safeParse(input);
+      if (!result.success) {
+        report.invalid++;
+        for (const issue of result.error.issues) {
+          addError({ row, field: issue.path.join('.'), message: issue.message });
+        }
+        continue;
+      }
+
+      const bankErrors = checkBankRequisites(result.data);
+      if (bankErrors.length > 0) {
+        report.invalid++;
+        for (const bankError of bankErrors) {
+          addError({ row, ...bankError });
+        }
+        continue;
+      }
+
+      valid.push({ row, data: result.data });
+    }
+
+    // 2. Дубликаты внутри файла
+    const unique = valid.filter(({ row, data }) => {
+      if (seenInns.has(data.inn)) {
+        report.duplicates++;
+        addError({ row, field: 'inn', message: `ИНН ${data.inn} повторяется в файле` });
+        return false;
+      }
+      seenInns.add(data.inn);
+      return true;
+    });
+
+    // 3. Дубликаты среди уже существующих организаций (один запрос на пачку)
+    const existing = unique.length > 0
+      ? await prisma.organization.findMany({
+          where: { userId, inn: { in: unique.map(({ data }) => data.inn) } },
+          select: { inn: true },
+        })
+      : [];
+    const existingInns = new Set(existing.map((org) => org.inn));
+
+    const toInsert = unique.filter(({ row, data }) => {
+      if (existingInns.has(data.inn)) {
+        report.duplicates++;
+        addError({ row, field: 'inn', message: `Организация с ИНН ${data.inn} уже существует` });
+        return false;
+      }
+      return true;
+    });
+
+    // 4. Вставка одной командой на пачку
+    if (!dryRun && toInsert.length > 0) {
+      const { count } = await prisma.organization.createMany({
+        data: toInsert.map(({ data }) => ({ userId, ...data })),
+      });
+      report.imported += count;
+    } else if (dryRun) {
+      report.imported += toInsert.length;
+    }
+
+    batch = [];
+  };
+
+  for await (const cells of records) {
+    rowNumber++;
+
+    if (!mapping) {
+      mapping = mapImportHeaders(cells);
+      continue;
+    }
+
+    if (isBlankRow(cells)) continue;
+
+    if (report.totalRows >= MAX_IMPORT_ROWS) {
+      report.truncated = true;
+      break;
+    }
+
+    report.totalRows++;
+    batch.push({ row: rowNumber, cells });
+
+    if (batch.length >= IMPORT_BATCH_SIZE) {
+      await flushBatch();
+    }
+  }
+
+  if (!mapping) {
+    throw new OrganizationImportError('Файл пуст');
+  }
+
+  await flushBatch();
+
+  report.durationMs = Date.now() - startedAt;
+  report.rowsPerSecond = report.durationMs > 0
+    ? Math.round((report.totalRows / report.durationMs) * 1000)
+    : report.totalRows;
+
+  return report;
+}
@@ -0,0 +1,443 @@
+import { Prisma } from '@prisma/client';
+import { prisma } from '@/lib/prisma';
+
+/**
+ * Серверный поиск по документам и организациям пользователя
+ *
+ * Документы: полнотекстовый поиск PostgreSQL (конфигурация 'russian', стемминг)
+ * по title + bodyText. Организации: триграммный поиск (pg_trgm) по
+ * name_full / name_short / inn.
+ *
+ * Документы ищутся по генерируемой колонке "searchVector" (tsvector, STORED),
+ * чтобы не разбирать bodyText каждой строки при каждом запросе.
+ * Индексы описаны в prisma/sql/search_indexes.sql и создаются/обслуживаются
+ * через maintainSearchIndexes() (POST /api/admin/search/maintenance).
+ */
+
+// Маркеры подсветки совпадений. Клиент должен рендерить текст между ними
+// как обычный текст (НЕ через dangerouslySetInnerHTML)
+export const HIGHLIGHT_START = '<mark>';
+export const HIGHLIGHT_END = '</mark>';
+
+// Максимум слов в поисковом запросе (защита от тяжелых tsquery)
+const MAX_QUERY_TERMS = 8;
+
+// Генерируемая колонка, проиндексирована "Document_searchVector_idx"
+const DOCUMENT_TSVECTOR = Prisma.sql`d."searchVector"`;
+
+const HEADLINE_TITLE_OPTIONS = `StartSel=${HIGHLIGHT_START}, StopSel=${HIGHLIGHT_END}, HighlightAll=true`;
+const HEADLINE_BODY_OPTIONS = `StartSel=${HIGHLIGHT_START}, StopSel=${HIGHLIGHT_END}, MaxFragments=2, MaxWords=20, MinWords=5, FragmentDelimiter=" … "`;
+
+/**
+ * Индексы поиска: имя → DDL (идемпотентно, без транзакции — CONCURRENTLY)
+ * Синхронизировано с prisma/sql/search_indexes.sql
+ *
+ * Генерируемую колонку "searchVector" здесь НЕ создаем: ALTER TABLE ... STORED
+ * переписывает всю таблицу под ACCESS EXCLUSIVE — это шаг деплоя (SQL-скрипт)
+ */
+export const SEARCH_INDEX_STATEMENTS: Record<string, string> = {
+  Document_searchVector_idx: `CREATE INDEX CONCURRENTLY IF NOT EXISTS "Document_searchVector_idx" ON "Document" USING GIN ("searchVector")`,
+  Organization_name_full_trgm_idx: `CREATE INDEX CONCURRENTLY IF NOT EXISTS "Organization_name_full_trgm_idx" ON "Organization" USING GIN ("name_full" gin_trgm_ops)`,
+  Organization_name_short_trgm_idx: `CREATE INDEX CONCURRENTLY IF NOT EXISTS "Organization_name_short_trgm_idx" ON "Organization" USING GIN ("name_short" gin_trgm_ops)`,
+  Organization_inn_trgm_idx: `CREATE INDEX CONCURRENTLY IF NOT EXISTS "Organization_inn_trgm_idx" ON "Organization" USING GIN ("inn" gin_trgm_ops)`,
+};
+
+const SEARCH_GIN_INDEXES = Object.keys(SEARCH_INDEX_STATEMENTS);
+
+export interface SearchPagination {
+  page: number;
+  pageSize: number;
+}
+
+export interface SearchPage<T> {
+  items: T[];
+  total: number;
+  page: number;
+  pageSize: number;
+}
+
+export interface DocumentSearchFilters {
+  organizationId?: string;
+  templateCode?: string;
+  createdFrom?: Date;
+  createdTo?: Date;
+}
+
+export interface DocumentSearchHit {
+  id: string;
+  title: string | null;
+  templateCode: string;
+  templateVersion: string;
+  organizationId: string | null;
+  organization: { id: string; name_full: string; name_short: string | null; inn: string } | null;
+  createdAt: Date;
+  updatedAt: Date;
+  rank: number;
+  titleHighlight: string | null;
+  snippet: string | null;
+}
+
+export interface OrganizationSearchHit {
+  id: string;
+  name_full: string;
+  name_short: string | null;
+  inn: string;
+  kpp: string | null;
+  subject_type: string;
+  is_default: boolean;
+  rank: number;
+  highlight: {
+    name_full: string;
+    name_short: string | null;
+    inn: string;
+  };
+}
+
+/**
+ * Разбить запрос на слова (буквы/цифры), отбросив спецсимволы tsquery
+ */
+export function tokenizeSearchQuery(query: string): string[] {
+  return (query.toLowerCase().match(/[\p{L}\p{N}]+/gu) ?? []).slice(0, MAX_QUERY_TERMS);
+}
+
+/**
+ * Построить префиксный tsquery: "ромаш пост" → "ромаш:* & пост:*"
+ * Префикс нужен для поиска по мере ввода (стемминг не сводит "ромаш" к "ромашк")
+ */
+export function buildPrefixTsQuery(query: string): string | null {
+  const terms = tokenizeSearchQuery(query);
+  if (terms.length === 0) return null;
+  return terms.map((term) => `${term}:*`).join(' & ');
+}
+
+/**
+ * Экранировать спецсимволы LIKE (%, _, \)
+ */
+function escapeLike(value: string): string {
+  return value.replace(/[\\%_]/g, (ch) => `\\${ch}`);
+}
+
+/**
+ * Подсветить вхождения слов запроса в строке маркерами HIGHLIGHT_START/END
+ */
+export function highlightTerms(text: string, terms: string[]): string {
+  if (!text || terms.length === 0) return text;
+
+  const pattern = new RegExp(
+    `(${terms.map((t) => t.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|')})`,
+    'giu'
+  );
+  return text.replace(pattern, `${HIGHLIGHT_START}$1${HIGHLIGHT_END}`);
+}
+
+/**
+ * Полнотекстовый поиск по документам пользователя
+ * Ранжирование: ts_rank_cd, затем дата создания
+ */
+export async function searchDocuments(
+  userId: string,
+  query: string,
+  { page, pageSize }: SearchPagination,
+  filters: DocumentSearchFilters = {}
+): Promise<SearchPage<DocumentSearchHit>> {
+  const tsQuery = buildPrefixTsQuery(query);
+  if (!tsQuery) {
+    return { items: [], total: 0, page, pageSize };
+  }
+
+  const conditions: Prisma.Sql[] = [
+    Prisma.sql`d."userId" = ${userId}`,
+    Prisma.sql`${DOCUMENT_TSVECTOR} @@ q.query`,
+  ];
+  if (filters.organizationId) {
+    conditions.push(Prisma.sql`d."organizationId" = ${filters.organizationId}`);
+  }
+  if (filters.templateCode) {
+    conditions.push(Prisma.sql`d."templateCode" = ${filters.templateCode}`);
+  }
+  if (filters.createdFrom) {
+    conditions.push(Prisma.sql`d."createdAt" >= ${filters.createdFrom}`);
+  }
+  if (filters.createdTo) {
+    conditions.push(Prisma.sql`d."createdAt" <= ${filters.createdTo}`);
+  }
+
+  const offset = (page - 1) * pageSize;
+
+  // Сначала выбираем страницу id по рангу, и только для нее считаем ts_headline —
+  // подсветка дорогая, считать ее для всех совпадений нельзя.
+  // total считается отдельно от LIMIT/OFFSET: LEFT JOIN LATERAL возвращает строку
+  // с total (и id = NULL) даже для страницы за последней
+  const rows = await prisma.$queryRaw<Array<{
+    id: string | null;
+    title: string | null;
+    templateCode: string;
+    templateVersion: string;
+    organizationId: string | null;
+    createdAt: Date;
+    updatedAt: Date;
+    rank: number;
+    total: bigint;
+    titleHighlight: string | null;
+    snippet: string | null;
+    org_name_full: string | null;
+    org_name_short: string | null;
+    org_inn: string | null;
+  }>>`
+    WITH q AS (
+      SELECT to_tsquery('russian', ${tsQuery}) AS query
+    ),
+    matches_all AS (
+      SELECT d."id",
+             d."createdAt",
+             ts_rank_cd(${DOCUMENT_TSVECTOR}, q.query) AS rank
+      FROM "Document" d, q
+      WHERE ${Prisma.join(conditions, ' AND ')}
+    ),
+    total AS (
+      SELECT count(*) AS total FROM matches_all
+    ),
+    matches AS (
+      SELECT "id", rank
+      FROM matches_all
+      ORDER BY rank DESC, "createdAt" DESC
+      LIMIT ${pageSize} OFFSET ${offset}
+    )
+    SELECT t.total, p.*
+    FROM total t
+    LEFT JOIN LATERAL (
+      SELECT d."id",
+             d."title",
+             d."templateCode",
+             d."templateVersion",
+             d."organizationId",
+             d."createdAt",
+             d."updatedAt",
+             m.rank::float8 AS rank,
+             CASE WHEN d."title" IS NULL THEN NULL
+                  ELSE ts_headline('russian', d."title", q.query, ${HEADLINE_TITLE_OPTIONS})
+             END AS "titleHighlight",
+             CASE WHEN d."bodyText" IS NULL THEN NULL
+                  ELSE ts_headline('russian', d."bodyText", q.query, ${HEADLINE_BODY_OPTIONS})
+             END AS snippet,
+             o."name_full" AS org_name_full,
+             o."name_short" AS org_name_short,
+             o."inn" AS org_inn
+      FROM matches m
+      JOIN "Document" d ON d."id" = m."id"
+      CROSS JOIN q
+      LEFT JOIN "Organization" o ON o."id" = d."organizationId"
+    ) p ON true
+    ORDER BY p.rank DESC NULLS LAST, p."createdAt" DESC
+  `;
+
+  const total = rows.length > 0 ? Number(rows[0].total) : 0;
+  const hits = rows.filter((row): row is typeof row & { id: string } => row.id !== null);
+
+  return {
+    items: hits.map((row) => ({
+      id: row.id,
+      title: row.title,
+      templateCode: row.templateCode,
+      templateVersion: row.templateVersion,
+      organizationId: row.organizationId,
+      organization: row.organizationId && row.org_name_full
+        ? {
+            id: row.organizationId,
+            name_full: row.org_name_full,
+            name_short: row.org_name_short,
+            inn: row.org_inn ?? '',
+          }
+        : null,
+      createdAt: row.createdAt,
+      updatedAt: row.updatedAt,
+      rank: Number(row.rank),
+      titleHighlight: row.titleHighlight,
+      snippet: row.snippet,
+    })),
+    total,
+    page,
+    pageSize,
+  };
+}
+
+/**
+ * Триграммный поиск по организациям пользователя
+ * Совпадение по подстроке в наименованиях, по префиксу ИНН, либо нечеткое (%) по name_full
+ */
+export async function searchOrganizations(
+  userId: string,
+  query: string,
+  { page, pageSize }: SearchPagination
+): Promise<SearchPage<OrganizationSearchHit>> {
+  const trimmed = query.trim();
+  const terms = tokenizeSearchQuery(trimmed);
+  if (terms.length === 0) {
+    return { items: [], total: 0, page, pageSize };
+  }
+
+  const pattern = `%${escapeLike(trimmed)}%`;
+  const digits = trimmed.replace(/\D/g, '');
+  const innPrefix = digits.length >= 3 ? `${digits}%` : null;
+  const offset = (page - 1) * pageSize;
+
+  // total — по всем совпадениям, а не по странице (см. searchDocuments)
+  const rows = await prisma.$queryRaw<Array<{
+    id: string | null;
+    name_full: string;
+    name_short: string | null;
+    inn: string;
+    kpp: string | null;
+    subject_type: string;
+    is_default: boolean;
+    rank: number;
+    total: bigint;
+  }>>`
+    WITH matches_all AS (
+      SELECT o."id",
+             o."name_full",
+             o."name_short",
+             o."inn",
+             o."kpp",
+             o."subject_type",
+             o."is_default",
+             o."createdAt",
+             GREATEST(
+               similarity(o."name_full", ${trimmed}),
+               similarity(coalesce(o."name_short", ''), ${trimmed}),
+               CASE WHEN ${innPrefix}::text IS NOT NULL AND o."inn" LIKE ${innPrefix} THEN 1 ELSE 0 END
+             )::float8 AS rank
+      FROM "Organization" o
+      WHERE o."userId" = ${userId}
+        AND (
+          o."name_full" ILIKE ${pattern}
+          OR o."name_short" ILIKE ${pattern}
+          OR (${innPrefix}::text IS NOT NULL AND o."inn" LIKE ${innPrefix})
+          OR o."name_full" % ${trimmed}
+        )
+    ),
+    total AS (
+      SELECT count(*) AS total FROM matches_all
+    )
+    SELECT t.total, p.*
+    FROM total t
+    LEFT JOIN LATERAL (
+      SELECT *
+      FROM matches_all
+      ORDER BY rank DESC, "createdAt" DESC
+      LIMIT ${pageSize} OFFSET ${offset}
+    ) p ON true
+    ORDER BY p.rank DESC NULLS LAST, p."createdAt" DESC
+  `;
+
+  const total = rows.length > 0 ? Number(rows[0].total) : 0;
+  const hits = rows.filter((row): row is typeof row & { id: string } => row.id !== null);
+
+  return {
+    items: hits.map((row) => ({
+      id: row.id,
+      name_full: row.name_full,
+      name_short: row.name_short,
+      inn: row.inn,
+      kpp: row.kpp,
+      subject_type: row.subject_type,
+      is_default: row.is_default,
+      rank: Number(row.rank),
+      highlight: {
+        name_full: highlightTerms(row.name_full, terms),
+        name_short: row.name_short ? highlightTerms(row.name_short, terms) : null,
+        inn: digits ? highlightTerms(row.inn, [digits]) : row.inn,
+      },
+    })),
+    total,
+    page,
+    pageSize,
+  };
+}
+
+/**
+ * Индексы поиска, оставшиеся невалидными (indisvalid = false)
+ * Так бывает, если CREATE INDEX CONCURRENTLY прервали: индекс существует,
+ * IF NOT EXISTS его пропускает, но планировщик им не пользуется
+ */
+async function findInvalidSearchIndexes(): Promise<string[]> {
+  const rows = await prisma.$queryRaw<Array<{ name: string }>>`
+    SELECT c.relname AS name
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = current_schema()
+      AND c.relname IN (${Prisma.join(SEARCH_GIN_INDEXES)})
+      AND NOT i.indisvalid
+  `;
+  return rows.map((row) => row.name);
+}
+
+/**
+ * Создана ли "searchVector" генерируемой колонкой (prisma/sql/search_indexes.sql)
+ */
+async function isSearchVectorGenerated(): Promise<boolean> {
+  const rows = await prisma.$queryRaw<Array<{ generated: boolean }>>`
+    SELECT is_generated = 'ALWAYS' AS generated
+    FROM information_schema.columns
+    WHERE table_schema = current_schema()
+      AND table_name = 'Document'
+      AND column_name = 'searchVector'
+  `;
+  return rows[0]?.generated ?? false;
+}
+
+/**
+ * Обслуживание индексов поиска (только для админа)
+ * - пересоздает невалидные индексы (прерванный CREATE INDEX CONCURRENTLY)
+ * - создает недостающие индексы (CONCURRENTLY, без блокировки записи)
+ * - сбрасывает pending list GIN-индексов в основное дерево
+ *   (при fastupdate=on большой pending list замедляет поиск)
+ * - обновляет статистику планировщика
+ *
+ * Если "searchVector" еще не генерируемая колонка, индекс документов не
+ * трогаем и возвращаем searchVectorReady = false: нужен SQL-скрипт деплоя
+ */
+export async function maintainSearchIndexes() {
+  const startedAt = Date.now();
+
+  await prisma.$executeRawUnsafe(`CREATE EXTENSION IF NOT EXISTS pg_trgm`);
+
+  const searchVectorReady = await isSearchVectorGenerated();
+  const indexes = SEARCH_GIN_INDEXES.filter(
+    (indexName) => searchVectorReady || indexName !== 'Document_searchVector_idx'
+  );
+
+  const rebuilt = (await findInvalidSearchIndexes()).filter((indexName) => indexes.includes(indexName));
+  for (const indexName of rebuilt) {
+    await prisma.$executeRawUnsafe(`DROP INDEX CONCURRENTLY IF EXISTS "${indexName}"`);
+  }
+
+  for (const indexName of indexes) {
+    await prisma.$executeRawUnsafe(SEARCH_INDEX_STATEMENTS[indexName]);
+  }
+
+  // Повторная проверка: сборка могла снова не завершиться
+  const invalid = await findInvalidSearchIndexes();
+
+  const pendingCleaned: Record<string, number> = {};
+  for (const indexName of indexes.filter((name) => !invalid.includes(name))) {
+    const result = await prisma.$queryRawUnsafe<Array<{ cleaned: bigint }>>(
+      `SELECT gin_clean_pending_list('"${indexName}"'::regclass) AS cleaned`
+    );
+    pendingCleaned[indexName] = Number(result[0]?.cleaned ?? 0);
+  }
+
+  await prisma.$executeRawUnsafe(`ANALYZE "Document"`);
+  await prisma.$executeRawUnsafe(`ANALYZE "Organization"`);
+
+  return {
+    healthy: searchVectorReady && invalid.length === 0,
+    searchVectorReady,
+    indexes,
+    rebuilt,
+    invalid,
+    pendingCleaned,
+    durationMs: Date.now() - startedAt,
+  };
+}
@@ -71,13 +71,13 @@ export function validateOGRNIP(ogrnip: string): boolean {
 
 /**
  * Проверка счета с БИК (корреспондентский)
- * Строка: '0' + bik[6:8] + ks (23 цифры)
+ * Строка: '0' + bik[4:6] + ks (23 цифры)
  * Веса по циклу [7,1,3], Σ(d*w) % 10 == 0
  */
 export function validateBankKS(bik: string, ks: string): boolean {
   if (!/^\d{9}$/.test(bik) || !/^\d{20}$/.test(ks)) return false;
 
-  const controlStr = '0' + bik.slice(6, 9) + ks;
+  const controlStr = '0' + bik.slice(4, 6) + ks;
   const weights = [7, 1, 3];
   let sum = 0;
 
@@ -9,7 +9,10 @@ export function QueryProvider({ children }: { children: React.ReactNode }) {
       new QueryClient({
         defaultOptions: {
           queries: {
+            // Stale-while-revalidate: при открытии страницы сразу показываем кэш,
+            // а устаревшие (старше staleTime) данные обновляем в фоне
             staleTime: 60 * 1000, // 1 минута
+            gcTime: 10 * 60 * 1000, // Кэш неиспользуемых запросов живет 10 минут между переходами
             refetchOnWindowFocus: false,
             retry: 1,
           },
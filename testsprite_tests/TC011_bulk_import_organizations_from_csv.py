@@ -0,0 +1,133 @@
+import uuid
+
+import requests
+
+from standins.client import fetch_login_code, mailbox_available
+
+BASE_URL = "http://localhost:3000"
+TIMEOUT = 60
+
+CSV_HEADER = "name_full;inn;kpp;ogrn;address_legal;email;head_title;head_fio;bank_bik;bank_name;bank_ks;bank_rs"
+
+VALID_ROW = ";".join([
+    '"ООО ""Ромашка"""',
+    "7707083893",
+    "773601001",
+    "1027700132195",
+    "г. Москва, ул. Вавилова, д. 19",
+    "info@romashka.ru",
+    "Генеральный директор",
+    "Иванов Иван Иванович",
+    "044525225",
+    "ПАО Сбербанк",
+    "30101810400000000225",
+    "40702810938000000001",
+])
+
+INVALID_INN_ROW = VALID_ROW.replace("7707083893", "123", 1)
+
+# Значения после Excel: БИК без ведущего нуля (строка валидна после дополнения нулем)
+# и счет в экспоненциальной записи (строка отклоняется)
+EXCEL_BIK_ROW = VALID_ROW.replace("7707083893", "7728168971", 1).replace("044525225", "44525225", 1)
+EXCEL_EXPONENT_ROW = VALID_ROW.replace("40702810938000000001", "4,07028E+19", 1)
+
+
+def build_csv(rows):
+    return ("\r\n".join([CSV_HEADER] + rows) + "\r\n").encode("utf-8")
+
+
+def test_bulk_import_organizations_from_csv():
+    # Unauthorized access: a valid CSRF pair passes the CSRF check, no session cookies
+    csrf_only = "0" * 64
+    response = requests.post(
+        f"{BASE_URL}/api/organizations/import",
+        files={"file": ("orgs.csv", build_csv([VALID_ROW]), "text/csv")},
+        cookies={"csrf-token": csrf_only},
+        headers={"x-csrf-token": csrf_only},
+        timeout=TIMEOUT,
+    )
+    assert response.status_code == 401, f"Expected 401 Unauthorized, got {response.status_code}"
+
+    # Requires the stand-in stack (python -m standins): the login code is read from the SMTP sink.
+    # A fresh user has no organizations, so duplicates are only the in-file ones
+    assert mailbox_available(), "SMTP sink is not running: start it with `python -m standins`"
+    test_email = f"org-import-{uuid.uuid4().hex[:8]}@example.com"
+
+    session = requests.Session()
+    send_code_resp = session.post(f"{BASE_URL}/api/auth/send-code", json={"email": test_email}, timeout=TIMEOUT)
+    assert send_code_resp.status_code == 200
+    test_code = fetch_login_code(test_email)
+
+    verify_resp = session.post(
+        f"{BASE_URL}/api/auth/verify-code",
+        json={"email": test_email, "code": test_code},
+        timeout=TIMEOUT
+    )
+    assert verify_resp.status_code == 200
+    csrf_token = verify_resp.json().get("csrfToken")
+    assert csrf_token, "verify-code must return a CSRF token"
+    headers_auth = {"x-csrf-token": csrf_token}
+
+    # Unsupported file format
+    response = session.post(
+        f"{BASE_URL}/api/organizations/import",
+        files={"file": ("orgs.txt", b"name_full;inn", "text/plain")},
+        headers=headers_auth,
+        timeout=TIMEOUT,
+    )
+    assert response.status_code == 400, f"Expected 400 for unsupported format, got {response.status_code}"
+
+    # Missing required columns
+    response = session.post(
+        f"{BASE_URL}/api/organizations/import",
+        files={"file": ("orgs.csv", b"foo;bar\r\n1;2\r\n", "text/csv")},
+        headers=headers_auth,
+        timeout=TIMEOUT,
+    )
+    assert response.status_code == 400, f"Expected 400 for missing columns, got {response.status_code}"
+
+    # Dry run: valid row, in-file duplicate, invalid INN
+    response = session.post(
+        f"{BASE_URL}/api/organizations/import",
+        files={"file": ("orgs.csv", build_csv([VALID_ROW, VALID_ROW, INVALID_INN_ROW]), "text/csv")},
+        data={"dryRun": "true"},
+        headers=headers_auth,
+        timeout=TIMEOUT,
+    )
+    assert response.status_code == 200, f"Expected 200, got {response.status_code} with body {response.text}"
+
+    report = response.json()
+    assert report.get("dryRun") is True
+    assert report.get("totalRows") == 3
+    assert report.get("invalid") == 1
+    # Вторая строка — дубликат первой в файле
+    assert report.get("imported") == 1
+    assert report.get("duplicates") == 1
+    assert isinstance(report.get("durationMs"), int)
+    assert isinstance(report.get("rowsPerSecond"), int)
+
+    errors = report.get("errors")
+    assert isinstance(errors, list) and len(errors) > 0
+    assert any(e.get("row") == 4 and e.get("field") == "inn" for e in errors), "Missing per-row INN error for row 4"
+
+    # Numeric spreadsheet cells: the BIK is padded back to 9 digits, an exponent-form account is rejected
+    response = session.post(
+        f"{BASE_URL}/api/organizations/import",
+        files={"file": ("orgs.csv", build_csv([EXCEL_BIK_ROW, EXCEL_EXPONENT_ROW]), "text/csv")},
+        data={"dryRun": "true"},
+        headers=headers_auth,
+        timeout=TIMEOUT,
+    )
+    assert response.status_code == 200, f"Expected 200, got {response.status_code} with body {response.text}"
+
+    report = response.json()
+    errors = report.get("errors")
+    assert report.get("imported") == 1, f"BIK without the leading zero must be padded: {errors}"
+    assert report.get("invalid") == 1
+    assert not any(e.get("row") == 2 for e in errors), f"Unexpected errors for the BIK row: {errors}"
+    assert any(
+        e.get("row") == 3 and e.get("field") == "bank_rs" and "текстовый формат" in e.get("message", "")
+        for e in errors
+    ), "Exponent-form account must be rejected with a hint to format the column as text"
+
+test_bulk_import_organizations_from_csv()
@@ -0,0 +1,98 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from standins.client import fetch_login_code, mailbox_available
+
+BASE_URL = "http://localhost:3000"
+TIMEOUT = 30
+PARALLEL_REQUESTS = 20
+
+
+def test_concurrent_document_creation_respects_demo_limit():
+    # Requires the stand-in stack (python -m standins): the login code is read from the SMTP sink.
+    # A fresh user is a demo user with an unused quota on every run
+    assert mailbox_available(), "SMTP sink is not running: start it with `python -m standins`"
+    test_email = f"demo-concurrency-{uuid.uuid4().hex[:8]}@example.com"
+
+    session = requests.Session()
+
+    send_code_resp = session.post(
+        f"{BASE_URL}/api/auth/send-code",
+        json={"email": test_email},
+        timeout=TIMEOUT
+    )
+    assert send_code_resp.status_code == 200
+    test_code = fetch_login_code(test_email)
+
+    verify_resp = session.post(
+        f"{BASE_URL}/api/auth/verify-code",
+        json={"email": test_email, "code": test_code},
+        timeout=TIMEOUT
+    )
+    assert verify_resp.status_code == 200
+    csrf_token = verify_resp.json().get("csrfToken")
+
+    headers = {"Content-Type": "application/json"}
+    if csrf_token:
+        headers["x-csrf-token"] = csrf_token
+
+    me_resp = session.get(f"{BASE_URL}/api/users/me", timeout=TIMEOUT)
+    assert me_resp.status_code == 200
+    demo_status = me_resp.json().get("demoStatus")
+    assert demo_status is not None, "Test user must be a demo user (no access period assigned)"
+    remaining = demo_status["documentsLimit"] - demo_status["documentsUsed"]
+    # Иначе тест проходит, ничего не создав
+    assert 0 < remaining < PARALLEL_REQUESTS, f"Fresh demo user must have a partial quota, got {remaining}"
+
+    templates_resp = session.get(f"{BASE_URL}/api/templates", timeout=TIMEOUT)
+    assert templates_resp.status_code == 200
+    templates = templates_resp.json()
+    assert isinstance(templates, list) and len(templates) > 0
+    template = templates[0]
+
+    payload = {
+        "templateCode": template["code"],
+        "templateVersion": template.get("version") or "1.0",
+        "title": "Concurrency test document",
+    }
+    cookies = session.cookies.get_dict()
+
+    def create_document(_):
+        # Отдельная сессия на поток: requests.Session не потокобезопасна
+        with requests.Session() as worker:
+            worker.cookies.update(cookies)
+            return worker.post(f"{BASE_URL}/api/documents", json=payload, headers=headers, timeout=TIMEOUT)
+
+    with ThreadPoolExecutor(max_workers=PARALLEL_REQUESTS) as pool:
+        responses = list(pool.map(create_document, range(PARALLEL_REQUESTS)))
+
+    statuses = [r.status_code for r in responses]
+    created = [r for r in responses if r.status_code == 201]
+    rejected = [r for r in responses if r.status_code == 403]
+
+    assert len(created) + len(rejected) == PARALLEL_REQUESTS, f"Unexpected statuses: {statuses}"
+    assert len(created) == remaining, (
+        f"Expected exactly {remaining} documents created, got {len(created)}"
+    )
+    for r in rejected:
+        assert r.json().get("error") == "Demo limit exceeded"
+
+    # Ответ содержит актуальное состояние квоты - follow-up запрос профиля не нужен
+    for r in created:
+        quota = r.json().get("demoStatus")
+        assert quota is not None
+        assert quota["documentsUsed"] <= quota["documentsLimit"]
+
+    me_after = session.get(f"{BASE_URL}/api/users/me", timeout=TIMEOUT).json()["demoStatus"]
+    assert me_after["documentsUsed"] <= me_after["documentsLimit"], "Demo limit was overrun"
+    assert me_after["documentsUsed"] == demo_status["documentsUsed"] + len(created)
+
+    # Cleanup: delete created documents
+    for r in created:
+        doc_id = r.json()["id"]
+        session.delete(f"{BASE_URL}/api/documents/{doc_id}", headers=headers, timeout=TIMEOUT)
+
+
+test_concurrent_document_creation_respects_demo_limit()
@@ -0,0 +1,78 @@
+import uuid
+
+import requests
+
+from standins.client import clear_mailbox, fetch_login_code, mailbox_available
+
+BASE_URL = "http://localhost:3000"
+TIMEOUT = 30
+
+
+def test_login_and_ai_chat_against_local_standins():
+    # Requires the stand-in stack (python -m standins) and the app started with
+    # SMTP_HOST/OPENAI_BASE_URL/UPSTASH_REDIS_REST_URL pointing at it (see .env.example)
+    assert mailbox_available(), "SMTP sink is not running: start it with `python -m standins`"
+    clear_mailbox()
+
+    email = f"standin-{uuid.uuid4().hex[:8]}@example.com"
+    session = requests.Session()
+
+    send_code_resp = session.post(
+        f"{BASE_URL}/api/auth/send-code",
+        json={"email": email},
+        timeout=TIMEOUT
+    )
+    assert send_code_resp.status_code == 200, f"Failed to send code: {send_code_resp.text}"
+    assert "code" not in send_code_resp.json(), "Code must be delivered via SMTP, not in the API response"
+
+    # The real code travels through nodemailer to the SMTP sink
+    code = fetch_login_code(email)
+    assert len(code) == 6 and code.isdigit()
+
+    verify_resp = session.post(
+        f"{BASE_URL}/api/auth/verify-code",
+        json={"email": email, "code": code},
+        timeout=TIMEOUT
+    )
+    assert verify_resp.status_code == 200, f"Verification failed: {verify_resp.text}"
+    csrf_token = verify_resp.json().get("csrfToken")
+
+    headers = {"Content-Type": "application/json"}
+    if csrf_token:
+        headers["x-csrf-token"] = csrf_token
+
+    # AI chat goes through the real OpenAI SDK call to the OpenAI-compatible stand-in
+    chat_resp = session.post(
+        f"{BASE_URL}/api/ai/chat",
+        json={"userPrompt": "Составь раздел о предмете договора", "templateName": "Договор оказания услуг"},
+        headers=headers,
+        timeout=TIMEOUT
+    )
+    assert chat_resp.status_code == 200, f"AI chat failed: {chat_resp.text}"
+    chat_data = chat_resp.json()
+    assert chat_data.get("success") is True
+    assert chat_data.get("text", "").startswith("1. Предмет договора"), "Unexpected reply from the OpenAI stand-in"
+    usage = chat_data.get("usage") or {}
+    assert usage.get("completion_tokens", 0) > 0 and usage.get("total_tokens", 0) >= usage["completion_tokens"]
+
+    # Rate limiting goes through @upstash/ratelimit against the Upstash stand-in:
+    # a burst of requests to the auth limiter must eventually be rejected.
+    # The limiter is keyed by client IP (getIP reads X-Forwarded-For): the burst uses
+    # a throwaway address, otherwise send-code of the following tests gets 429 for a minute
+    burst_id = uuid.uuid4().int
+    burst_ip = f"198.18.{burst_id % 256}.{burst_id // 256 % 254 + 1}"
+    statuses = []
+    for _ in range(15):
+        r = requests.post(
+            f"{BASE_URL}/api/auth/send-code",
+            json={"email": email},
+            headers={"X-Forwarded-For": burst_ip},
+            timeout=TIMEOUT
+        )
+        statuses.append(r.status_code)
+        if r.status_code == 429:
+            break
+    assert 429 in statuses, f"Auth rate limit was not enforced: {statuses}"
+
+
+test_login_and_ai_chat_against_local_standins()
@@ -0,0 +1,74 @@
+import time
+import uuid
+
+import requests
+
+from standins.client import fetch_login_code, mailbox_available
+
+BASE_URL = "http://localhost:3000"
+TIMEOUT = 30
+REUSE_GRACE_SECONDS = 10
+
+
+def refresh_with(refresh_token):
+    return requests.post(
+        f"{BASE_URL}/api/auth/refresh",
+        cookies={"refreshToken": refresh_token},
+        timeout=TIMEOUT
+    )
+
+
+def test_refresh_token_rotation_and_reuse_detection():
+    # Requires the stand-in stack (python -m standins): the login code is read from the SMTP sink
+    assert mailbox_available(), "SMTP sink is not running: start it with `python -m standins`"
+    test_email = f"refresh-rotation-{uuid.uuid4().hex[:8]}@example.com"
+
+    session = requests.Session()
+    send_code_resp = session.post(f"{BASE_URL}/api/auth/send-code", json={"email": test_email}, timeout=TIMEOUT)
+    assert send_code_resp.status_code == 200
+    test_code = fetch_login_code(test_email)
+
+    verify_resp = session.post(
+        f"{BASE_URL}/api/auth/verify-code",
+        json={"email": test_email, "code": test_code},
+        timeout=TIMEOUT
+    )
+    assert verify_resp.status_code == 200
+    original_token = session.cookies.get("refreshToken")
+    assert original_token, "Refresh token cookie not set after login"
+
+    # Rotation: a refresh returns a new refresh token and a new CSRF token
+    start = time.perf_counter()
+    first_resp = refresh_with(original_token)
+    first_duration = time.perf_counter() - start
+    assert first_resp.status_code == 200, f"Refresh failed: {first_resp.text}"
+    assert first_resp.json().get("csrfToken")
+    rotated_token = first_resp.cookies.get("refreshToken")
+    assert rotated_token and rotated_token != original_token, "Refresh token was not rotated"
+    assert first_duration < 5, f"Refresh took too long: {first_duration}s"
+
+    # Immediate replay of the rotated-out token (e.g. a second tab) is rejected,
+    # but within the grace window the family stays valid
+    replay_resp = refresh_with(original_token)
+    assert replay_resp.status_code == 401, f"Replayed token must be rejected, got {replay_resp.status_code}"
+
+    second_resp = refresh_with(rotated_token)
+    assert second_resp.status_code == 200, f"Rotated token must stay valid: {second_resp.text}"
+    latest_token = second_resp.cookies.get("refreshToken")
+    assert latest_token
+
+    # Replay after the grace window is treated as token theft: the whole family is revoked
+    time.sleep(REUSE_GRACE_SECONDS + 1)
+    reuse_resp = refresh_with(original_token)
+    assert reuse_resp.status_code == 401
+
+    revoked_family_resp = refresh_with(latest_token)
+    assert revoked_family_resp.status_code == 401, "Tokens of a reused family must be revoked"
+
+    # Garbage and missing tokens
+    assert refresh_with("not-a-jwt").status_code == 401
+    missing_resp = requests.post(f"{BASE_URL}/api/auth/refresh", timeout=TIMEOUT)
+    assert missing_resp.status_code == 401
+
+
+test_refresh_token_rotation_and_reuse_detection()
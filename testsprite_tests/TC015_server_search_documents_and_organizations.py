@@ -0,0 +1,126 @@
+import uuid
+
+import requests
+
+from standins.client import fetch_login_code, mailbox_available
+
+BASE_URL = "http://localhost:3000"
+TIMEOUT = 30
+
+
+def test_server_search_documents_and_organizations():
+    # Unauthorized access
+    response = requests.get(f"{BASE_URL}/api/search", params={"q": "договор"}, timeout=TIMEOUT)
+    assert response.status_code == 401, f"Expected 401 Unauthorized, got {response.status_code}"
+
+    # Requires the stand-in stack (python -m standins): the login code is read from the SMTP sink
+    assert mailbox_available(), "SMTP sink is not running: start it with `python -m standins`"
+    test_email = f"search-{uuid.uuid4().hex[:8]}@example.com"
+
+    session = requests.Session()
+    send_code_resp = session.post(f"{BASE_URL}/api/auth/send-code", json={"email": test_email}, timeout=TIMEOUT)
+    assert send_code_resp.status_code == 200
+    test_code = fetch_login_code(test_email)
+
+    verify_resp = session.post(
+        f"{BASE_URL}/api/auth/verify-code",
+        json={"email": test_email, "code": test_code},
+        timeout=TIMEOUT
+    )
+    assert verify_resp.status_code == 200
+    csrf_token = verify_resp.json().get("csrfToken")
+
+    headers = {"Content-Type": "application/json"}
+    if csrf_token:
+        headers["x-csrf-token"] = csrf_token
+
+    templates_resp = session.get(f"{BASE_URL}/api/templates", timeout=TIMEOUT)
+    assert templates_resp.status_code == 200
+    templates = templates_resp.json()
+    assert isinstance(templates, list) and len(templates) > 0
+    template = templates[0]
+
+    # Unique word found only in the body text: the search must match document text, not just titles
+    marker = f"зубр{uuid.uuid4().hex[:6]}"
+    created_ids = []
+    for i in range(2):
+        create_resp = session.post(
+            f"{BASE_URL}/api/documents",
+            json={
+                "templateCode": template["code"],
+                "templateVersion": template.get("version") or "1.0",
+                "title": f"Search test document {i + 1}",
+                "bodyText": f"Поставка товара по спецификации. Кодовое слово {marker}.",
+            },
+            headers=headers,
+            timeout=TIMEOUT
+        )
+        assert create_resp.status_code == 201, f"Document creation failed: {create_resp.text}"
+        created_ids.append(create_resp.json()["id"])
+
+    # Validation: query too short, page size above the limit
+    short_resp = session.get(f"{BASE_URL}/api/search", params={"q": "a"}, timeout=TIMEOUT)
+    assert short_resp.status_code == 400, f"Expected 400 for short query, got {short_resp.status_code}"
+    big_page_resp = session.get(f"{BASE_URL}/api/search", params={"q": marker, "pageSize": 51}, timeout=TIMEOUT)
+    assert big_page_resp.status_code == 400, f"Expected 400 for pageSize > 50, got {big_page_resp.status_code}"
+
+    # Full-text match in bodyText with a highlighted snippet
+    search_resp = session.get(
+        f"{BASE_URL}/api/search",
+        params={"q": marker, "type": "documents"},
+        timeout=TIMEOUT
+    )
+    assert search_resp.status_code == 200, f"Search failed: {search_resp.text}"
+    result = search_resp.json()
+    assert result.get("organizations") is None, "type=documents must not search organizations"
+    documents = result.get("documents")
+    assert documents is not None
+    assert documents["total"] == 2, f"Expected 2 matches, got {documents['total']}"
+    assert {hit["id"] for hit in documents["items"]} == set(created_ids)
+    for hit in documents["items"]:
+        assert hit.get("snippet") and "<mark>" in hit["snippet"], f"Snippet is not highlighted: {hit.get('snippet')}"
+
+    # Paging: pageSize=1 splits the two matches across two pages without overlap
+    page_ids = []
+    for page in (1, 2):
+        page_resp = session.get(
+            f"{BASE_URL}/api/search",
+            params={"q": marker, "type": "documents", "page": page, "pageSize": 1},
+            timeout=TIMEOUT
+        )
+        assert page_resp.status_code == 200
+        page_data = page_resp.json()["documents"]
+        assert page_data["total"] == 2
+        assert page_data["page"] == page
+        assert len(page_data["items"]) == 1
+        page_ids.append(page_data["items"][0]["id"])
+    assert set(page_ids) == set(created_ids), "Pages must not repeat or skip results"
+
+    # A page past the last one is empty but still reports the total
+    past_resp = session.get(
+        f"{BASE_URL}/api/search",
+        params={"q": marker, "type": "documents", "page": 3, "pageSize": 1},
+        timeout=TIMEOUT
+    )
+    assert past_resp.status_code == 200
+    past_data = past_resp.json()["documents"]
+    assert past_data["items"] == []
+    assert past_data["total"] == 2, f"Total must not depend on the page, got {past_data['total']}"
+
+    # type=organizations returns only the organizations section
+    orgs_resp = session.get(
+        f"{BASE_URL}/api/search",
+        params={"q": marker, "type": "organizations"},
+        timeout=TIMEOUT
+    )
+    assert orgs_resp.status_code == 200
+    orgs_result = orgs_resp.json()
+    assert orgs_result.get("documents") is None
+    assert orgs_result["organizations"]["total"] == 0
+
+    # Cleanup
+    for document_id in created_ids:
+        session.delete(f"{BASE_URL}/api/documents/{document_id}", headers=headers, timeout=TIMEOUT)
+
+
+test_server_search_documents_and_organizations()
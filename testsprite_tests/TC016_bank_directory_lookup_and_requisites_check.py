@@ -0,0 +1,134 @@
+import uuid
+
+import requests
+
+from standins.client import fetch_login_code, mailbox_available
+
+BASE_URL = "http://localhost:3000"
+TIMEOUT = 30
+
+# Банки из data/bik.csv
+SBERBANK_BIK = "044525225"
+SBERBANK_KS = "30101810400000000225"
+
+# БИК вне справочника: корсчет проверяется только по контрольной сумме (bik[4:6] + ks)
+UNKNOWN_BIK = "044525999"
+UNKNOWN_BIK_VALID_KS = "30101810600000000999"
+UNKNOWN_BIK_INVALID_KS = "30101810700000000999"
+
+CSV_HEADER = "name_full;inn;kpp;ogrn;address_legal;email;head_title;head_fio;bank_bik;bank_name;bank_ks;bank_rs"
+
+
+def build_row(inn, bik, ks):
+    return ";".join([
+        '"ООО ""Ромашка"""',
+        inn,
+        "773601001",
+        "1027700132195",
+        "г. Москва, ул. Вавилова, д. 19",
+        "info@romashka.ru",
+        "Генеральный директор",
+        "Иванов Иван Иванович",
+        bik,
+        "Тестовый банк",
+        ks,
+        "40702810938000000001",
+    ])
+
+
+def build_csv(rows):
+    return ("\r\n".join([CSV_HEADER] + rows) + "\r\n").encode("utf-8")
+
+
+def test_bank_directory_lookup_and_requisites_check():
+    # Unauthorized access
+    response = requests.get(f"{BASE_URL}/api/banks", params={"q": "0445"}, timeout=TIMEOUT)
+    assert response.status_code == 401, f"Expected 401 Unauthorized, got {response.status_code}"
+
+    # Requires the stand-in stack (python -m standins): the login code is read from the SMTP sink
+    assert mailbox_available(), "SMTP sink is not running: start it with `python -m standins`"
+    test_email = f"banks-{uuid.uuid4().hex[:8]}@example.com"
+
+    # The auth limiter allows 5 send-code per minute per client IP (X-Forwarded-For);
+    # the earlier tests of the suite already log in from this host
+    login_id = uuid.uuid4().int
+    login_ip = f"198.18.{login_id % 256}.{login_id // 256 % 254 + 1}"
+
+    session = requests.Session()
+    send_code_resp = session.post(
+        f"{BASE_URL}/api/auth/send-code",
+        json={"email": test_email},
+        headers={"X-Forwarded-For": login_ip},
+        timeout=TIMEOUT
+    )
+    assert send_code_resp.status_code == 200
+    test_code = fetch_login_code(test_email)
+
+    verify_resp = session.post(
+        f"{BASE_URL}/api/auth/verify-code",
+        json={"email": test_email, "code": test_code},
+        timeout=TIMEOUT
+    )
+    assert verify_resp.status_code == 200
+    csrf_token = verify_resp.json().get("csrfToken")
+    assert csrf_token, "verify-code must return a CSRF token"
+
+    # Autocomplete by BIK prefix: only matching banks, ordered by BIK
+    response = session.get(f"{BASE_URL}/api/banks", params={"q": "0445"}, timeout=TIMEOUT)
+    assert response.status_code == 200, f"Bank search failed: {response.text}"
+    banks = response.json()
+    assert len(banks) > 0, "Bank directory is empty: data/bik.csv was not loaded"
+    assert all(bank["bik"].startswith("0445") for bank in banks)
+    assert [bank["bik"] for bank in banks] == sorted(bank["bik"] for bank in banks)
+
+    # Autocomplete by part of the name, limit respected
+    response = session.get(f"{BASE_URL}/api/banks", params={"q": "сбербанк", "limit": 1}, timeout=TIMEOUT)
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    # Too short query returns an empty list
+    response = session.get(f"{BASE_URL}/api/banks", params={"q": "0"}, timeout=TIMEOUT)
+    assert response.status_code == 200
+    assert response.json() == []
+
+    # Lookup by BIK
+    response = session.get(f"{BASE_URL}/api/banks/{SBERBANK_BIK}", timeout=TIMEOUT)
+    assert response.status_code == 200, f"Bank lookup failed: {response.text}"
+    bank = response.json()
+    assert bank["bik"] == SBERBANK_BIK
+    assert bank["ks"] == SBERBANK_KS
+    assert bank["name"]
+
+    assert session.get(f"{BASE_URL}/api/banks/12345", timeout=TIMEOUT).status_code == 400
+    assert session.get(f"{BASE_URL}/api/banks/{UNKNOWN_BIK}", timeout=TIMEOUT).status_code == 404
+
+    # Requisites check (dry run import, nothing is written):
+    # row 2 — KS differs from the directory, row 3 — unknown BIK with a valid KS checksum,
+    # row 4 — unknown BIK with an invalid KS checksum
+    response = session.post(
+        f"{BASE_URL}/api/organizations/import",
+        files={"file": ("orgs.csv", build_csv([
+            build_row("7707083893", SBERBANK_BIK, UNKNOWN_BIK_VALID_KS),
+            build_row("7728168971", UNKNOWN_BIK, UNKNOWN_BIK_VALID_KS),
+            build_row("7736050003", UNKNOWN_BIK, UNKNOWN_BIK_INVALID_KS),
+        ]), "text/csv")},
+        data={"dryRun": "true"},
+        headers={"x-csrf-token": csrf_token},
+        timeout=60,
+    )
+    assert response.status_code == 200, f"Expected 200, got {response.status_code} with body {response.text}"
+
+    report = response.json()
+    errors = report.get("errors")
+    assert report.get("imported") == 1, f"Only the unknown BIK with a valid checksum must pass: {errors}"
+    assert report.get("invalid") == 2
+    assert any(
+        e.get("row") == 2 and e.get("field") == "bank_ks" and SBERBANK_KS in e.get("message", "")
+        for e in errors
+    ), "KS mismatch must be reported with the directory value"
+    assert not any(e.get("row") == 3 for e in errors), f"Valid KS checksum was rejected: {errors}"
+    assert any(e.get("row") == 4 and e.get("field") == "bank_ks" for e in errors), \
+        "Invalid KS checksum must be rejected"
+
+
+test_bank_directory_lookup_and_requisites_check()
@@ -0,0 +1,8 @@
+"""Offline stand-ins for the external services used by the app.
+
+- openai_mock: OpenAI-compatible /v1/chat/completions (incl. streaming)
+- upstash_mock: Upstash Redis REST API subset used by @upstash/ratelimit
+- smtp_sink: SMTP server that stores messages and exposes login codes over HTTP
+
+Run all of them with ``python -m standins`` from the testsprite_tests directory.
+"""
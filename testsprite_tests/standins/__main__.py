@@ -0,0 +1,70 @@
+"""Run the offline stand-in stack.
+
+    cd testsprite_tests && python -m standins
+
+Then start the app with (see .env.example, section "LOCAL STAND-INS"):
+
+    OPENAI_API_KEY=sk-standin OPENAI_BASE_URL=http://127.0.0.1:8787/v1
+    UPSTASH_REDIS_REST_URL=http://127.0.0.1:8079 UPSTASH_REDIS_REST_TOKEN=standin
+    SMTP_HOST=127.0.0.1 SMTP_PORT=2525 EMAIL_USER=noreply@standin.local EMAIL_PASSWORD=standin
+"""
+
+import argparse
+import signal
+import sys
+import threading
+
+from . import openai_mock, smtp_sink, upstash_mock
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m standins", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--openai-port", type=int, default=8787)
+    parser.add_argument("--upstash-port", type=int, default=8079)
+    parser.add_argument("--upstash-token", default="standin")
+    parser.add_argument("--smtp-port", type=int, default=2525)
+    parser.add_argument("--mailbox-port", type=int, default=8025)
+    parser.add_argument("--latency-ms", type=int, default=openai_mock.DEFAULT_LATENCY_MS,
+                        help="delay before the first token of a completion")
+    parser.add_argument("--tokens-per-second", type=float, default=openai_mock.DEFAULT_TOKENS_PER_SECOND,
+                        help="completion generation speed, 0 = instant")
+    parser.add_argument("--reply-tokens", type=int, default=openai_mock.DEFAULT_REPLY_TOKENS)
+    parser.add_argument("--verbose", action="store_true", help="log every HTTP request")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    openai_server = openai_mock.create_server(
+        args.host, args.openai_port, args.latency_ms, args.tokens_per_second, args.reply_tokens, args.verbose
+    )
+    upstash_server = upstash_mock.create_server(args.host, args.upstash_port, args.upstash_token, args.verbose)
+    smtp_server, mailbox_server = smtp_sink.create_servers(args.host, args.smtp_port, args.mailbox_port, args.verbose)
+
+    servers = [openai_server, upstash_server, smtp_server, mailbox_server]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(f"OpenAI   http://{args.host}:{args.openai_port}/v1 "
+          f"(latency {args.latency_ms} ms, {args.tokens_per_second:g} tokens/s)")
+    print(f"Upstash  http://{args.host}:{args.upstash_port} (token: {args.upstash_token or 'any'})")
+    print(f"SMTP     {args.host}:{args.smtp_port}, mailbox http://{args.host}:{args.mailbox_port}/messages")
+    sys.stdout.flush()
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        stop.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Helpers for tests that run against the stand-in stack."""
+
+import os
+
+import requests
+
+MAILBOX_URL = os.environ.get("STANDIN_MAILBOX_URL", "http://127.0.0.1:8025")
+
+
+def mailbox_available(timeout=2):
+    try:
+        return requests.get(f"{MAILBOX_URL}/health", timeout=timeout).ok
+    except requests.RequestException:
+        return False
+
+
+def fetch_login_code(email, wait_seconds=10):
+    """Wait for the login code e-mail to reach the SMTP sink and return the code."""
+    response = requests.get(
+        f"{MAILBOX_URL}/codes/{email}", params={"wait": wait_seconds}, timeout=wait_seconds + 5
+    )
+    assert response.status_code == 200, f"No login code for {email}: {response.text}"
+    return response.json()["code"]
+
+
+def clear_mailbox():
+    requests.delete(f"{MAILBOX_URL}/messages", timeout=5)
@@ -0,0 +1,209 @@
+"""OpenAI-compatible chat completions stand-in.
+
+Implements POST /v1/chat/completions (regular and ``stream: true`` SSE) and
+GET /v1/models. Replies are deterministic, so runs are reproducible.
+
+Latency is configurable per server (CLI/env) and per request via headers:
+- ``X-Mock-Latency-Ms``: delay before the first token
+- ``X-Mock-Tokens-Per-Second``: generation speed (0 = instant)
+- ``X-Mock-Reply-Tokens``: reply length in tokens (capped by max_tokens)
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_LATENCY_MS = int(os.environ.get("MOCK_OPENAI_LATENCY_MS", "150"))
+DEFAULT_TOKENS_PER_SECOND = float(os.environ.get("MOCK_OPENAI_TOKENS_PER_SECOND", "80"))
+DEFAULT_REPLY_TOKENS = int(os.environ.get("MOCK_OPENAI_REPLY_TOKENS", "120"))
+
+# Фразы для детерминированного ответа (один "токен" = одно слово)
+REPLY_WORDS = (
+    "1. Предмет договора. Исполнитель обязуется оказать услуги, а Заказчик обязуется "
+    "принять и оплатить их в порядке и сроки, предусмотренные настоящим договором. "
+    "2. Права и обязанности сторон. Стороны обязуются добросовестно исполнять принятые "
+    "на себя обязательства. 3. Порядок расчетов. Оплата производится безналичным "
+    "переводом на расчетный счет Исполнителя."
+).split()
+
+
+def count_tokens(text):
+    return max(1, len(text.split()))
+
+
+def build_reply(reply_tokens):
+    words = [REPLY_WORDS[i % len(REPLY_WORDS)] for i in range(reply_tokens)]
+    return words
+
+
+class OpenAIMockHandler(BaseHTTPRequestHandler):
+    server_version = "OpenAIMock/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message, error_type="invalid_request_error"):
+        self._send_json(status, {"error": {"message": message, "type": error_type, "code": None}})
+
+    def _authorized(self):
+        auth = self.headers.get("Authorization", "")
+        if not auth.startswith("Bearer ") or not auth[7:].strip():
+            self._error(401, "Missing API key", "authentication_error")
+            return False
+        return True
+
+    def _header_number(self, name, default, cast):
+        value = self.headers.get(name)
+        if value is None:
+            return default
+        try:
+            return cast(value)
+        except ValueError:
+            return default
+
+    def do_GET(self):
+        if self.path.rstrip("/") in ("/v1/models", "/models"):
+            if not self._authorized():
+                return
+            self._send_json(200, {
+                "object": "list",
+                "data": [{"id": "gpt-4o-mini", "object": "model", "created": 0, "owned_by": "mock"}],
+            })
+            return
+        if self.path == "/health":
+            self._send_json(200, {"ok": True, "requests": self.server.request_count})
+            return
+        self._error(404, f"Unknown path {self.path}")
+
+    def do_POST(self):
+        if self.path.rstrip("/") not in ("/v1/chat/completions", "/chat/completions"):
+            self._error(404, f"Unknown path {self.path}")
+            return
+        if not self._authorized():
+            return
+
+        length = int(self.headers.get("Content-Length", "0"))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._error(400, "Invalid JSON body")
+            return
+
+        messages = request.get("messages")
+        if not isinstance(messages, list) or not messages:
+            self._error(400, "'messages' must be a non-empty array")
+            return
+
+        with self.server.lock:
+            self.server.request_count += 1
+
+        latency_ms = self._header_number("X-Mock-Latency-Ms", self.server.latency_ms, int)
+        tokens_per_second = self._header_number("X-Mock-Tokens-Per-Second", self.server.tokens_per_second, float)
+        reply_tokens = self._header_number("X-Mock-Reply-Tokens", self.server.reply_tokens, int)
+        max_tokens = request.get("max_tokens") or request.get("max_completion_tokens")
+        if isinstance(max_tokens, int) and max_tokens > 0:
+            reply_tokens = min(reply_tokens, max_tokens)
+        finish_reason = "length" if isinstance(max_tokens, int) and reply_tokens >= max_tokens else "stop"
+
+        words = build_reply(reply_tokens)
+        prompt_tokens = sum(count_tokens(str(m.get("content", ""))) for m in messages)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(words),
+            "total_tokens": prompt_tokens + len(words),
+        }
+        completion_id = f"chatcmpl-mock-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        model = request.get("model", "gpt-4o-mini")
+        token_delay = 1.0 / tokens_per_second if tokens_per_second > 0 else 0.0
+
+        time.sleep(latency_ms / 1000.0)
+
+        if request.get("stream"):
+            self._stream(completion_id, created, model, words, token_delay, finish_reason, usage, request)
+            return
+
+        time.sleep(token_delay * len(words))
+        self._send_json(200, {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": " ".join(words), "refusal": None},
+                "logprobs": None,
+                "finish_reason": finish_reason,
+            }],
+            "usage": usage,
+        })
+
+    def _stream(self, completion_id, created, model, words, token_delay, finish_reason, usage, request):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def chunk(delta, finish=None, extra=None):
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "logprobs": None, "finish_reason": finish}],
+            }
+            if extra:
+                payload.update(extra)
+            data = json.dumps(payload, ensure_ascii=False)
+            self.wfile.write(f"data: {data}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        try:
+            chunk({"role": "assistant", "content": ""})
+            for index, word in enumerate(words):
+                if token_delay:
+                    time.sleep(token_delay)
+                chunk({"content": word if index == 0 else f" {word}"})
+            chunk({}, finish_reason)
+            if (request.get("stream_options") or {}).get("include_usage"):
+                self.wfile.write(("data: " + json.dumps({
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [],
+                    "usage": usage,
+                }) + "\n\n").encode("utf-8"))
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def create_server(host="127.0.0.1", port=8787, latency_ms=DEFAULT_LATENCY_MS,
+                  tokens_per_second=DEFAULT_TOKENS_PER_SECOND, reply_tokens=DEFAULT_REPLY_TOKENS,
+                  verbose=False):
+    server = ThreadingHTTPServer((host, port), OpenAIMockHandler)
+    server.daemon_threads = True
+    server.latency_ms = latency_ms
+    server.tokens_per_second = tokens_per_second
+    server.reply_tokens = reply_tokens
+    server.verbose = verbose
+    server.request_count = 0
+    server.lock = threading.Lock()
+    return server
@@ -0,0 +1,215 @@
+"""SMTP sink that keeps received messages and exposes login codes over HTTP.
+
+SMTP (default port 2525): accepts any sender/recipient, advertises
+AUTH PLAIN/LOGIN and accepts any credentials, never relays anything.
+
+HTTP (default port 8025):
+- GET    /messages                  all stored messages (newest last)
+- GET    /messages?to=<email>       messages for one recipient
+- GET    /codes/<email>             latest 6-digit login code for the recipient
+- DELETE /messages                  clear the mailbox
+"""
+
+import json
+import re
+import socketserver
+import threading
+import time
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+CODE_PATTERN = re.compile(r"(?<!\d)(\d{6})(?!\d)")
+TAG_PATTERN = re.compile(r"<[^>]+>")
+MAX_MESSAGES = 1000
+
+
+class Mailbox:
+    def __init__(self):
+        self.messages = []
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+
+    def add(self, mail_from, recipients, raw):
+        parsed = BytesParser(policy=policy.default).parsebytes(raw)
+        texts = []
+        for part in parsed.walk():
+            if part.get_content_maintype() == "text":
+                try:
+                    texts.append(part.get_content())
+                except (LookupError, ValueError):
+                    texts.append(part.get_payload(decode=True).decode("utf-8", "replace"))
+        text = TAG_PATTERN.sub(" ", "\n".join(texts))
+        match = CODE_PATTERN.search(text)
+        message = {
+            "from": mail_from,
+            "to": [recipient.lower() for recipient in recipients],
+            "subject": str(parsed.get("Subject", "")),
+            "text": " ".join(text.split()),
+            "code": match.group(1) if match else None,
+            "receivedAt": time.time(),
+        }
+        with self.changed:
+            self.messages.append(message)
+            del self.messages[:-MAX_MESSAGES]
+            self.changed.notify_all()
+
+    def list(self, recipient=None):
+        with self.lock:
+            if recipient is None:
+                return list(self.messages)
+            recipient = recipient.lower()
+            return [message for message in self.messages if recipient in message["to"]]
+
+    def latest_code(self, recipient, wait_seconds=0.0):
+        """Latest code for the recipient, optionally waiting for a message to arrive."""
+        recipient = recipient.lower()
+        deadline = time.time() + wait_seconds
+        with self.changed:
+            while True:
+                for message in reversed(self.messages):
+                    if recipient in message["to"] and message["code"]:
+                        return message
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+                self.changed.wait(remaining)
+
+    def clear(self):
+        with self.lock:
+            self.messages.clear()
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    timeout = 60
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode("utf-8"))
+
+    def handle(self):
+        mailbox = self.server.mailbox
+        self.reply("220 smtp-sink ESMTP ready")
+        mail_from, recipients = None, []
+
+        while True:
+            raw_line = self.rfile.readline()
+            if not raw_line:
+                return
+            line = raw_line.decode("utf-8", "replace").rstrip("\r\n")
+            verb, _, argument = line.partition(" ")
+            verb = verb.upper()
+
+            if verb in ("EHLO", "HELO"):
+                if verb == "EHLO":
+                    self.reply("250-smtp-sink")
+                    self.reply("250-8BITMIME")
+                    self.reply("250-SMTPUTF8")
+                    self.reply("250 AUTH PLAIN LOGIN")
+                else:
+                    self.reply("250 smtp-sink")
+            elif verb == "AUTH":
+                mechanism, _, initial = argument.partition(" ")
+                if mechanism.upper() == "LOGIN":
+                    # Логин и пароль не проверяются
+                    self.reply("334 VXNlcm5hbWU6")
+                    self.rfile.readline()
+                    self.reply("334 UGFzc3dvcmQ6")
+                    self.rfile.readline()
+                elif mechanism.upper() == "PLAIN" and not initial:
+                    self.reply("334 ")
+                    self.rfile.readline()
+                self.reply("235 2.7.0 Authentication successful")
+            elif verb == "MAIL":
+                mail_from = argument.partition(":")[2].strip().split(" ")[0].strip("<>")
+                recipients = []
+                self.reply("250 2.1.0 OK")
+            elif verb == "RCPT":
+                recipients.append(argument.partition(":")[2].strip().split(" ")[0].strip("<>"))
+                self.reply("250 2.1.5 OK")
+            elif verb == "DATA":
+                if not recipients:
+                    self.reply("503 5.5.1 RCPT first")
+                    continue
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line in (b".\r\n", b".\n"):
+                        break
+                    # Снимаем dot-stuffing (RFC 5321, 4.5.2)
+                    lines.append(data_line[1:] if data_line.startswith(b"..") else data_line)
+                mailbox.add(mail_from, recipients, b"".join(lines))
+                mail_from, recipients = None, []
+                self.reply("250 2.0.0 OK: queued")
+            elif verb == "RSET":
+                mail_from, recipients = None, []
+                self.reply("250 2.0.0 OK")
+            elif verb == "NOOP":
+                self.reply("250 2.0.0 OK")
+            elif verb == "QUIT":
+                self.reply("221 2.0.0 Bye")
+                return
+            else:
+                self.reply("502 5.5.2 Command not implemented")
+
+
+class SMTPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class MailboxHTTPHandler(BaseHTTPRequestHandler):
+    server_version = "SMTPSink/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        mailbox = self.server.mailbox
+
+        if url.path == "/health":
+            self._send_json(200, {"ok": True, "messages": len(mailbox.list())})
+        elif url.path == "/messages":
+            recipient = query.get("to", [None])[0]
+            self._send_json(200, {"messages": mailbox.list(recipient)})
+        elif url.path.startswith("/codes/"):
+            recipient = unquote(url.path[len("/codes/"):])
+            wait = min(float(query.get("wait", ["0"])[0] or 0), 30.0)
+            message = mailbox.latest_code(recipient, wait)
+            if message is None:
+                self._send_json(404, {"error": f"No code received for {recipient}"})
+            else:
+                self._send_json(200, {"email": recipient, "code": message["code"], "receivedAt": message["receivedAt"]})
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_DELETE(self):
+        if urlparse(self.path).path == "/messages":
+            self.server.mailbox.clear()
+            self._send_json(200, {"ok": True})
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+
+def create_servers(host="127.0.0.1", smtp_port=2525, http_port=8025, verbose=False):
+    """Create the SMTP server and its HTTP inspection server sharing one mailbox."""
+    mailbox = Mailbox()
+    smtp_server = SMTPServer((host, smtp_port), SMTPHandler)
+    smtp_server.mailbox = mailbox
+    http_server = ThreadingHTTPServer((host, http_port), MailboxHTTPHandler)
+    http_server.daemon_threads = True
+    http_server.mailbox = mailbox
+    http_server.verbose = verbose
+    return smtp_server, http_server
@@ -0,0 +1,502 @@
+"""Upstash Redis REST API stand-in.
+
+Implements the subset of the REST protocol used by @upstash/redis and
+@upstash/ratelimit:
+- POST /            single command as JSON array, e.g. ["INCR", "key"]
+- POST /pipeline    array of commands, returns array of {"result"|"error"}
+- POST /multi-exec  same as pipeline, executed atomically
+- GET  /<cmd>/<arg>/...  path-style commands
+- ``Upstash-Encoding: base64`` responses (the @upstash/redis default)
+- Bearer token auth (token from UPSTASH_REDIS_REST_TOKEN, any if unset)
+
+Data types: strings, hashes (HSET/HGET/HGETALL/HINCRBY), sorted sets
+(ZADD/ZINCRBY/ZSCORE/ZRANGE/ZCARD/ZREM) and sets (SADD/SREM/SMEMBERS/
+SISMEMBER). Hash and sorted set commands cover ``analytics: true`` of
+@upstash/ratelimit (usage counters of @upstash/core-analytics); commands
+against a key of another type fail with WRONGTYPE, as in Redis.
+
+Lua scripts are not interpreted: EVAL/EVALSHA recognise the sliding window
+script of @upstash/ratelimit v2 and emulate it natively; other scripts are
+rejected with an error so a mismatch is visible instead of silently allowed.
+"""
+
+import base64
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+
+class RedisError(Exception):
+    pass
+
+
+WRONGTYPE = "WRONGTYPE Operation against a key holding the wrong kind of value"
+
+
+class SortedSet(dict):
+    """Sorted set: member -> score."""
+
+
+def format_score(score):
+    """Scores are returned as strings, integral values without a fraction ("1", not "1.0")."""
+    return str(int(score)) if float(score).is_integer() else repr(float(score))
+
+
+class Store:
+    """In-memory key/value store with millisecond expirations.
+
+    Values: str (string), dict (hash), SortedSet (sorted set), set (set).
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+        self.scripts = {}
+        self.lock = threading.RLock()
+
+    # --- helpers -----------------------------------------------------------
+
+    def _now_ms(self):
+        return int(time.time() * 1000)
+
+    def _alive(self, key):
+        expires_at = self.expires.get(key)
+        if expires_at is not None and expires_at <= self._now_ms():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.data
+
+    def _get(self, key):
+        value = self.data[key] if self._alive(key) else None
+        if value is not None and not isinstance(value, str):
+            raise RedisError(WRONGTYPE)
+        return value
+
+    def _get_typed(self, key, kind, create=False):
+        """Value of a hash/sorted set/set key; missing keys are created if ``create``."""
+        if not self._alive(key):
+            if not create:
+                return None
+            self.data[key] = kind()
+            self.expires.pop(key, None)
+        value = self.data[key]
+        if type(value) is not kind:
+            raise RedisError(WRONGTYPE)
+        return value
+
+    def _drop_if_empty(self, key):
+        # Redis удаляет пустые hash/zset/set
+        if key in self.data and not isinstance(self.data[key], str) and not self.data[key]:
+            self.data.pop(key)
+            self.expires.pop(key, None)
+
+    def _get_int(self, key):
+        value = self._get(key)
+        if value is None:
+            return 0
+        try:
+            return int(value)
+        except ValueError:
+            raise RedisError("ERR value is not an integer or out of range")
+
+    def _incrby(self, key, amount):
+        value = self._get_int(key) + amount
+        self.data[key] = str(value)
+        return value
+
+    def _set_expire_ms(self, key, ms):
+        if not self._alive(key):
+            return 0
+        self.expires[key] = self._now_ms() + ms
+        return 1
+
+    # --- commands ----------------------------------------------------------
+
+    def execute(self, command):
+        if not isinstance(command, list) or not command:
+            raise RedisError("ERR invalid command")
+        name = str(command[0]).upper()
+        args = [str(arg) for arg in command[1:]]
+        handler = getattr(self, f"cmd_{name.lower()}", None)
+        if handler is None:
+            raise RedisError(f"ERR unknown command '{name}' (not supported by stand-in)")
+        with self.lock:
+            return handler(*args)
+
+    def cmd_ping(self, *args):
+        return args[0] if args else "PONG"
+
+    def cmd_get(self, key):
+        return self._get(key)
+
+    def cmd_mget(self, *keys):
+        # MGET не падает на ключах другого типа, а возвращает для них nil
+        return [value if isinstance(value, str) else None
+                for value in (self.data.get(key) if self._alive(key) else None for key in keys)]
+
+    def cmd_set(self, key, value, *options):
+        options = [option.upper() for option in options]
+        exists = self._alive(key)
+        if "NX" in options and exists:
+            return None
+        if "XX" in options and not exists:
+            return None
+        self.data[key] = value
+        self.expires.pop(key, None)
+        for flag, factor in (("EX", 1000), ("PX", 1)):
+            if flag in options:
+                self.expires[key] = self._now_ms() + int(options[options.index(flag) + 1]) * factor
+        return "OK"
+
+    def cmd_del(self, *keys):
+        removed = 0
+        for key in keys:
+            if self._alive(key):
+                self.data.pop(key)
+                self.expires.pop(key, None)
+                removed += 1
+        return removed
+
+    def cmd_exists(self, *keys):
+        return sum(1 for key in keys if self._alive(key))
+
+    def cmd_incr(self, key):
+        return self._incrby(key, 1)
+
+    def cmd_incrby(self, key, amount):
+        return self._incrby(key, int(amount))
+
+    def cmd_decr(self, key):
+        return self._incrby(key, -1)
+
+    def cmd_decrby(self, key, amount):
+        return self._incrby(key, -int(amount))
+
+    def cmd_expire(self, key, seconds):
+        return self._set_expire_ms(key, int(seconds) * 1000)
+
+    def cmd_pexpire(self, key, ms):
+        return self._set_expire_ms(key, int(ms))
+
+    def cmd_ttl(self, key):
+        pttl = self.cmd_pttl(key)
+        return pttl if pttl < 0 else (pttl + 999) // 1000
+
+    def cmd_pttl(self, key):
+        if not self._alive(key):
+            return -2
+        expires_at = self.expires.get(key)
+        return -1 if expires_at is None else max(0, expires_at - self._now_ms())
+
+    def cmd_keys(self, pattern):
+        return [key for key in list(self.data) if self._alive(key) and fnmatch.fnmatchcase(key, pattern)]
+
+    def cmd_flushdb(self, *args):
+        self.data.clear()
+        self.expires.clear()
+        return "OK"
+
+    cmd_flushall = cmd_flushdb
+
+    def cmd_dbsize(self):
+        return len([key for key in list(self.data) if self._alive(key)])
+
+    def cmd_type(self, key):
+        if not self._alive(key):
+            return "none"
+        value = self.data[key]
+        if isinstance(value, str):
+            return "string"
+        if isinstance(value, SortedSet):
+            return "zset"
+        return "hash" if isinstance(value, dict) else "set"
+
+    # --- hashes ------------------------------------------------------------
+
+    def cmd_hset(self, key, *pairs):
+        if not pairs or len(pairs) % 2:
+            raise RedisError("ERR wrong number of arguments for 'hset' command")
+        hash_ = self._get_typed(key, dict, create=True)
+        added = 0
+        for field, value in zip(pairs[::2], pairs[1::2]):
+            added += field not in hash_
+            hash_[field] = value
+        return added
+
+    def cmd_hget(self, key, field):
+        hash_ = self._get_typed(key, dict)
+        return None if hash_ is None else hash_.get(field)
+
+    def cmd_hgetall(self, key):
+        hash_ = self._get_typed(key, dict) or {}
+        return [item for pair in hash_.items() for item in pair]
+
+    def cmd_hincrby(self, key, field, amount):
+        hash_ = self._get_typed(key, dict, create=True)
+        try:
+            value = int(hash_.get(field, "0")) + int(amount)
+        except ValueError:
+            raise RedisError("ERR hash value is not an integer")
+        hash_[field] = str(value)
+        return value
+
+    def cmd_hdel(self, key, *fields):
+        hash_ = self._get_typed(key, dict)
+        if hash_ is None:
+            return 0
+        removed = sum(1 for field in fields if hash_.pop(field, None) is not None)
+        self._drop_if_empty(key)
+        return removed
+
+    # --- sorted sets -------------------------------------------------------
+
+    def cmd_zadd(self, key, *args):
+        options = []
+        args = list(args)
+        while args and args[0].upper() in ("NX", "XX", "GT", "LT", "CH", "INCR"):
+            options.append(args.pop(0).upper())
+        if not args or len(args) % 2:
+            raise RedisError("ERR syntax error")
+
+        zset = self._get_typed(key, SortedSet, create=True)
+        changed = 0
+        result = None
+        for raw_score, member in zip(args[::2], args[1::2]):
+            score = float(raw_score)
+            exists = member in zset
+            if ("NX" in options and exists) or ("XX" in options and not exists):
+                continue
+            if "INCR" in options:
+                score += zset.get(member, 0.0)
+            if exists and (("GT" in options and score <= zset[member])
+                           or ("LT" in options and score >= zset[member])):
+                continue
+            if not exists or zset[member] != score:
+                changed += 1 if (not exists or "CH" in options) else 0
+            zset[member] = score
+            result = format_score(score)
+        self._drop_if_empty(key)
+        return result if "INCR" in options else changed
+
+    def cmd_zincrby(self, key, increment, member):
+        zset = self._get_typed(key, SortedSet, create=True)
+        zset[member] = zset.get(member, 0.0) + float(increment)
+        return format_score(zset[member])
+
+    def cmd_zscore(self, key, member):
+        zset = self._get_typed(key, SortedSet)
+        if zset is None or member not in zset:
+            return None
+        return format_score(zset[member])
+
+    def cmd_zcard(self, key):
+        return len(self._get_typed(key, SortedSet) or ())
+
+    def cmd_zrem(self, key, *members):
+        zset = self._get_typed(key, SortedSet)
+        if zset is None:
+            return 0
+        removed = sum(1 for member in members if zset.pop(member, None) is not None)
+        self._drop_if_empty(key)
+        return removed
+
+    def cmd_zrange(self, key, start, stop, *options):
+        """Index range (ZRANGE key start stop [REV] [WITHSCORES]); BYSCORE/BYLEX are not supported."""
+        options = [option.upper() for option in options]
+        if "BYSCORE" in options or "BYLEX" in options:
+            raise RedisError("ERR ZRANGE BYSCORE/BYLEX is not supported by the stand-in")
+        zset = self._get_typed(key, SortedSet) or SortedSet()
+        ordered = sorted(zset.items(), key=lambda item: (item[1], item[0]), reverse="REV" in options)
+
+        start, stop = int(start), int(stop)
+        if start < 0:
+            start = max(0, len(ordered) + start)
+        if stop < 0:
+            stop = len(ordered) + stop
+        selected = ordered[start:stop + 1]
+
+        if "WITHSCORES" in options:
+            return [item for member, score in selected for item in (member, format_score(score))]
+        return [member for member, _ in selected]
+
+    # --- sets --------------------------------------------------------------
+
+    def cmd_sadd(self, key, *members):
+        set_ = self._get_typed(key, set, create=True)
+        added = len(set(members) - set_)
+        set_.update(members)
+        return added
+
+    def cmd_srem(self, key, *members):
+        set_ = self._get_typed(key, set)
+        if set_ is None:
+            return 0
+        removed = len(set_ & set(members))
+        set_.difference_update(members)
+        self._drop_if_empty(key)
+        return removed
+
+    def cmd_smembers(self, key):
+        return sorted(self._get_typed(key, set) or ())
+
+    def cmd_sismember(self, key, member):
+        set_ = self._get_typed(key, set)
+        return 1 if set_ is not None and member in set_ else 0
+
+    # --- scripts -----------------------------------------------------------
+
+    def cmd_script(self, subcommand, *args):
+        subcommand = subcommand.upper()
+        if subcommand == "LOAD":
+            return self._register_script(args[0])
+        if subcommand == "EXISTS":
+            return [1 if sha in self.scripts else 0 for sha in args]
+        if subcommand == "FLUSH":
+            self.scripts.clear()
+            return "OK"
+        raise RedisError(f"ERR unknown SCRIPT subcommand '{subcommand}'")
+
+    def _register_script(self, source):
+        sha = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        self.scripts[sha] = self._classify_script(source)
+        return sha
+
+    @staticmethod
+    def _classify_script(source):
+        if "requestsInPreviousWindow" in source and "INCRBY" in source:
+            return "sliding_window"
+        return None
+
+    def cmd_eval(self, source, numkeys, *rest):
+        sha = self._register_script(source)
+        return self.cmd_evalsha(sha, numkeys, *rest)
+
+    def cmd_evalsha(self, sha, numkeys, *rest):
+        if sha not in self.scripts:
+            # Клиент @upstash/redis в ответ на NOSCRIPT повторяет запрос через EVAL
+            raise RedisError("NOSCRIPT No matching script. Please use EVAL.")
+        kind = self.scripts[sha]
+        if kind is None:
+            raise RedisError("ERR script is not supported by the Upstash stand-in")
+        numkeys = int(numkeys)
+        keys, argv = list(rest[:numkeys]), list(rest[numkeys:])
+        return getattr(self, f"script_{kind}")(keys, argv)
+
+    def script_sliding_window(self, keys, argv):
+        """Native port of the @upstash/ratelimit v2 single-region sliding window script."""
+        current_key, previous_key = keys[0], keys[1]
+        tokens = int(float(argv[0]))
+        now = int(float(argv[1]))
+        window = int(float(argv[2]))
+        increment_by = int(float(argv[3])) if len(argv) > 3 else 1
+
+        requests_in_current = self._get_int(current_key)
+        requests_in_previous = self._get_int(previous_key)
+        percentage_in_current = (now % window) / window
+        requests_in_previous = int((1 - percentage_in_current) * requests_in_previous)
+
+        if increment_by > 0 and requests_in_previous + requests_in_current >= tokens:
+            return -1
+
+        new_value = self._incrby(current_key, increment_by)
+        if new_value == increment_by:
+            self._set_expire_ms(current_key, window * 2 + 1000)
+        return tokens - (new_value + requests_in_previous)
+
+
+def encode_result(value):
+    """Encode strings the way Upstash does for ``Upstash-Encoding: base64``."""
+    if isinstance(value, str):
+        return base64.b64encode(value.encode("utf-8")).decode("ascii")
+    if isinstance(value, list):
+        return [encode_result(item) for item in value]
+    return value
+
+
+class UpstashMockHandler(BaseHTTPRequestHandler):
+    server_version = "UpstashMock/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _authorized(self):
+        token = self.server.token
+        if not token:
+            return True
+        if self.headers.get("Authorization", "") == f"Bearer {token}":
+            return True
+        self._send_json(401, {"error": "Unauthorized"})
+        return False
+
+    def _run(self, command):
+        try:
+            result = self.server.store.execute(command)
+        except (RedisError, ValueError, IndexError, TypeError) as error:
+            return {"error": str(error)}
+        if self.headers.get("Upstash-Encoding", "").lower() == "base64":
+            result = encode_result(result)
+        return {"result": result}
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"ok": True})
+            return
+        if not self._authorized():
+            return
+        command = [unquote(part) for part in self.path.split("?")[0].strip("/").split("/") if part]
+        response = self._run(command)
+        self._send_json(400 if "error" in response else 200, response)
+
+    def do_POST(self):
+        if not self._authorized():
+            return
+        length = int(self.headers.get("Content-Length", "0"))
+        try:
+            body = json.loads(self.rfile.read(length) or b"null")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": "ERR failed to parse command"})
+            return
+
+        path = self.path.split("?")[0].rstrip("/")
+        if path in ("/pipeline", "/multi-exec"):
+            if not isinstance(body, list):
+                self._send_json(400, {"error": "ERR pipeline body must be an array of commands"})
+                return
+            store = self.server.store
+            if path == "/multi-exec":
+                with store.lock:
+                    results = [self._run(command) for command in body]
+            else:
+                results = [self._run(command) for command in body]
+            self._send_json(200, results)
+            return
+
+        # Команда может прийти целиком в теле или частично в пути (POST /set/key + тело-значение)
+        prefix = [unquote(part) for part in path.strip("/").split("/") if part]
+        command = prefix + body if isinstance(body, list) else prefix + ([body] if body is not None else [])
+        response = self._run(command)
+        self._send_json(400 if "error" in response else 200, response)
+
+
+def create_server(host="127.0.0.1", port=8079, token=None, verbose=False):
+    server = ThreadingHTTPServer((host, port), UpstashMockHandler)
+    server.daemon_threads = True
+    server.store = Store()
+    server.token = token if token is not None else os.environ.get("UPSTASH_REDIS_REST_TOKEN", "")
+    server.verbose = verbose
+    return server